@@ -0,0 +1,54 @@
+"""
+Measure the import time of the package and the cost of creating a driver.
+
+Endpoint groups are imported and instantiated on first access, so neither
+should grow with the number of endpoints. Importing is timed in fresh
+interpreters, driver creation and first endpoint access with timeit.
+
+Usage: python benchmarks/driver_startup.py [--number N]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import timeit
+
+IMPORT_CODE = "import time; t = time.perf_counter(); import mattermostautodriver; print(time.perf_counter() - t)"
+
+OPTIONS = {"url": "localhost", "token": "token"}
+
+
+def import_time(repeat):
+    timings = [
+        float(subprocess.run([sys.executable, "-c", IMPORT_CODE], capture_output=True, text=True, check=True).stdout)
+        for _ in range(repeat)
+    ]
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=200, help="iterations per measurement")
+    args = parser.parse_args()
+
+    from mattermostautodriver import TypedDriver
+
+    def create():
+        TypedDriver(OPTIONS).close()
+
+    def create_and_use():
+        driver = TypedDriver(OPTIONS)
+        driver.users
+        driver.posts
+        driver.channels
+        driver.close()
+
+    print(f"import mattermostautodriver      {import_time(10) * 1e3:10.1f} ms")
+    for label, fn in [("TypedDriver()", create), ("TypedDriver() + 3 endpoints", create_and_use)]:
+        best = min(timeit.repeat(fn, number=args.number, repeat=5))
+        print(f"{label:<32}{best / args.number * 1e3:10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Compare the JSON codecs available for the ``json_codec`` option.
+
+Encodes and decodes payloads shaped like typical Mattermost traffic: a page of
+200 users, a PostList of 200 posts and a websocket ``posted`` event.
+
+Usage: python benchmarks/json_codecs.py [--number N]
+"""
+
+import argparse
+import timeit
+
+from mattermostautodriver.codec import CODECS
+
+
+def make_user(i):
+    return {
+        "id": f"{i:026d}",
+        "create_at": 1700000000000 + i,
+        "update_at": 1700000000000 + i,
+        "delete_at": 0,
+        "username": f"user{i}",
+        "auth_data": "",
+        "auth_service": "",
+        "email": f"user{i}@example.com",
+        "nickname": "",
+        "first_name": "Firstname",
+        "last_name": "Lästname",
+        "position": "",
+        "roles": "system_user",
+        "notify_props": {"channel": "true", "desktop": "mention", "email": "true", "push": "mention"},
+        "last_password_update": 1700000000000,
+        "locale": "en",
+        "timezone": {"automaticTimezone": "Europe/Berlin", "manualTimezone": "", "useAutomaticTimezone": "true"},
+        "disable_welcome_email": False,
+    }
+
+
+def make_post(i):
+    return {
+        "id": f"p{i:025d}",
+        "create_at": 1700000000000 + i,
+        "update_at": 1700000000000 + i,
+        "edit_at": 0,
+        "delete_at": 0,
+        "is_pinned": False,
+        "user_id": f"{i % 20:026d}",
+        "channel_id": "c" * 26,
+        "root_id": "",
+        "original_id": "",
+        "message": f"Message number {i} with some text, a :smile: and a https://example.com/link",
+        "type": "",
+        "props": {},
+        "hashtags": "",
+        "pending_post_id": "",
+        "reply_count": 0,
+        "metadata": {"reactions": [{"user_id": "u" * 26, "emoji_name": "+1", "create_at": 1700000000000}]},
+    }
+
+
+def make_payloads():
+    posts = [make_post(i) for i in range(200)]
+    post_list = {
+        "order": [post["id"] for post in posts],
+        "posts": {post["id"]: post for post in posts},
+        "next_post_id": "",
+        "prev_post_id": "",
+        "has_next": False,
+    }
+    return {
+        "users page": [make_user(i) for i in range(200)],
+        "PostList": post_list,
+        # The post is itself JSON encoded inside the event, as sent by the server
+        "websocket posted": {
+            "event": "posted",
+            "data": {
+                "channel_display_name": "Town Square",
+                "channel_name": "town-square",
+                "channel_type": "O",
+                "post": CODECS["json"].dumps(make_post(0)).decode("utf-8"),
+                "sender_name": "@user0",
+                "set_online": True,
+                "team_id": "t" * 26,
+            },
+            "broadcast": {"omit_users": None, "user_id": "", "channel_id": "c" * 26, "team_id": ""},
+            "seq": 42,
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=200, help="iterations per measurement")
+    args = parser.parse_args()
+
+    codecs = {}
+    for name, cls in CODECS.items():
+        try:
+            codecs[name] = cls()
+        except ImportError:
+            print(f"{name}: not installed, skipped")
+
+    print(f"{'payload':<18}{'codec':<8}{'dumps (µs)':>12}{'loads (µs)':>12}")
+    for label, payload in make_payloads().items():
+        encoded = codecs["json"].dumps(payload)
+        for name, codec in codecs.items():
+            dumps = min(timeit.repeat(lambda: codec.dumps(payload), number=args.number, repeat=5))
+            loads = min(timeit.repeat(lambda: codec.loads(encoded), number=args.number, repeat=5))
+            print(f"{label:<18}{name:<8}{dumps / args.number * 1e6:>12.1f}{loads / args.number * 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
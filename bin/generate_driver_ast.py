@@ -4,6 +4,8 @@ import os
 from subprocess import run
 from typing import Callable
 
+LAZY_ENDPOINTS_ATTRIBUTE = "_lazy_endpoints"
+
 
 class ASTEndpointParser:
     def __init__(
@@ -103,21 +105,45 @@ class ASTEndpointParser:
             level=0,
         )
 
-    def create_assignment_node(self, module_name: str, class_name: str) -> ast.Assign:
-        attr_name = module_name.lower()
+    def create_annotation_node(self, module_name: str, class_name: str) -> ast.AnnAssign:
+        """Class level annotation exposing the lazily created endpoint attribute to IDEs and type checkers."""
+        return ast.AnnAssign(
+            target=ast.Name(id=module_name.lower(), ctx=ast.Store()),
+            annotation=ast.Name(
+                id=self.modify_module_class_name(class_name) if self.modify_module_class_name else class_name,
+                ctx=ast.Load(),
+            ),
+            simple=1,
+        )
 
+    def create_registry_node(self, discovered_endpoints: list[tuple[str, str]]) -> ast.Assign:
+        """Mapping of endpoint attribute to the (module, class) imported on first access."""
         return ast.Assign(
-            targets=[ast.Attribute(value=ast.Name(id="self", ctx=ast.Load()), attr=attr_name, ctx=ast.Store())],
-            value=ast.Call(
-                func=ast.Name(
-                    id=self.modify_module_class_name(class_name) if self.modify_module_class_name else class_name,
-                    ctx=ast.Load(),
-                ),
-                args=[ast.Attribute(value=ast.Name(id="self", ctx=ast.Load()), attr="client", ctx=ast.Load())],
-                keywords=[],
+            targets=[ast.Name(id=LAZY_ENDPOINTS_ATTRIBUTE, ctx=ast.Store())],
+            value=ast.Dict(
+                keys=[ast.Constant(module_name.lower()) for module_name, _ in discovered_endpoints],
+                values=[
+                    ast.Tuple(elts=[ast.Constant(module_name), ast.Constant(class_name)], ctx=ast.Load())
+                    for module_name, class_name in discovered_endpoints
+                ],
             ),
         )
 
+    def find_type_checking_block(self, tree: ast.Module) -> ast.If:
+        """Find the ``if TYPE_CHECKING:`` block holding the endpoint imports, creating it if missing."""
+        insert_index = 0
+        for i, node in enumerate(tree.body):
+            if isinstance(node, ast.If) and isinstance(node.test, ast.Name) and node.test.id == "TYPE_CHECKING":
+                return node
+            if isinstance(node, (ast.Import, ast.ImportFrom)):
+                insert_index = i + 1
+            elif isinstance(node, ast.ClassDef):
+                break
+
+        block = ast.If(test=ast.Name(id="TYPE_CHECKING", ctx=ast.Load()), body=[], orelse=[])
+        tree.body.insert(insert_index, block)
+        return block
+
     def find_base_driver_with_endpoints_class(self, tree: ast.Module) -> ast.ClassDef:
         """Find the base driver class in the AST."""
         for node in ast.walk(tree):
@@ -133,7 +159,7 @@ class ASTEndpointParser:
         raise ValueError(f"__init__ method not found in {self.base_driver_class_name} class")
 
     def remove_existing_endpoint_assignments(self, init_method: ast.FunctionDef) -> ast.FunctionDef:
-        """Remove existing endpoint assignments from the __init__ method."""
+        """Remove eager endpoint assignments from the __init__ method, as emitted by earlier versions."""
         # Filter out endpoint assignments
         init_method.body = [
             node
@@ -154,23 +180,31 @@ class ASTEndpointParser:
         ]
         return init_method
 
-    def find_super_call_index(self, init_method: ast.FunctionDef) -> int:
-        """Find the index where super().__init__() is called."""
-        for i, node in enumerate(init_method.body):
-            if isinstance(node, ast.Expr) and isinstance(node.value, ast.Call):
-                call = node.value
-                # Check for super() call patterns
-                if isinstance(call.func, ast.Attribute) and call.func.attr in ["__init__", "init"]:
-                    if isinstance(call.func.value, ast.Call):
-                        func_call = call.func.value
-                        if isinstance(func_call.func, ast.Name) and func_call.func.id == "super":
-                            return i + 1
-
-        return 1  # Default to after first statement
+    def remove_existing_endpoint_declarations(self, class_node: ast.ClassDef) -> ast.ClassDef:
+        """Remove the endpoint annotations and the lazy endpoint registry from the class body."""
+        class_node.body = [
+            node
+            for node in class_node.body
+            if not (
+                (isinstance(node, ast.AnnAssign) and node.value is None)
+                or (
+                    isinstance(node, ast.Assign)
+                    and any(
+                        isinstance(target, ast.Name) and target.id == LAZY_ENDPOINTS_ATTRIBUTE
+                        for target in node.targets
+                    )
+                )
+            )
+        ]
+        return class_node
 
     def update_ast(self, tree: ast.Module, discovered_endpoints: list[tuple[str, str]]) -> ast.Module:
         """
-        Update the AST by removing all existing endpoint imports/assignments and adding new ones.
+        Update the AST by removing all existing endpoint imports/declarations and adding new ones.
+
+        Endpoint modules are only imported for type checking. The driver class
+        gets an annotation per endpoint attribute and a registry its
+        ``__getattr__`` uses to import and instantiate endpoints on first access.
 
         Args:
             tree: The original AST
@@ -179,44 +213,33 @@ class ASTEndpointParser:
         Returns:
             Updated AST
         """
-        # Remove all existing endpoint imports
+        # Remove eager endpoint imports emitted by earlier versions
         tree = self.remove_existing_endpoint_imports(tree)
 
-        # Create all new imports
-        new_imports = [
+        type_checking_block = self.find_type_checking_block(tree)
+        type_checking_block.body = [
             self.create_import_node(module_name, class_name) for module_name, class_name in discovered_endpoints
         ]
 
-        # Find where to insert imports (after existing imports but before class definitions)
-        insert_index = 0
-        for i, node in enumerate(tree.body):
-            if isinstance(node, (ast.Import, ast.ImportFrom)):
-                insert_index = i + 1
-            elif isinstance(node, ast.ClassDef):
-                break
-
-        # Insert all new imports
-        for import_node in reversed(new_imports):  # Reverse to maintain order
-            tree.body.insert(insert_index, import_node)
-
         # Update the base driver class
         class_node = self.find_base_driver_with_endpoints_class(tree)
-        init_method = self.find_init_method(class_node)
-
-        # Remove all existing endpoint assignments
-        init_method = self.remove_existing_endpoint_assignments(init_method)
+        self.remove_existing_endpoint_assignments(self.find_init_method(class_node))
+        self.remove_existing_endpoint_declarations(class_node)
 
-        # Find where to insert new assignments (after super().__init__ call)
-        insert_index = self.find_super_call_index(init_method)
-
-        # Create all new assignment nodes
-        new_assignments = [
-            self.create_assignment_node(module_name, class_name) for module_name, class_name in discovered_endpoints
+        # Insert annotations and registry at the top of the class, after its docstring if any
+        insert_index = 0
+        if (
+            class_node.body
+            and isinstance(class_node.body[0], ast.Expr)
+            and isinstance(class_node.body[0].value, ast.Constant)
+        ):
+            insert_index = 1
+
+        declarations = [
+            self.create_annotation_node(module_name, class_name) for module_name, class_name in discovered_endpoints
         ]
-
-        # Insert all new assignments
-        for assignment in reversed(new_assignments):  # Reverse to maintain order
-            init_method.body.insert(insert_index, assignment)
+        declarations.append(self.create_registry_node(discovered_endpoints))
+        class_node.body[insert_index:insert_index] = declarations
 
         return tree
 
@@ -58,7 +58,7 @@ Parameter = namedtuple(
 
 
 ast_template = """
-from ._base import Base, FileType
+from ._base import {base_imports}
 from typing import Any
 
 __all__ = ["{classname}"]
@@ -70,6 +70,101 @@ known_double_arguments = (
     ("convert_group_message_to_channel", "channel_id"),
 )
 
+# Endpoints returning potentially large files. For each of these a companion
+# method is generated that streams the response body to a path or file object
+# through client.download() instead of buffering it in memory.
+streamed_downloads = {
+    "get_file": "download_file_to",
+    "download_export": "download_export_to",
+    "download_job": "download_job_to",
+    "download_compliance_report": "download_compliance_report_to",
+    "download_system_logs": "download_system_logs_to",
+}
+
+# GET endpoints taking both of these query parameters get an iter_* companion
+# walking all pages through client.paginate()
+pagination_parameters = ("page", "per_page")
+
+# Query parameters for which the server ignores ``page`` and returns the same
+# items for every page, left out of the iter_* companion of the operation.
+# E.g. the posts of a channel since a time are all returned at once (GetPostsSince).
+unpaged_parameters = {
+    "GetPostsForChannel": ("since",),
+}
+
+# Operations taking the pagination parameters whose response is no list of
+# items, e.g. groups by channel id, left without an iter_* companion.
+unpaginated_operations = {
+    "GetGroupsAssociatedToChannelsByTeam",
+}
+
+paginate_parameters = [
+    Parameter(
+        "per_page",
+        "Number of items per page, defaults to MAX_PER_PAGE",
+        False,
+        "integer",
+        None,
+        None,
+        {"type": "integer"},
+    ),
+    Parameter(
+        "prefetch",
+        "Fetch the next page while the current one is consumed",
+        False,
+        "boolean",
+        False,
+        None,
+        {"type": "boolean"},
+    ),
+]
+
+# Endpoints paginated with an opaque cursor returned in next_cursor. For each
+# of these an iter_* companion is generated following the cursor through
+# client.paginate_cursor(), yielding the elements of the "items" response field.
+cursor_paginated = {
+    "get_posts_for_reporting": {
+        "function": "iter_posts_for_reporting",
+        "items": "posts",
+        "defaults": {"per_page": 1000},
+    },
+}
+
+paginate_cursor_parameters = [
+    Parameter(
+        "prefetch",
+        "Fetch the next page while the current one is consumed",
+        False,
+        "boolean",
+        True,
+        None,
+        {"type": "boolean"},
+    ),
+    Parameter(
+        "checkpoint",
+        "Called with the cursor of the next page once all items of a page were consumed. "
+        "Pass it as cursor to resume an interrupted iteration",
+        False,
+        None,
+        None,
+        None,
+        {},
+    ),
+]
+
+download_parameters = [
+    Parameter("destination", "A path or a binary file object opened for writing", True, None, None, None, {}),
+    Parameter(
+        "chunk_size",
+        "Size in bytes of the chunks written to destination",
+        False,
+        "integer",
+        None,
+        None,
+        {"type": "integer"},
+    ),
+]
+
 
 def load_json(filepath="mattermost/api/openapi.json"):
     with open(filepath) as fh:
@@ -161,7 +256,6 @@ def get_request_body_type(body):
     if len(content_types) == 0:
         raise ValueError(f"Request body has no content types after filtering: {body}")
 
-
     return content_types[0]
 
 
@@ -275,7 +369,9 @@ def json_to_ast(api):
                 "put": "options",
             }
 
-            def_params = prepare_def_keywords(url_parameters, payload_params, operations[request_type], req_body_type, function_name=function_name)
+            def_params = prepare_def_keywords(
+                url_parameters, payload_params, operations[request_type], req_body_type, function_name=function_name
+            )
             call_kwargs = prepare_call_keywords(payload_params, operations[request_type], req_body_type)
             data_dicts = prepare_data_dictionaries(payload_params, operations[request_type], req_body_type)
 
@@ -304,9 +400,176 @@ def json_to_ast(api):
                     }
                 )
 
+                if is_paginated(request_type, payload_params, operation_id):
+                    blocks[loc].append(
+                        prepare_paginate_method(
+                            blocks[loc][-1], rdata["summary"], url_parameters, payload_params, operation_id
+                        )
+                    )
+
+                if function_name in cursor_paginated:
+                    blocks[loc].append(
+                        prepare_paginate_cursor_method(
+                            blocks[loc][-1],
+                            rdata["summary"],
+                            url_parameters,
+                            payload_params,
+                            operation_id,
+                            operations[request_type],
+                            req_body_type,
+                        )
+                    )
+
+                if function_name in streamed_downloads:
+                    blocks[loc].append(
+                        prepare_download_method(
+                            blocks[loc][-1], rdata["summary"], url_parameters, payload_params, operation_id
+                        )
+                    )
+
     return blocks
 
 
+def is_paginated(request_type, payload_params, operation_id):
+    if operation_id in unpaginated_operations:
+        return False
+    names = {param.name for param in payload_params.get("parameters", [])}
+    return request_type == "get" and all(name in names for name in pagination_parameters)
+
+
+def paginate_function_name(function_name):
+    # get_users -> iter_users, list_playbook_runs -> iter_playbook_runs
+    for prefix in ("get_", "list_"):
+        if function_name.startswith(prefix):
+            return "iter_" + function_name[len(prefix) :]
+    return "iter_" + function_name
+
+
+def prepare_paginate_method(method, summary, url_parameters, payload_params, operation_id):
+    """Companion of a paginated GET method iterating over the items of all pages"""
+    excluded = pagination_parameters + unpaged_parameters.get(operation_id, ())
+    payload_params = {
+        **payload_params,
+        "parameters": [param for param in payload_params["parameters"] if param.name not in excluded],
+    }
+
+    def_params = prepare_def_keywords(url_parameters, payload_params, "params", None, function_name=method["function"])
+    def_params["args"] += [
+        ast.arg(arg=param.name, annotation=generate_type_annotation(param.schema, False, False))
+        for param in paginate_parameters
+    ]
+    def_params["defaults"] += [ast.Constant(param.default) for param in paginate_parameters]
+
+    call_kwargs = prepare_call_keywords(payload_params, "params", None)
+    call_kwargs += [
+        ast.keyword(arg=param.name, value=ast.Name(id=param.name, ctx=ast.Load())) for param in paginate_parameters
+    ]
+
+    docstring = (
+        f"{summary.rstrip('.')}, iterating over the items of all pages"
+        + get_descriptions(url_parameters.get("parameters", []) + payload_params["parameters"] + paginate_parameters)
+        + get_link_to_api_docs(method["module"], operation_id)
+    )
+
+    return {
+        **method,
+        "request_type": "paginate",
+        "function": paginate_function_name(method["function"]),
+        "docstring": docstring,
+        "def_params": def_params,
+        "call_kwargs": call_kwargs,
+        "data_dicts": prepare_data_dictionaries(payload_params, "params", None),
+    }
+
+
+def prepare_paginate_cursor_method(
+    method, summary, url_parameters, payload_params, operation_id, operation_arg, req_body_type
+):
+    """Companion of a cursor paginated method iterating over the items of all pages"""
+    pagination = cursor_paginated[method["function"]]
+    payload_params = {
+        **payload_params,
+        "parameters": [
+            param._replace(default=pagination["defaults"].get(param.name, param.default))
+            for param in payload_params["parameters"]
+        ],
+    }
+
+    def_params = prepare_def_keywords(
+        url_parameters, payload_params, operation_arg, req_body_type, function_name=method["function"]
+    )
+    def_params["args"] += [
+        ast.arg(arg="prefetch", annotation=generate_type_annotation({"type": "boolean"}, False, False)),
+        ast.arg(
+            arg="checkpoint",
+            annotation=ast.BinOp(
+                left=ast.Name(id="CursorCallback", ctx=ast.Load()), op=ast.BitOr(), right=ast.Constant(value=None)
+            ),
+        ),
+    ]
+    def_params["defaults"] += [ast.Constant(param.default) for param in paginate_cursor_parameters]
+
+    call_kwargs = prepare_call_keywords(payload_params, operation_arg, req_body_type)
+    call_kwargs += [
+        ast.keyword(arg="items", value=ast.Constant(pagination["items"])),
+        *(
+            ast.keyword(arg=param.name, value=ast.Name(id=param.name, ctx=ast.Load()))
+            for param in paginate_cursor_parameters
+        ),
+    ]
+
+    docstring = (
+        f"{summary.rstrip('.')}, iterating over the items of all pages"
+        + get_descriptions(
+            url_parameters.get("parameters", []) + payload_params["parameters"] + paginate_cursor_parameters
+        )
+        + get_link_to_api_docs(method["module"], operation_id)
+    )
+
+    return {
+        **method,
+        "request_type": "paginate_cursor",
+        "function": pagination["function"],
+        "docstring": docstring,
+        "def_params": def_params,
+        "call_kwargs": call_kwargs,
+        "data_dicts": prepare_data_dictionaries(payload_params, operation_arg, req_body_type),
+    }
+
+
+def prepare_download_method(method, summary, url_parameters, payload_params, operation_id):
+    """Companion of a file download method streaming the body to ``destination``"""
+    def_params = {
+        "args": [
+            *method["def_params"]["args"],
+            ast.arg(arg="destination", annotation=ast.Name(id="DownloadTarget", ctx=ast.Load())),
+            ast.arg(arg="chunk_size", annotation=generate_type_annotation({"type": "integer"}, False, False)),
+        ],
+        "defaults": [*method["def_params"]["defaults"], None, ast.Constant(None)],
+    }
+
+    docstring = (
+        f"{summary.rstrip('.')}, streamed to destination"
+        + get_descriptions(
+            url_parameters.get("parameters", []) + payload_params.get("parameters", []) + download_parameters
+        )
+        + get_link_to_api_docs(method["module"], operation_id)
+    )
+
+    return {
+        **method,
+        "request_type": "download",
+        "function": streamed_downloads[method["function"]],
+        "docstring": docstring,
+        "def_params": def_params,
+        "call_args": [ast.Name(id="destination", ctx=ast.Load())],
+        "call_kwargs": [
+            *method["call_kwargs"],
+            ast.keyword(arg="chunk_size", value=ast.Name(id="chunk_size", ctx=ast.Load())),
+        ],
+    }
+
+
 def generate_type_annotation(schema, required, binary):
     def get_annotation(schema):
         type_mapping = {
@@ -494,8 +757,8 @@ def prepare_data_dictionaries(payload_params, operation_arg, req_body_type):
     return dicts
 
 
-def ast_request(request_type, endpoint, call_params):
-    args = [ast.parse(('f"' if "{" in endpoint else '"') + endpoint + '"')]
+def ast_request(request_type, endpoint, call_params, call_args=()):
+    args = [ast.parse(('f"' if "{" in endpoint else '"') + endpoint + '"'), *call_args]
 
     return ast.Return(
         ast.Call(
@@ -522,7 +785,7 @@ def ast_function(method):
     body = [
         ast.Expr(value=ast.Constant(value=docstring)),
         *data_dicts,
-        ast_request(method["request_type"], method["endpoint"], call_kwargs),
+        ast_request(method["request_type"], method["endpoint"], call_kwargs, method.get("call_args", ())),
     ]
 
     return ast.FunctionDef(
@@ -540,7 +803,13 @@ def ast_function(method):
 
 def make_ast(methods, module):
     classname = camelize(module)
-    base = ast.parse(ast_template.format(classname=classname))
+    base_imports = {"Base", "FileType"}
+    request_types = {method["request_type"] for method in methods[module]}
+    if "download" in request_types:
+        base_imports.add("DownloadTarget")
+    if "paginate_cursor" in request_types:
+        base_imports.add("CursorCallback")
+    base = ast.parse(ast_template.format(classname=classname, base_imports=", ".join(sorted(base_imports))))
     funcs = [ast_function(method) for method in methods[module]]
     base.body.append(
         ast.ClassDef(
@@ -44,4 +44,8 @@ setup(
         'aiohttp>=3.9.5,<4.0.0',
         'httpx~=0.28.1',
     ],
+    extras_require={
+        'orjson': ['orjson>=3.9'],
+        'ujson': ['ujson>=5.8'],
+    },
 )
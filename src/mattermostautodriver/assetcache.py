@@ -0,0 +1,257 @@
+"""
+Persistent on-disk cache of binary assets: profile images, emoji, thumbnails
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+import httpx
+
+from .instrumentation import endpoint_template
+
+log = logging.getLogger("mattermostautodriver.api")
+
+ASSET_ENDPOINTS = (
+    "/api/v4/users/{id}/image",
+    "/api/v4/users/{id}/image/default",
+    "/api/v4/emoji/{id}/image",
+    "/api/v4/files/{id}/thumbnail",
+    "/api/v4/files/{id}/preview",
+    "/api/v4/teams/{id}/image",
+    "/api/v4/brand/image",
+)
+"""
+Endpoint templates (see :func:`~mattermostautodriver.instrumentation.endpoint_template`)
+whose responses are cached by default, e.g. ``Users.get_profile_image``.
+"""
+
+AssetEntry = namedtuple("AssetEntry", ["digest", "etag", "last_modified", "content_type", "validated"])
+
+
+def default_directory():
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "mattermostautodriver", "assets")
+
+
+class AssetCache:
+    """Cache of binary GET responses on disk, kept across restarts.
+
+    Bodies are stored once per content (named by their SHA-256), so e.g. the
+    default avatar of many users takes the space of one image. Each request
+    refers to its body with the ``ETag`` and ``Last-Modified`` of its
+    response, sent as ``If-None-Match`` and ``If-Modified-Since`` to revalidate
+    it: a ``304 Not Modified`` reply is answered from disk without transferring
+    the body again. Within their time to live, entries are returned without
+    contacting the server at all.
+
+    Requests are identified by the server, endpoint, parameters and user, so
+    that a new session of the same user, e.g. after a restart, finds them.
+    When the cache grows over ``max_size`` bytes, the least recently used
+    bodies are removed, and over ``max_entries`` requests, the least recently
+    used entries. Both are tracked per process: processes sharing a directory
+    each keep it within bounds for the files they know of, read from disk on
+    first use.
+
+    :param directory: Directory of the cache, created if needed. Defaults to
+        ``mattermostautodriver/assets`` in ``$XDG_CACHE_HOME`` or ``~/.cache``.
+    :param max_size: Maximum size of the cached bodies in bytes
+    :param max_entries: Maximum number of cached requests
+    :param ttl: Seconds during which a response is used without revalidation.
+        The default of 0 revalidates every request.
+    :param endpoints: Endpoint templates whose responses are cached
+    """
+
+    def __init__(
+        self, directory=None, max_size=512 * 1024 * 1024, max_entries=100000, ttl=0, endpoints=ASSET_ENDPOINTS
+    ):
+        self.directory = os.fspath(directory) if directory is not None else default_directory()
+        self.max_size = max_size
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.endpoints = frozenset(endpoints)
+        self._lock = threading.Lock()
+        # Body digest to size, least recently used first, read from disk on first use
+        self._bodies = None
+        self._size = 0
+        # Entry paths, least recently used first, read from disk on first use
+        self._entries = None
+
+    def caches(self, endpoint):
+        return endpoint_template(endpoint) in self.endpoints
+
+    def _body_path(self, digest):
+        return os.path.join(self.directory, "bodies", digest[:2], digest)
+
+    def _entry_path(self, key):
+        name = hashlib.sha256(json.dumps(key, default=str).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, "entries", name[:2], name + ".json")
+
+    def _scan(self, subdirectory):
+        """List the files of ``subdirectory`` by their last use, which is their modification time.
+
+        :return: (modification time, path, size) tuples, least recently used first
+        """
+        found = []
+        for root, _, files in os.walk(os.path.join(self.directory, subdirectory)):
+            for name in files:
+                if name.startswith(".tmp-"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                found.append((stat.st_mtime, path, stat.st_size))
+        found.sort()
+        return found
+
+    def _load_bodies(self):
+        self._bodies = OrderedDict((os.path.basename(path), size) for _, path, size in self._scan("bodies"))
+        self._size = sum(self._bodies.values())
+
+    def _use_entry(self, path):
+        """Record a use of an entry, evicting the least recently used ones if there are too many."""
+        with self._lock:
+            if self._entries is None:
+                self._entries = OrderedDict((found, None) for _, found, _ in self._scan("entries"))
+            self._entries[path] = None
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                try:
+                    os.unlink(evicted)
+                except FileNotFoundError:
+                    pass
+
+    def _use(self, digest, size):
+        """Record a use of a body, evicting the least recently used ones if the cache is too large."""
+        with self._lock:
+            if self._bodies is None:
+                self._load_bodies()
+            if digest not in self._bodies:
+                self._size += size
+            self._bodies[digest] = size
+            self._bodies.move_to_end(digest)
+            while self._size > self.max_size and len(self._bodies) > 1:
+                evicted, evicted_size = self._bodies.popitem(last=False)
+                self._size -= evicted_size
+                try:
+                    os.unlink(self._body_path(evicted))
+                except FileNotFoundError:
+                    pass
+                log.debug("Evicted %s from the asset cache", evicted)
+
+    @staticmethod
+    def _write(path, data):
+        """Write ``data`` to ``path`` atomically, so other processes never read a partial file."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def get(self, key):
+        """
+        :return: The ``AssetEntry`` stored under ``key``, or None
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, "rb") as fh:
+                entry = AssetEntry(**json.load(fh))
+            os.utime(path)
+        except (FileNotFoundError, ValueError, TypeError):
+            return None
+        self._use_entry(path)
+        return entry
+
+    def is_fresh(self, entry):
+        return time.time() - entry.validated < self.ttl
+
+    @staticmethod
+    def conditional_headers(entry):
+        if entry is None:
+            return None
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers or None
+
+    def load(self, entry, url):
+        """Read the body of ``entry`` into a response to a ``GET`` of ``url``.
+
+        :return: The ``httpx.Response``, or None if the body was evicted
+        """
+        path = self._body_path(entry.digest)
+        try:
+            with open(path, "rb") as fh:
+                content = fh.read()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        size = len(content)
+        self._use(entry.digest, size)
+
+        headers = {"Content-Type": entry.content_type, "Content-Length": str(size)}
+        if entry.etag:
+            headers["ETag"] = entry.etag
+        if entry.last_modified:
+            headers["Last-Modified"] = entry.last_modified
+        return httpx.Response(200, headers=headers, content=content, request=httpx.Request("GET", url))
+
+    def put(self, key, response):
+        """Store a ``200 OK`` response to the request identified by ``key``.
+
+        Responses that can neither be revalidated nor used without revalidation are not stored.
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status_code != 200 or not (etag or last_modified or self.ttl):
+            return
+        content = response.content
+        digest = hashlib.sha256(content).hexdigest()
+        path = self._body_path(digest)
+        if not os.path.exists(path):
+            self._write(path, content)
+        self._use(digest, len(content))
+        self._store(
+            key,
+            AssetEntry(
+                digest,
+                etag,
+                last_modified,
+                response.headers.get("Content-Type", "application/octet-stream"),
+                time.time(),
+            ),
+        )
+
+    def _store(self, key, entry):
+        path = self._entry_path(key)
+        self._write(path, json.dumps(entry._asdict()).encode("utf-8"))
+        self._use_entry(path)
+
+    def refresh(self, key, entry):
+        """Restart the time to live of ``entry`` after the server confirmed it is current."""
+        if self.ttl:
+            self._store(key, entry._replace(validated=time.time()))
+
+    @property
+    def size(self):
+        """
+        :return: The size of the cached bodies in bytes
+        """
+        with self._lock:
+            if self._bodies is None:
+                self._load_bodies()
+            return self._size
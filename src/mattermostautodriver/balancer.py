@@ -0,0 +1,166 @@
+"""
+Load balancing of requests across the app nodes of a Mattermost cluster
+"""
+
+import logging
+import random
+import threading
+import time
+
+log = logging.getLogger("mattermostautodriver.api")
+
+ROUND_ROBIN = "round_robin"
+LEAST_OUTSTANDING = "least_outstanding"
+LATENCY = "latency"
+STRATEGIES = (ROUND_ROBIN, LEAST_OUTSTANDING, LATENCY)
+
+PING_ENDPOINT = "/api/v4/system/ping"
+"""Endpoint of ``System.get_ping``, requested to check the health of a node."""
+
+
+class Node:
+    """An app node requests are balanced across.
+
+    - ``url`` - base URL of the node, e.g. ``https://app1.example.com:8065``
+    - ``outstanding`` - requests sent to the node and waiting for a response
+    - ``latency`` - moving average of the response times in seconds, None until a response was received
+    - ``failures`` - consecutive transport errors and 500, 502, 503 and 504 responses
+    - ``ejected_until`` - monotonic time until which the node receives no requests, None if it is in rotation
+    """
+
+    __slots__ = ("url", "outstanding", "latency", "failures", "ejected_until", "checking")
+
+    def __init__(self, url):
+        self.url = url.rstrip("/")
+        self.outstanding = 0
+        self.latency = None
+        self.failures = 0
+        self.ejected_until = None
+        self.checking = False
+
+    @property
+    def ejected(self):
+        return self.ejected_until is not None
+
+    def __repr__(self):
+        return f"Node({self.url!r})"
+
+
+class LoadBalancer:
+    """Spread the requests of a client across several app nodes.
+
+    Each attempt of a request, including retries, is sent to the node chosen
+    by ``strategy``:
+
+    - ``"round_robin"`` - the nodes in turn
+    - ``"least_outstanding"`` - the node with the fewest requests waiting for a response
+    - ``"latency"`` - a random node, weighted by the inverse of its average response time
+
+    After ``failure_threshold`` consecutive transport errors or 500, 502, 503
+    and 504 responses, a node is ejected from the rotation for ``ejection_time``
+    seconds, while a 501 for a disabled feature does not count. It is then pinged with ``System.get_ping`` before the next request and put back
+    into rotation if it answers, or ejected again otherwise. If every node is
+    ejected, requests are spread across all of them rather than failed.
+
+    A balancer is thread safe and can be shared by several clients.
+
+    :param urls: Base URLs of the nodes, e.g. ``["https://app1.example.com:8065", ...]``
+    :param strategy: One of :data:`STRATEGIES`
+    :param failure_threshold: Consecutive failures ejecting a node
+    :param ejection_time: Seconds before an ejected node is checked again
+    :param latency_decay: Weight of a new response time in the moving average of a node
+    """
+
+    def __init__(self, urls, strategy=ROUND_ROBIN, failure_threshold=3, ejection_time=30.0, latency_decay=0.3):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown load balancing strategy {strategy!r}, expected one of {', '.join(STRATEGIES)}")
+        self.nodes = [Node(url) for url in urls]
+        if not self.nodes:
+            raise ValueError("A load balancer needs at least one node")
+        self.strategy = strategy
+        self.failure_threshold = failure_threshold
+        self.ejection_time = ejection_time
+        self.latency_decay = latency_decay
+        self._lock = threading.Lock()
+        self._turn = 0
+
+    def acquire(self):
+        """Choose the node of the next attempt and count it as outstanding.
+
+        Every :meth:`acquire` must be followed by a :meth:`release` of the node.
+        """
+        with self._lock:
+            nodes = [node for node in self.nodes if not node.ejected] or self.nodes
+            turn = self._turn
+            self._turn += 1
+            if self.strategy == LEAST_OUTSTANDING:
+                # Rotate first so ties do not always go to the first node
+                offset = turn % len(nodes)
+                node = min(nodes[offset:] + nodes[:offset], key=lambda node: node.outstanding)
+            elif self.strategy == LATENCY:
+                node = random.choices(nodes, weights=self._latency_weights(nodes))[0]
+            else:
+                node = nodes[turn % len(nodes)]
+            node.outstanding += 1
+            return node
+
+    @staticmethod
+    def _latency_weights(nodes):
+        latencies = [node.latency for node in nodes if node.latency is not None]
+        # Nodes without responses yet get the best weight so they are measured soon
+        fastest = min(latencies, default=1.0)
+        return [1 / max(node.latency if node.latency is not None else fastest, 1e-3) for node in nodes]
+
+    def release(self, node, duration=None, failed=False):
+        """Record the outcome of an attempt sent to ``node``.
+
+        :param duration: Seconds until the response was received, None if there was none
+        :param failed: Whether the attempt failed with a transport error or a 500, 502, 503 or 504 response
+        """
+        with self._lock:
+            node.outstanding -= 1
+            if failed:
+                node.failures += 1
+                if node.failures >= self.failure_threshold and not node.ejected:
+                    node.ejected_until = time.monotonic() + self.ejection_time
+                    log.warning(
+                        "Ejecting %s for %.0f seconds after %d consecutive failures",
+                        node.url,
+                        self.ejection_time,
+                        node.failures,
+                    )
+                return
+            node.failures = 0
+            if duration is not None:
+                if node.latency is None:
+                    node.latency = duration
+                else:
+                    node.latency += self.latency_decay * (duration - node.latency)
+
+    def due_for_check(self):
+        """
+        :return: The ejected nodes whose ejection time is over, to be pinged and
+            passed to :meth:`record_check`. A node is only returned once per check.
+        """
+        now = time.monotonic()
+        with self._lock:
+            due = [node for node in self.nodes if node.ejected and not node.checking and node.ejected_until <= now]
+            for node in due:
+                node.checking = True
+            return due
+
+    def record_check(self, node, healthy):
+        """Put ``node`` back into rotation if ``healthy``, otherwise eject it again."""
+        with self._lock:
+            node.checking = False
+            if healthy:
+                if node.ejected:
+                    log.info("%s is healthy again", node.url)
+                node.ejected_until = None
+                node.failures = 0
+            else:
+                if not node.ejected:
+                    log.warning(
+                        "Ejecting %s for %.0f seconds after a failed health check", node.url, self.ejection_time
+                    )
+                node.ejected_until = time.monotonic() + self.ejection_time
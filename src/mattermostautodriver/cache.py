@@ -0,0 +1,74 @@
+"""
+Conditional request cache for GET responses carrying an ETag
+"""
+
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+CacheEntry = namedtuple("CacheEntry", ["etag", "value", "expires"])
+
+
+class ResponseCache:
+    """LRU cache of parsed JSON responses and their ``ETag``.
+
+    Cached responses are revalidated by sending their ETag in an
+    ``If-None-Match`` header: a ``304 Not Modified`` reply returns the cached
+    object without transferring or parsing the body again. Within their time
+    to live, entries are returned without contacting the server at all.
+
+    Cached objects are shared between callers and must not be modified.
+
+    :param max_entries: Maximum number of responses kept, least recently used
+        ones are evicted first.
+    :param ttl: Seconds during which a response is used without revalidation.
+        The default of 0 revalidates every request.
+    :param ttl_policies: Mapping of endpoint prefixes (e.g. ``"/api/v4/config"``)
+        to the ``ttl`` of matching endpoints. The longest matching prefix wins.
+    """
+
+    def __init__(self, max_entries=1024, ttl=0, ttl_policies=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # Longest prefixes first so the most specific policy wins
+        self._ttl_policies = sorted((ttl_policies or {}).items(), key=lambda policy: len(policy[0]), reverse=True)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def ttl_for(self, endpoint):
+        for prefix, ttl in self._ttl_policies:
+            if endpoint.startswith(prefix):
+                return ttl
+        return self.ttl
+
+    def get(self, key):
+        """
+        :return: The ``CacheEntry`` stored under ``key``, or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    @staticmethod
+    def is_fresh(entry):
+        return entry.expires > time.monotonic()
+
+    def put(self, key, endpoint, etag, value):
+        with self._lock:
+            self._entries[key] = CacheEntry(etag, value, time.monotonic() + self.ttl_for(endpoint))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def refresh(self, key, endpoint, entry):
+        """Restart the time to live of ``entry`` after the server confirmed it is current."""
+        self.put(key, endpoint, entry.etag, entry.value)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,148 @@
+"""
+Circuit breaker failing requests fast while a part of the API is down
+"""
+
+import logging
+import threading
+import time
+
+from .exceptions import CircuitOpen
+
+log = logging.getLogger("mattermostautodriver.api")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+FAILURE_STATUS_CODES = frozenset((500, 502, 503, 504))
+"""
+Response statuses counted as failures, here and by the load balancer.
+Mattermost answers 501 at once and for good when a feature (e.g. LDAP or
+plugins) is disabled, which is no sign of a part of the API or a node being down.
+"""
+
+
+class _Circuit:
+    __slots__ = ("state", "failures", "opened_at", "probing_since")
+
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing_since = None
+
+
+class CircuitBreaker:
+    """Stop sending requests to a part of the API after consecutive failures.
+
+    Requests are grouped by endpoint prefix: ``/api/v4/<group>`` for the
+    REST API (e.g. ``/api/v4/ai``) and ``/plugins/<plugin id>`` for plugin
+    APIs (e.g. ``/plugins/playbooks``), unless one of ``prefixes`` matches.
+
+    After ``failure_threshold`` consecutive transport errors or 500, 502, 503
+    and 504 responses for a prefix, its circuit opens: requests fail immediately with
+    ``CircuitOpen`` and failing requests are no longer retried. After
+    ``recovery_timeout`` seconds, the circuit is half-open: a single request
+    is let through as a probe. If it succeeds the circuit closes, otherwise
+    it opens again.
+
+    A breaker is thread safe and can be shared by several clients.
+
+    :param failure_threshold: Consecutive failures opening the circuit
+    :param recovery_timeout: Seconds before an open circuit lets a probe through
+    :param prefixes: Endpoint prefixes to group requests by, instead of the defaults
+    """
+
+    def __init__(self, failure_threshold=5, recovery_timeout=30.0, prefixes=()):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        # Longest prefixes first so the most specific one wins
+        self.prefixes = sorted(prefixes, key=len, reverse=True)
+        self._lock = threading.Lock()
+        self._circuits = {}
+
+    def attach(self, client):
+        """Record the responses of ``client``. Returns ``self``.
+
+        Transport errors are recorded by the client itself, before deciding
+        whether to retry.
+        """
+        client.add_hook("response", self)
+        return self
+
+    def prefix(self, path):
+        for prefix in self.prefixes:
+            if path.startswith(prefix):
+                return prefix
+        segments = path.split("/", 5)
+        if path.startswith("/api/v4/"):
+            return "/".join(segments[:4])
+        return "/".join(segments[:3])
+
+    def state(self, path):
+        """
+        :return: ``"closed"``, ``"open"`` or ``"half-open"``, the state of the circuit of ``path``
+        """
+        with self._lock:
+            circuit = self._circuits.get(self.prefix(path))
+            if circuit is None:
+                return CLOSED
+            self._update(circuit)
+            return circuit.state
+
+    def is_open(self, path):
+        return self.state(path) == OPEN
+
+    def _update(self, circuit):
+        if circuit.state == OPEN and time.monotonic() - circuit.opened_at >= self.recovery_timeout:
+            circuit.state = HALF_OPEN
+            circuit.probing_since = None
+
+    def acquire(self, path):
+        """Check that a request to ``path`` may be sent.
+
+        :raises CircuitOpen: If the circuit is open, or half-open with a probe in flight
+        """
+        prefix = self.prefix(path)
+        with self._lock:
+            circuit = self._circuits.get(prefix)
+            if circuit is None:
+                return
+            self._update(circuit)
+            now = time.monotonic()
+            if circuit.state == HALF_OPEN:
+                # A probe that never reported back (e.g. cancelled) does not block the circuit forever
+                if circuit.probing_since is None or now - circuit.probing_since >= self.recovery_timeout:
+                    circuit.probing_since = now
+                    log.info("Circuit for %s is half-open, probing with %s", prefix, path)
+                    return
+                retry_after = circuit.probing_since + self.recovery_timeout - now
+            elif circuit.state == OPEN:
+                retry_after = circuit.opened_at + self.recovery_timeout - now
+            else:
+                return
+        raise CircuitOpen(prefix, retry_after)
+
+    def __call__(self, event):
+        self.record(event.path, event.status in FAILURE_STATUS_CODES)
+
+    def record(self, path, failed):
+        prefix = self.prefix(path)
+        with self._lock:
+            circuit = self._circuits.get(prefix)
+            if circuit is None:
+                if not failed:
+                    return
+                circuit = self._circuits[prefix] = _Circuit()
+            if not failed:
+                if circuit.state != CLOSED:
+                    log.info("Circuit for %s closed", prefix)
+                del self._circuits[prefix]
+                return
+            circuit.failures += 1
+            if circuit.state == HALF_OPEN or circuit.failures >= self.failure_threshold:
+                if circuit.state != OPEN:
+                    log.warning("Circuit for %s opened after %d consecutive failures", prefix, circuit.failures)
+                circuit.state = OPEN
+                circuit.opened_at = time.monotonic()
+                circuit.probing_since = None
@@ -4,14 +4,27 @@ and actually makes the requests to the mattermost server
 """
 
 import asyncio
+import concurrent.futures
+import contextlib
+import functools
+import json
 import logging
+import os
 import random
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 
 import httpx
 
+from .assetcache import AssetCache
+from .balancer import PING_ENDPOINT, LoadBalancer
+from .cache import ResponseCache
+from .circuitbreaker import FAILURE_STATUS_CODES, CircuitBreaker
+from .codec import get_json_codec
+from .constants import DEFAULT_CHUNK_SIZE, MAX_PER_PAGE
 from .exceptions import (
     InvalidMattermostError,
     InvalidOrMissingParameters,
@@ -24,6 +37,10 @@ from .exceptions import (
     TooManyRequests,
     UnknownMattermostError,
 )
+from .hedging import HedgePolicy
+from .instrumentation import REQUEST_EVENTS, RequestEvent, RequestStats, endpoint_template
+from .metrics import MetricsCollector
+from .ratelimit import RateLimiter
 
 log = logging.getLogger("mattermostautodriver.websocket")
 log.setLevel(logging.INFO)
@@ -50,9 +67,87 @@ class BaseClient:
         if options["proxy"]:
             self._proxy = {"all://": options["proxy"]}
 
+        self._timeout = self._make_timeout(options)
+        self._limits = httpx.Limits(
+            max_connections=options.get("max_connections", 100),
+            max_keepalive_connections=options.get("max_keepalive_connections", 20),
+            keepalive_expiry=options.get("keepalive_expiry", 5.0),
+        )
+        # A client passed in the http_client option is shared with other
+        # drivers and left open when this one is closed
+        self._owns_http_client = options.get("http_client") is None
+
         self._max_retries = options.get("max_retries", 3)
         self._retry_max_sleep = options.get("retry_max_sleep", 30)
 
+        # Monotonic time until which no request is sent, after a 429 with a wait time
+        self._paused_until = 0.0
+        self._pause_lock = threading.Lock()
+
+        self._hooks = {event: [] for event in REQUEST_EVENTS}
+        self._request_stats = self._option_instance(options.get("request_stats"), RequestStats)
+        if self._request_stats is not None:
+            self._request_stats.attach(self)
+
+        # GET requests currently sent, by _request_key, when coalescing is enabled
+        self._in_flight = {} if options.get("coalesce_requests") else None
+        self._in_flight_lock = threading.Lock()
+
+        self._metrics = self._option_instance(options.get("metrics"), MetricsCollector)
+        if self._metrics is not None:
+            self._metrics.attach(self)
+
+        self._hedge = self._option_instance(options.get("hedge"), HedgePolicy)
+        if self._hedge is not None:
+            self._hedge.attach(self)
+
+        self._circuit_breaker = self._option_instance(options.get("circuit_breaker"), CircuitBreaker)
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.attach(self)
+
+        self._json_codec = get_json_codec(options.get("json_codec"))
+        self._rate_limiter = self._option_instance(options.get("rate_limit"), RateLimiter)
+        self._response_cache = self._option_instance(options.get("response_cache"), ResponseCache)
+        asset_cache = options.get("asset_cache")
+        if isinstance(asset_cache, (str, os.PathLike)):
+            asset_cache = AssetCache(asset_cache)
+        self._asset_cache = self._option_instance(asset_cache, AssetCache)
+
+        load_balancer = options.get("load_balancer")
+        if load_balancer is not None and not isinstance(load_balancer, LoadBalancer):
+            load_balancer = LoadBalancer(load_balancer)
+        self._load_balancer = load_balancer
+
+    @staticmethod
+    def _option_instance(value, cls):
+        """Resolve an option accepting False/None (disabled), True (default ``cls``) or a ``cls`` instance."""
+        if value is True:
+            return cls()
+        if value is False:
+            return None
+        return value
+
+    @staticmethod
+    def _make_timeout(options):
+        """Build the per request ``httpx.Timeout`` from ``request_timeout`` and the
+        ``connect_timeout``/``read_timeout``/``write_timeout``/``pool_timeout`` overrides."""
+        overrides = {
+            phase: options.get(f"{phase}_timeout")
+            for phase in ("connect", "read", "write", "pool")
+            if options.get(f"{phase}_timeout") is not None
+        }
+        return httpx.Timeout(options.get("request_timeout"), **overrides)
+
+    def _http_client_options(self):
+        """Keyword arguments used to create the underlying HTTPX client."""
+        return {
+            "http2": self._options.get("http2", False),
+            "proxy": self._proxy,
+            "verify": self._options.get("verify", True),
+            "transport": self._options.get("transport"),
+            "limits": self._limits,
+        }
+
     @staticmethod
     def _make_url(scheme, url, port):
         return f"{scheme:s}://{url:s}:{port:d}"
@@ -114,6 +209,80 @@ class BaseClient:
     def url(self):
         return self._url
 
+    @property
+    def load_balancer(self):
+        """
+        :return: The ``LoadBalancer`` spreading requests across app nodes, or None if the ``load_balancer`` option is not set
+        """
+        return self._load_balancer
+
+    def _acquire_node(self, base_url):
+        """Base URL of the next attempt and the node it is sent to, None without load balancing."""
+        if self._load_balancer is None:
+            return base_url, None
+        node = self._load_balancer.acquire()
+        return node.url, node
+
+    def _release_node(self, node, duration=None, failed=False):
+        if node is not None:
+            self._load_balancer.release(node, duration, failed)
+
+    def _record_ping(self, node, response):
+        """Record the health of a node that answered ``System.get_ping`` with ``response``, None if it did not.
+
+        :return: Whether the node is healthy
+        """
+        healthy = response is not None and response.status_code == 200
+        if not healthy:
+            log.debug("Health check of %s failed with %r", node.url, response)
+        self._load_balancer.record_check(node, healthy)
+        return healthy
+
+    @property
+    def response_cache(self):
+        """
+        :return: The cache of GET responses, or None if the ``response_cache`` option is not set
+        """
+        return self._response_cache
+
+    @property
+    def asset_cache(self):
+        """
+        :return: The on-disk cache of binary assets, or None if the ``asset_cache`` option is not set
+        """
+        return self._asset_cache
+
+    @property
+    def request_stats(self):
+        """
+        :return: The ``RequestStats`` aggregating request events, or None if disabled
+        """
+        return self._request_stats
+
+    @property
+    def metrics(self):
+        """
+        :return: The ``MetricsCollector`` of this client, or None if disabled
+        """
+        return self._metrics
+
+    @property
+    def rate_limiter(self):
+        """
+        :return: The client side rate limiter, or None if the ``rate_limit`` option is not set
+        """
+        return self._rate_limiter
+
+    @property
+    def rate_limit_remaining(self):
+        """
+        :return: The estimated number of requests that can be sent without being
+            throttled, or None if unknown or the ``rate_limit`` option is not set
+        """
+        if self._rate_limiter is None:
+            return None
+        return self._rate_limiter.remaining
+
     @property
     def cookies(self):
         """
@@ -143,7 +312,7 @@ class BaseClient:
             return {}
         return {"Authorization": "Bearer {token:s}".format(token=self._token)}
 
-    def _build_request(self, method, options=None, params=None, data=None, files=None):
+    def _build_request(self, method, options=None, params=None, data=None, files=None, headers=None):
         def filter_dict_or_none(d):
             if not isinstance(d, dict):
                 # this method is only meant to filter dicts, return everything else unchanged
@@ -156,7 +325,10 @@ class BaseClient:
 
             return None
 
-        request_params = {"headers": self.auth_header(), "timeout": self.request_timeout}
+        request_params = {"headers": self.auth_header(), "timeout": self._timeout}
+
+        if headers:
+            request_params["headers"] = {**(request_params["headers"] or {}), **headers}
 
         filtered_params = filter_dict_or_none(params)
         filtered_options = filter_dict_or_none(options)
@@ -168,7 +340,8 @@ class BaseClient:
 
         if method in ("post", "put"):
             if filtered_options is not None:
-                request_params["json"] = filtered_options
+                request_params["content"] = self._json_codec.dumps(filtered_options)
+                request_params["headers"] = {**(request_params["headers"] or {}), "Content-Type": "application/json"}
             if filtered_data is not None:
                 request_params["data"] = filtered_data
             if filtered_files is not None:
@@ -223,6 +396,177 @@ class BaseClient:
                     return wait
         return None
 
+    def add_hook(self, event, hook):
+        """Call ``hook`` with a ``RequestEvent`` on each request ``event``.
+
+        :param event: One of ``"request"``, ``"response"``, ``"retry"``, ``"error"`` and ``"pause"``,
+            see :data:`~mattermostautodriver.instrumentation.REQUEST_EVENTS`
+        :param hook: Callable taking a :class:`~mattermostautodriver.instrumentation.RequestEvent`.
+            Hooks are called synchronously, also by ``AsyncClient``, and must be quick.
+        """
+        if event not in self._hooks:
+            raise ValueError(f"Unknown request event {event!r}, expected one of {', '.join(REQUEST_EVENTS)}")
+        self._hooks[event].append(hook)
+
+    def remove_hook(self, event, hook):
+        self._hooks[event].remove(hook)
+
+    def _emit(self, event, method, endpoint, attempt, started, response=None, duration=None, error=None, delay=None):
+        hooks = self._hooks[event]
+        if not hooks:
+            return
+        status = size = None
+        if response is not None:
+            status = response.status_code
+            size = self._response_size(response)
+        request_event = RequestEvent(
+            event,
+            method,
+            endpoint_template(endpoint),
+            endpoint,
+            attempt,
+            status,
+            size,
+            duration,
+            time.monotonic() - started,
+            error,
+            delay,
+        )
+        for hook in hooks:
+            try:
+                hook(request_event)
+            except Exception:
+                log.exception("Request hook %r failed on %s event", hook, event)
+
+    @staticmethod
+    def _response_size(response):
+        try:
+            return len(response.content)
+        except httpx.ResponseNotRead:
+            # Streamed response: only the announced size is known
+            length = response.headers.get("Content-Length")
+            return int(length) if length and length.isdigit() else None
+
+    def _cache_lookup(self, endpoint, params):
+        """Find the cached response of a GET request.
+
+        Returns (key, entry): the cache key of the request, None if caching is
+        disabled, and its ``CacheEntry`` if one is stored.
+        """
+        if self._response_cache is None:
+            return None, None
+        key = self._request_key(endpoint, params)
+        return key, self._response_cache.get(key)
+
+    def _request_key(self, endpoint, params):
+        """Key identifying identical GET requests, for caching and coalescing."""
+        # Responses depend on who is asking, so the credentials are part of the key
+        return (endpoint, json.dumps(params, sort_keys=True, default=str), self._token)
+
+    def _decode_json(self, response):
+        """Decode a JSON response body with the configured codec. Raises ValueError if it is not JSON."""
+        return self._json_codec.loads(response.content)
+
+    @staticmethod
+    def _conditional_headers(entry):
+        if entry is None:
+            return None
+        return {"If-None-Match": entry.etag}
+
+    def _asset_lookup(self, endpoint, params):
+        """Find the cached asset of a GET request.
+
+        Returns (key, entry, response): ``response`` is the cached asset if it
+        can be used without revalidation, None otherwise.
+        """
+        # Keyed by user rather than token, so that a new session finds the assets of the previous ones
+        key = (self.url, endpoint, json.dumps(params, sort_keys=True, default=str), self._userid or self._token)
+        entry = self._asset_cache.get(key)
+        if entry is not None and self._asset_cache.is_fresh(entry):
+            return key, entry, self._asset_cache.load(entry, self.url + endpoint)
+        return key, entry, None
+
+    def _cache_store(self, key, endpoint, response, result):
+        etag = response.headers.get("ETag")
+        if key is not None and etag and not isinstance(result, httpx.Response):
+            self._response_cache.put(key, endpoint, etag, result)
+
+    def _hedge_delay(self, method, endpoint, data, files):
+        """Seconds after which the request is hedged, or None if it is not hedged."""
+        if self._hedge is None or not self._body_is_replayable(data, files):
+            return None
+        return self._hedge.delay(method.lower(), endpoint_template(endpoint))
+
+    @property
+    def paused_for(self):
+        """
+        :return: Seconds until requests are sent again after a rate limit pause, 0 if not paused
+        """
+        return max(0.0, self._paused_until - time.monotonic())
+
+    def pause(self, seconds):
+        """Hold back all requests of this client for ``seconds``.
+
+        Called when the server answers 429 with a wait time, so that other
+        requests in flight or started meanwhile, including from other threads
+        sharing the client, wait instead of being rejected as well.
+
+        :return: The monotonic time until which requests are held back
+        """
+        with self._pause_lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            return self._paused_until
+
+    def _pause_remaining(self, waited_until):
+        """Seconds to wait for the client wide pause, and the end of that pause.
+
+        A request does not wait again for a pause it already waited out, i.e.
+        one ending at or before ``waited_until``.
+
+        :raises TooManyRequests: If the pause lasts longer than ``retry_max_sleep``,
+            like a request told to wait that long by the server
+        """
+        paused_until = self._paused_until
+        if paused_until <= waited_until:
+            return 0.0, waited_until
+        remaining = paused_until - time.monotonic()
+        if remaining > self._retry_max_sleep:
+            raise TooManyRequests(f"Requests are paused for {remaining:.0f} seconds after a rate limit", remaining)
+        return remaining, paused_until
+
+    def _pause_after(self, response, method, endpoint, attempt, started):
+        """Pause the client after a 429 carrying a wait time, whether or not the request is retried.
+
+        :return: The end of the pause, or 0 if the client was not paused
+        """
+        if response.status_code != 429:
+            return 0.0
+        wait = self._parse_retry_after(response)
+        if wait is None:
+            return 0.0
+        paused_until = self.pause(wait)
+        log.info("Rate limited - pausing all requests for %.1f seconds", wait)
+        self._emit("pause", method, endpoint, attempt, started, response, delay=wait)
+        return paused_until
+
+    def _rate_limit_delay(self):
+        """Seconds to wait before sending a request to stay within the server's rate limit."""
+        if self._rate_limiter is None:
+            return 0.0
+        return self._rate_limiter.reserve()
+
+    def _update_rate_limit(self, response):
+        """Feed the ``X-RateLimit-*`` headers of ``response`` to the rate limiter, if any."""
+        if self._rate_limiter is None:
+            return
+        try:
+            limit = int(response.headers["X-RateLimit-Limit"])
+            remaining = int(response.headers["X-RateLimit-Remaining"])
+        except (KeyError, ValueError):
+            return
+        reset = self._parse_wait_time(response.headers.get("X-RateLimit-Reset", ""))
+        self._rate_limiter.update(limit, remaining, reset)
+
     @staticmethod
     def _parse_error_fields(response):
         """Extract the fields of a standard Mattermost JSON error body.
@@ -269,7 +613,38 @@ class BaseClient:
         """
         return files is None and (data is None or isinstance(data, dict))
 
-    def _retry_delay(self, method, attempt, data=None, files=None, response=None):
+    def _backoff(self, attempt):
+        """Exponential backoff with jitter for the given attempt, capped at ``retry_max_sleep``."""
+        return min(0.5 * 2**attempt * (1 + random.random()), self._retry_max_sleep)
+
+    def _upload_retry_delay(self, attempt, error):
+        """Seconds to wait before resuming an upload session after ``error``, or None to give up.
+
+        Sending a chunk is not idempotent on its own, but the upload is resumed
+        from the offset reported by the server, so transport errors, 429 and
+        502/503/504 responses can be retried like those of idempotent requests.
+        """
+        if attempt >= self._max_retries:
+            return None
+
+        if isinstance(error, TooManyRequests) and error.retry_after is not None:
+            if error.retry_after > self._retry_max_sleep:
+                return None
+            return error.retry_after
+
+        status_code = getattr(error, "status_code", None)
+        if isinstance(error, httpx.TransportError) or status_code == 429 or status_code in self._RETRY_STATUS_CODES:
+            return self._backoff(attempt)
+
+        return None
+
+    @staticmethod
+    def _upload_throughput(sent, started):
+        """Average upload speed in bytes per second since ``started``."""
+        elapsed = time.monotonic() - started
+        return sent / elapsed if elapsed > 0 else 0.0
+
+    def _retry_delay(self, method, attempt, data=None, files=None, response=None, endpoint=None):
         """Seconds to wait before retrying the request, or None if it must not be retried.
 
         A 429 is retried for any method since the server rejected the request
@@ -284,8 +659,12 @@ class BaseClient:
         if attempt >= self._max_retries:
             return None
 
+        if endpoint is not None and self._circuit_breaker is not None and self._circuit_breaker.is_open(endpoint):
+            # The failures opened the circuit, fail now rather than retry
+            return None
+
         method = method.lower()
-        backoff = min(0.5 * 2**attempt * (1 + random.random()), self._retry_max_sleep)
+        backoff = self._backoff(attempt)
 
         if response is None:
             if method in self._IDEMPOTENT_METHODS:
@@ -305,8 +684,87 @@ class BaseClient:
 
         return None
 
+    def _build_stream_request(self, method, url, request_params):
+        """Turn the output of ``_build_request`` into an ``httpx.Request`` for ``send(..., stream=True)``.
+
+        Returns (request, auth) as ``auth`` is an argument of ``send()`` rather
+        than of the request itself.
+        """
+        request_params = dict(request_params)
+        auth = request_params.pop("auth", httpx.USE_CLIENT_DEFAULT)
+        return self.client.build_request(method.upper(), url, **request_params), auth
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _open_download_target(destination):
+        """Yield a binary file object for ``destination``.
+
+        Paths are opened (and closed) here, file objects are used as given and
+        left open for the caller.
+        """
+        if hasattr(destination, "write"):
+            yield destination
+        else:
+            with open(destination, "wb") as fh:
+                yield fh
+
+    @staticmethod
+    def _restart_download(fh, start, error):
+        """Rewind ``fh`` to ``start`` when the server ignored a ``Range`` request.
+
+        Re-raises ``error`` if the destination cannot be rewound, as appending
+        the full body again would corrupt the download.
+        """
+        if not fh.seekable():
+            raise error
+        log.warning("Server does not support resuming downloads - restarting from the beginning")
+        fh.seek(start)
+        fh.truncate()
+
+    @staticmethod
+    def _page_items(endpoint, page):
+        """The list of items contained in one page of a paginated endpoint.
+
+        Most endpoints return a plain list. Post lists are returned in their
+        ``order``, and other objects must wrap the items in their only list field
+        (e.g. ``{"items": [...], "total_count": 3}``).
+        """
+        if isinstance(page, list):
+            return page
+
+        if isinstance(page, dict):
+            if "order" in page and "posts" in page:
+                return [page["posts"][post_id] for post_id in page["order"]]
+
+            lists = [value for value in page.values() if isinstance(value, list)]
+            if len(lists) == 1:
+                return lists[0]
+
+        raise TypeError(f"Cannot find the items of the page returned by {endpoint}")
+
+    @staticmethod
+    def _cursor_page(endpoint, page, items):
+        """Split one page of a cursor paginated endpoint into (items, next_cursor).
+
+        ``next_cursor`` is None on the last page.
+        """
+        try:
+            page_items = page[items]
+        except (KeyError, TypeError):
+            raise TypeError(f"Cannot find the {items!r} of the page returned by {endpoint}") from None
+        if isinstance(page_items, dict):
+            page_items = list(page_items.values())
+        return page_items or [], page.get("next_cursor") or None
+
+    @staticmethod
+    def _page_params(params, page, per_page):
+        return {**(params or {}), "page": page, "per_page": per_page}
+
     @staticmethod
     def _check_response(response):
+        if response.status_code == 304:
+            # Reply to a conditional request: the cached response is still valid
+            return
         try:
             response.raise_for_status()
         except httpx.HTTPStatusError as e:
@@ -357,74 +815,250 @@ class BaseClient:
 class Client(BaseClient):
     def __init__(self, options):
         super().__init__(options)
-        self.client = httpx.Client(
-            http2=options.get("http2", False),
-            proxy=self._proxy,
-            verify=options.get("verify", True),
-            transport=options.get("transport"),
-        )
-
-    def make_request(self, method, endpoint, options=None, params=None, data=None, files=None, basepath=None):
+        self.client = options.get("http_client") or httpx.Client(**self._http_client_options())
+        self._hedge_pool = None
+
+    def make_request(
+        self,
+        method,
+        endpoint,
+        options=None,
+        params=None,
+        data=None,
+        files=None,
+        basepath=None,
+        headers=None,
+        stream=False,
+    ):
+        """Send a request, retrying it as described in the documentation.
+
+        With ``stream=True`` the response body is not read: the returned
+        response must be consumed with ``iter_bytes()`` and closed by the caller.
+        """
         if basepath is not None:
             raise DeprecationWarning(
                 "'basepath' no longer has any effect and will be removed in version 3.x. "
                 "Please remove it from your code."
             )
-        request, url, request_params = self._build_request(method, options, params, data, files)
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.acquire(endpoint)
+        request, base_url, request_params = self._build_request(method, options, params, data, files, headers)
 
+        started = time.monotonic()
+        waited_until = 0.0
         attempt = 0
         while True:
+            pause, waited_until = self._pause_remaining(waited_until)
+            if pause > 0:
+                log.debug("Waiting %.2f seconds for the rate limit pause to end", pause)
+                time.sleep(pause)
+            throttle = self._rate_limit_delay()
+            if throttle:
+                log.debug("Throttling request for %.2f seconds to stay within the rate limit", throttle)
+                time.sleep(throttle)
+            url, node = self._select_node(base_url)
+            self._emit("request", method, endpoint, attempt, started)
+            sent = time.monotonic()
             try:
-                response = request(url + endpoint, **request_params)
+                if stream:
+                    stream_request, auth = self._build_stream_request(method, url + endpoint, request_params)
+                    response = self.client.send(stream_request, auth=auth, stream=True)
+                elif (hedge_delay := self._hedge_delay(method, endpoint, data, files)) is not None:
+                    response = self._send_hedged(request, url + endpoint, request_params, hedge_delay)
+                else:
+                    response = request(url + endpoint, **request_params)
             except httpx.TransportError as e:
                 # No response was received at all: connection failures,
                 # timeouts and protocol errors. Retried for idempotent
                 # methods only, with exponential backoff.
-                delay = self._retry_delay(method, attempt, data=data, files=files)
+                self._release_node(node, failed=True)
+                if self._circuit_breaker is not None:
+                    self._circuit_breaker.record(endpoint, failed=True)
+                delay = self._retry_delay(method, attempt, data=data, files=files, endpoint=endpoint)
                 if delay is None:
+                    self._emit("error", method, endpoint, attempt, started, duration=time.monotonic() - sent, error=e)
                     raise
+                self._emit("retry", method, endpoint, attempt, started, error=e, delay=delay)
                 log.warning("Received %r - retrying in %.1f seconds", e, delay)
+            except BaseException as e:
+                # E.g. cancelled, neither the node nor the hooks may count it as in flight forever
+                self._release_node(node)
+                self._emit("error", method, endpoint, attempt, started, duration=time.monotonic() - sent, error=e)
+                raise
             else:
                 # A response was received: _retry_delay decides based on its
                 # status code (429 for all methods, 502/503/504 for idempotent
                 # methods) and takes the wait for a 429 from its
                 # Retry-After / X-RateLimit-Reset headers.
-                delay = self._retry_delay(method, attempt, data=data, files=files, response=response)
+                self._release_node(node, time.monotonic() - sent, failed=response.status_code in FAILURE_STATUS_CODES)
+                self._update_rate_limit(response)
+                self._emit("response", method, endpoint, attempt, started, response, time.monotonic() - sent)
+                # A retried request waits out the pause below, it must not wait for it again
+                waited_until = max(waited_until, self._pause_after(response, method, endpoint, attempt, started))
+                delay = self._retry_delay(method, attempt, data=data, files=files, response=response, endpoint=endpoint)
                 if delay is None:
-                    self._check_response(response)
+                    if stream and response.is_error:
+                        # Error bodies are small and needed to build the exception
+                        response.read()
+                        response.close()
+                    try:
+                        self._check_response(response)
+                    except Exception as e:
+                        self._emit("error", method, endpoint, attempt, started, response, error=e)
+                        raise
                     return response
+                self._emit("retry", method, endpoint, attempt, started, response, delay=delay)
+                if stream:
+                    response.close()
                 log.warning("Received status %d - retrying in %.1f seconds", response.status_code, delay)
             time.sleep(delay)
             attempt += 1
 
+    def _select_node(self, base_url):
+        if self._load_balancer is not None:
+            for node in self._load_balancer.due_for_check():
+                self._ping_node(node)
+        return self._acquire_node(base_url)
+
+    def _ping_node(self, node):
+        try:
+            response = self.client.get(node.url + PING_ENDPOINT, timeout=self._timeout)
+        except httpx.TransportError:
+            response = None
+        return self._record_ping(node, response)
+
+    def check_nodes(self):
+        """Ping every node of the load balancer with ``System.get_ping``.
+
+        Nodes not answering are ejected, ejected nodes answering are put back into rotation.
+
+        :return: Whether each node is healthy, by base URL
+        """
+        if self._load_balancer is None:
+            return {}
+        return {node.url: self._ping_node(node) for node in self._load_balancer.nodes}
+
+    def _send_hedged(self, request, url, request_params, delay):
+        """Send a request, sending it again if no response arrived within ``delay`` seconds.
+
+        Returns the first response. The slower attempt cannot be interrupted
+        and finishes in the background, its response is discarded.
+        """
+        executor = self._hedge_executor()
+        attempts = {executor.submit(request, url, **request_params)}
+        done, _ = concurrent.futures.wait(attempts, timeout=delay)
+        if not done and self._hedge.acquire():
+            log.debug("No response after %.3f seconds, hedging request to %s", delay, url)
+            attempts.add(executor.submit(request, url, **request_params))
+        while True:
+            done, attempts = concurrent.futures.wait(attempts, return_when=concurrent.futures.FIRST_COMPLETED)
+            for attempt in done:
+                if attempt.exception() is None:
+                    return attempt.result()
+            if not attempts:
+                return done.pop().result()
+
+    def _hedge_executor(self):
+        with self._in_flight_lock:
+            if self._hedge_pool is None:
+                # Attempts beyond the connection pool size would wait for a connection anyway
+                self._hedge_pool = ThreadPoolExecutor(
+                    max_workers=self._limits.max_connections, thread_name_prefix="mattermost-hedge"
+                )
+            return self._hedge_pool
+
     def __enter__(self):
-        self.client.__enter__()
+        if self._owns_http_client:
+            self.client.__enter__()
         return self
 
     def __exit__(self, *exc_info):
-        return self.client.__exit__(*exc_info)
+        if self._owns_http_client:
+            return self.client.__exit__(*exc_info)
 
     def get(self, endpoint, options=None, params=None):
-        response = self.make_request("get", endpoint, options=options, params=params)
+        if self._in_flight is None:
+            return self._get(endpoint, options, params)
+
+        key = self._request_key(endpoint, params)
+        with self._in_flight_lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = self._in_flight[key] = Future()
+        if not leader:
+            return future.result()
+
+        try:
+            result = self._get(endpoint, options, params)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[key]
+
+    def _get(self, endpoint, options, params):
+        if self._asset_cache is not None and self._asset_cache.caches(endpoint):
+            return self._get_asset(endpoint, options, params)
+
+        key, cached = self._cache_lookup(endpoint, params)
+        if cached is not None and self._response_cache.is_fresh(cached):
+            return cached.value
+
+        response = self.make_request(
+            "get", endpoint, options=options, params=params, headers=self._conditional_headers(cached)
+        )
+
+        if response.status_code == 304 and cached is not None:
+            self._response_cache.refresh(key, endpoint, cached)
+            return cached.value
 
         if response.headers["Content-Type"] != "application/json":
             log.debug("Response is not application/json, returning raw response")
             return response
 
         try:
-            return response.json()
+            result = self._decode_json(response)
         except ValueError:
             log.debug("Could not convert response to json, returning raw response")
             return response
 
+        self._cache_store(key, endpoint, response, result)
+        return result
+
+    def _get_asset(self, endpoint, options, params):
+        key, entry, cached = self._asset_lookup(endpoint, params)
+        if cached is not None:
+            return cached
+
+        response = self.make_request(
+            "get", endpoint, options=options, params=params, headers=self._asset_cache.conditional_headers(entry)
+        )
+        if response.status_code == 304 and entry is not None:
+            cached = self._asset_cache.load(entry, self.url + endpoint)
+            if cached is not None:
+                self._asset_cache.refresh(key, entry)
+                return cached
+            # The body was evicted since the lookup
+            response = self.make_request("get", endpoint, options=options, params=params)
+
+        self._asset_cache.put(key, response)
+        return response
+
     def post(self, endpoint, options=None, params=None, data=None, files=None):
-        return self.make_request("post", endpoint, options=options, params=params, data=data, files=files).json()
+        return self._decode_json(
+            self.make_request("post", endpoint, options=options, params=params, data=data, files=files)
+        )
 
     def put(self, endpoint, options=None, params=None, data=None):
-        return self.make_request("put", endpoint, options=options, params=params, data=data).json()
+        return self._decode_json(self.make_request("put", endpoint, options=options, params=params, data=data))
 
     def delete(self, endpoint, options=None, params=None, data=None):
-        return self.make_request("delete", endpoint, options=options, params=params, data=data).json()
+        return self._decode_json(self.make_request("delete", endpoint, options=options, params=params, data=data))
 
     def head(self, endpoint, options=None, params=None):
         # HEAD responses carry no body; return the raw response for headers/status
@@ -433,84 +1067,434 @@ class Client(BaseClient):
     def call_webhook(self, hook_id, options=None):
         return self.make_request("post", "/hooks/" + hook_id, options=options)
 
+    def paginate(self, endpoint, params=None, per_page=None, prefetch=False):
+        """Iterate over the items of all pages of a paginated GET endpoint.
+
+        Pages are requested with ``per_page`` items, :data:`~mattermostautodriver.constants.MAX_PER_PAGE`
+        by default, until a page with fewer items is returned.
+
+        :param params: Query parameters other than ``page`` and ``per_page``.
+        :param prefetch: Request the next page in a background thread while
+            the items of the current one are consumed.
+        :return: A generator of items.
+        """
+        per_page = per_page or MAX_PER_PAGE
+
+        def fetch(page):
+            return self._page_items(endpoint, self.get(endpoint, params=self._page_params(params, page, per_page)))
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            page = 0
+            items = fetch(page)
+            while True:
+                last_page = len(items) < per_page
+                next_items = None
+                if executor is not None and not last_page:
+                    next_items = executor.submit(fetch, page + 1)
+                yield from items
+                if last_page:
+                    return
+                page += 1
+                previous, items = items, next_items.result() if next_items is not None else fetch(page)
+                if items == previous:
+                    # The server ignored page, the iteration would never end
+                    log.warning("Page %d of %s repeats the previous page, stopping", page, endpoint)
+                    return
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def paginate_cursor(self, endpoint, options, items, prefetch=True, checkpoint=None):
+        """Iterate over the items of all pages of a cursor paginated POST endpoint.
+
+        Each page is requested with the ``next_cursor`` of the previous one as
+        its ``cursor``, until a page comes without ``next_cursor``.
+
+        :param options: The request body of the first request.
+        :param items: Name of the response field holding the items of a page.
+        :param prefetch: Request the next page in a background thread while
+            the items of the current one are consumed.
+        :param checkpoint: Called with the cursor of the next page once all
+            items of a page were consumed. Passing that cursor as ``cursor``
+            of ``options`` resumes an interrupted iteration.
+        :return: A generator of items.
+        """
+
+        def fetch(cursor):
+            return self._cursor_page(endpoint, self.post(endpoint, options={**options, "cursor": cursor}), items)
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            page_items, cursor = fetch(options.get("cursor"))
+            while True:
+                next_page = None
+                if executor is not None and cursor is not None:
+                    next_page = executor.submit(fetch, cursor)
+                yield from page_items
+                if cursor is None:
+                    return
+                if checkpoint is not None:
+                    checkpoint(cursor)
+                page_items, cursor = next_page.result() if next_page is not None else fetch(cursor)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def download(self, endpoint, destination, params=None, chunk_size=None):
+        """Stream the response body of a GET request to a file.
+
+        The body is written in chunks of ``chunk_size`` bytes as it arrives, so
+        memory usage does not depend on the size of the download. If the
+        transfer is interrupted by a connection error it is resumed with a
+        ``Range`` request from the last byte written, up to ``max_retries``
+        times in a row.
+
+        :param destination: A path or a binary file object opened for writing.
+        :param chunk_size: Size of the chunks written to ``destination``.
+        :return: The number of bytes written.
+        """
+        chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+        with self._open_download_target(destination) as fh:
+            start = fh.tell() if fh.seekable() else 0
+            written = 0
+            attempt = 0
+            error = None
+            while True:
+                headers = {"Range": f"bytes={written}-"} if written else None
+                response = self.make_request("get", endpoint, params=params, headers=headers, stream=True)
+                try:
+                    if written and response.status_code != 206:
+                        self._restart_download(fh, start, error)
+                        written = 0
+                    for chunk in response.iter_bytes(chunk_size):
+                        fh.write(chunk)
+                        written += len(chunk)
+                        attempt = 0
+                except httpx.TransportError as e:
+                    delay = self._retry_delay("get", attempt)
+                    if delay is None:
+                        raise
+                    error = e
+                    log.warning(
+                        "Download interrupted by %r after %d bytes - resuming in %.1f seconds", e, written, delay
+                    )
+                else:
+                    return written
+                finally:
+                    response.close()
+                time.sleep(delay)
+                attempt += 1
+
+    def upload_large_file(self, channel_id, path, chunk_size=None, filename=None, progress=None):
+        """Upload a file to a channel through a resumable upload session.
+
+        The file is sent in chunks of ``chunk_size`` bytes. If sending a chunk
+        fails with a connection error or a 429/502/503/504 response, the offset
+        stored by the server is queried with ``get_upload`` and the upload
+        resumes from there, up to ``max_retries`` times in a row.
+
+        :param channel_id: The ID of the channel to upload to.
+        :param path: Path of the file to upload.
+        :param chunk_size: Size in bytes of the chunks sent to the server.
+        :param filename: Name given to the file, defaults to the basename of ``path``.
+        :param progress: Called as ``progress(bytes_uploaded, file_size, bytes_per_second)``
+            after every chunk.
+        :return: The file info of the uploaded file, whose ``id`` can be attached to a post.
+        """
+        chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+        filename = filename or os.path.basename(path)
+        file_size = os.path.getsize(path)
+
+        session = self.post(
+            "/api/v4/uploads", options={"channel_id": channel_id, "filename": filename, "file_size": file_size}
+        )
+        upload_id = session["id"]
+        offset = session["file_offset"]
+
+        started = time.monotonic()
+        sent = 0
+        attempt = 0
+        with open(path, "rb") as fh:
+            while True:
+                fh.seek(offset)
+                chunk = fh.read(chunk_size)
+                try:
+                    response = self.make_request(
+                        "post", f"/api/v4/uploads/{upload_id}", files={"file": (filename, chunk)}
+                    )
+                except (httpx.HTTPError, InvalidMattermostError) as e:
+                    delay = self._upload_retry_delay(attempt, e)
+                    if delay is None:
+                        raise
+                    log.warning(
+                        "Upload %s interrupted by %r at offset %d - resuming in %.1f seconds",
+                        upload_id,
+                        e,
+                        offset,
+                        delay,
+                    )
+                    time.sleep(delay)
+                    attempt += 1
+                    offset = self.get(f"/api/v4/uploads/{upload_id}")["file_offset"]
+                    continue
+
+                attempt = 0
+                offset += len(chunk)
+                sent += len(chunk)
+                throughput = self._upload_throughput(sent, started)
+                if progress is not None:
+                    progress(offset, file_size, throughput)
+
+                # The server answers 204 No Content until the last chunk is received
+                if response.status_code != 204:
+                    log.info("Upload %s: sent %d bytes at %.2f MiB/s", upload_id, sent, throughput / 2**20)
+                    return self._decode_json(response)
+
     def close(self):
-        self.client.close()
+        if self._hedge_pool is not None:
+            self._hedge_pool.shutdown(wait=False)
+        if self._owns_http_client:
+            self.client.close()
 
 
 class AsyncClient(BaseClient):
     def __init__(self, options):
         super().__init__(options)
-        self.client = httpx.AsyncClient(
-            http2=options.get("http2", False),
-            proxy=self._proxy,
-            verify=options.get("verify", True),
-            transport=options.get("transport"),
-        )
+        self.client = options.get("http_client") or httpx.AsyncClient(**self._http_client_options())
+
+    async def _select_node(self, base_url):
+        if self._load_balancer is not None:
+            due = self._load_balancer.due_for_check()
+            if due:
+                await asyncio.gather(*(self._ping_node(node) for node in due))
+        return self._acquire_node(base_url)
+
+    async def _ping_node(self, node):
+        try:
+            response = await self.client.get(node.url + PING_ENDPOINT, timeout=self._timeout)
+        except httpx.TransportError:
+            response = None
+        return self._record_ping(node, response)
+
+    async def check_nodes(self):
+        """Ping every node of the load balancer with ``System.get_ping``, concurrently.
+
+        Nodes not answering are ejected, ejected nodes answering are put back into rotation.
+
+        :return: Whether each node is healthy, by base URL
+        """
+        if self._load_balancer is None:
+            return {}
+        nodes = self._load_balancer.nodes
+        healthy = await asyncio.gather(*(self._ping_node(node) for node in nodes))
+        return {node.url: node_healthy for node, node_healthy in zip(nodes, healthy)}
+
+    async def _send_hedged(self, request, url, request_params, delay):
+        """Send a request, sending it again if no response arrived within ``delay`` seconds.
+
+        Returns the first response and cancels the slower attempt.
+        """
+        attempts = {asyncio.ensure_future(request(url, **request_params))}
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=delay)
+            if not done and self._hedge.acquire():
+                log.debug("No response after %.3f seconds, hedging request to %s", delay, url)
+                attempts.add(asyncio.ensure_future(request(url, **request_params)))
+            while True:
+                done, attempts = await asyncio.wait(attempts, return_when=asyncio.FIRST_COMPLETED)
+                for attempt in done:
+                    if attempt.exception() is None:
+                        return attempt.result()
+                if not attempts:
+                    return done.pop().result()
+        finally:
+            for attempt in attempts:
+                attempt.cancel()
+            await asyncio.gather(*attempts, return_exceptions=True)
 
     async def __aenter__(self):
-        await self.client.__aenter__()
+        if self._owns_http_client:
+            await self.client.__aenter__()
         return self
 
     async def __aexit__(self, *exc_info):
-        return await self.client.__aexit__(*exc_info)
-
-    async def make_request(self, method, endpoint, options=None, params=None, data=None, files=None, basepath=None):
+        if self._owns_http_client:
+            return await self.client.__aexit__(*exc_info)
+
+    async def make_request(
+        self,
+        method,
+        endpoint,
+        options=None,
+        params=None,
+        data=None,
+        files=None,
+        basepath=None,
+        headers=None,
+        stream=False,
+    ):
+        """Send a request, retrying it as described in the documentation.
+
+        With ``stream=True`` the response body is not read: the returned
+        response must be consumed with ``aiter_bytes()`` and closed by the caller.
+        """
         if basepath is not None:
             raise DeprecationWarning(
                 "'basepath' no longer has any effect and will be removed in version 3.x. "
                 "Please remove it from your code."
             )
-        request, url, request_params = self._build_request(method, options, params, data, files)
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.acquire(endpoint)
+        request, base_url, request_params = self._build_request(method, options, params, data, files, headers)
 
+        started = time.monotonic()
+        waited_until = 0.0
         attempt = 0
         while True:
+            pause, waited_until = self._pause_remaining(waited_until)
+            if pause > 0:
+                log.debug("Waiting %.2f seconds for the rate limit pause to end", pause)
+                await asyncio.sleep(pause)
+            throttle = self._rate_limit_delay()
+            if throttle:
+                log.debug("Throttling request for %.2f seconds to stay within the rate limit", throttle)
+                await asyncio.sleep(throttle)
+            url, node = await self._select_node(base_url)
+            self._emit("request", method, endpoint, attempt, started)
+            sent = time.monotonic()
             try:
-                response = await request(url + endpoint, **request_params)
+                if stream:
+                    stream_request, auth = self._build_stream_request(method, url + endpoint, request_params)
+                    response = await self.client.send(stream_request, auth=auth, stream=True)
+                elif (hedge_delay := self._hedge_delay(method, endpoint, data, files)) is not None:
+                    response = await self._send_hedged(request, url + endpoint, request_params, hedge_delay)
+                else:
+                    response = await request(url + endpoint, **request_params)
             except httpx.TransportError as e:
                 # No response was received at all: connection failures,
                 # timeouts and protocol errors. Retried for idempotent
                 # methods only, with exponential backoff.
-                delay = self._retry_delay(method, attempt, data=data, files=files)
+                self._release_node(node, failed=True)
+                if self._circuit_breaker is not None:
+                    self._circuit_breaker.record(endpoint, failed=True)
+                delay = self._retry_delay(method, attempt, data=data, files=files, endpoint=endpoint)
                 if delay is None:
+                    self._emit("error", method, endpoint, attempt, started, duration=time.monotonic() - sent, error=e)
                     raise
+                self._emit("retry", method, endpoint, attempt, started, error=e, delay=delay)
                 log.warning("Received %r - retrying in %.1f seconds", e, delay)
+            except BaseException as e:
+                # E.g. cancelled, neither the node nor the hooks may count it as in flight forever
+                self._release_node(node)
+                self._emit("error", method, endpoint, attempt, started, duration=time.monotonic() - sent, error=e)
+                raise
             else:
                 # A response was received: _retry_delay decides based on its
                 # status code (429 for all methods, 502/503/504 for idempotent
                 # methods) and takes the wait for a 429 from its
                 # Retry-After / X-RateLimit-Reset headers.
-                delay = self._retry_delay(method, attempt, data=data, files=files, response=response)
+                self._release_node(node, time.monotonic() - sent, failed=response.status_code in FAILURE_STATUS_CODES)
+                self._update_rate_limit(response)
+                self._emit("response", method, endpoint, attempt, started, response, time.monotonic() - sent)
+                # A retried request waits out the pause below, it must not wait for it again
+                waited_until = max(waited_until, self._pause_after(response, method, endpoint, attempt, started))
+                delay = self._retry_delay(method, attempt, data=data, files=files, response=response, endpoint=endpoint)
                 if delay is None:
-                    self._check_response(response)
+                    if stream and response.is_error:
+                        # Error bodies are small and needed to build the exception
+                        await response.aread()
+                        await response.aclose()
+                    try:
+                        self._check_response(response)
+                    except Exception as e:
+                        self._emit("error", method, endpoint, attempt, started, response, error=e)
+                        raise
                     return response
+                self._emit("retry", method, endpoint, attempt, started, response, delay=delay)
+                if stream:
+                    await response.aclose()
                 log.warning("Received status %d - retrying in %.1f seconds", response.status_code, delay)
             await asyncio.sleep(delay)
             attempt += 1
 
     async def get(self, endpoint, options=None, params=None):
-        response = await self.make_request("get", endpoint, options=options, params=params)
+        if self._in_flight is None:
+            return await self._get(endpoint, options, params)
+
+        key = self._request_key(endpoint, params)
+        task = self._in_flight.get(key)
+        if task is None:
+            task = self._in_flight[key] = asyncio.ensure_future(self._get(endpoint, options, params))
+            task.add_done_callback(functools.partial(self._request_done, key))
+        # Shielded so a cancelled caller does not cancel the request shared with the others
+        return await asyncio.shield(task)
+
+    def _request_done(self, key, task):
+        del self._in_flight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved in case every caller was cancelled
+            task.exception()
+
+    async def _get(self, endpoint, options, params):
+        if self._asset_cache is not None and self._asset_cache.caches(endpoint):
+            return await self._get_asset(endpoint, options, params)
+
+        key, cached = self._cache_lookup(endpoint, params)
+        if cached is not None and self._response_cache.is_fresh(cached):
+            return cached.value
+
+        response = await self.make_request(
+            "get", endpoint, options=options, params=params, headers=self._conditional_headers(cached)
+        )
+
+        if response.status_code == 304 and cached is not None:
+            self._response_cache.refresh(key, endpoint, cached)
+            return cached.value
 
         if response.headers["Content-Type"] != "application/json":
             log.debug("Response is not application/json, returning raw response")
             return response
 
         try:
-            return response.json()
+            result = self._decode_json(response)
         except ValueError:
             log.debug("Could not convert response to json, returning raw response")
             return response
 
+        self._cache_store(key, endpoint, response, result)
+        return result
+
+    async def _get_asset(self, endpoint, options, params):
+        key, entry, cached = self._asset_lookup(endpoint, params)
+        if cached is not None:
+            return cached
+
+        response = await self.make_request(
+            "get", endpoint, options=options, params=params, headers=self._asset_cache.conditional_headers(entry)
+        )
+        if response.status_code == 304 and entry is not None:
+            cached = self._asset_cache.load(entry, self.url + endpoint)
+            if cached is not None:
+                self._asset_cache.refresh(key, entry)
+                return cached
+            # The body was evicted since the lookup
+            response = await self.make_request("get", endpoint, options=options, params=params)
+
+        self._asset_cache.put(key, response)
+        return response
+
     async def post(self, endpoint, options=None, params=None, data=None, files=None):
         response = await self.make_request("post", endpoint, options=options, params=params, data=data, files=files)
-        return response.json()
+        return self._decode_json(response)
 
     async def put(self, endpoint, options=None, params=None, data=None):
         response = await self.make_request("put", endpoint, options=options, params=params, data=data)
-        return response.json()
+        return self._decode_json(response)
 
     async def delete(self, endpoint, options=None, params=None, data=None):
         response = await self.make_request("delete", endpoint, options=options, params=params, data=data)
-        return response.json()
+        return self._decode_json(response)
 
     async def head(self, endpoint, options=None, params=None):
         # HEAD responses carry no body; return the raw response for headers/status
@@ -518,7 +1502,180 @@ class AsyncClient(BaseClient):
 
     async def call_webhook(self, hook_id, options=None):
         response = await self.make_request("post", "/hooks/" + hook_id, options=options)
-        return response.json()
+        return self._decode_json(response)
+
+    async def paginate(self, endpoint, params=None, per_page=None, prefetch=False):
+        """Iterate over the items of all pages of a paginated GET endpoint.
+
+        See :meth:`Client.paginate`. With ``prefetch`` the next page is
+        requested in a separate task while the current one is consumed.
+
+        :return: An asynchronous generator of items.
+        """
+        per_page = per_page or MAX_PER_PAGE
+
+        async def fetch(page):
+            return self._page_items(
+                endpoint, await self.get(endpoint, params=self._page_params(params, page, per_page))
+            )
+
+        next_items = None
+        try:
+            page = 0
+            items = await fetch(page)
+            while True:
+                last_page = len(items) < per_page
+                if prefetch and not last_page:
+                    next_items = asyncio.create_task(fetch(page + 1))
+                for item in items:
+                    yield item
+                if last_page:
+                    return
+                page += 1
+                previous, items = items, await next_items if next_items is not None else await fetch(page)
+                next_items = None
+                if items == previous:
+                    # The server ignored page, the iteration would never end
+                    log.warning("Page %d of %s repeats the previous page, stopping", page, endpoint)
+                    return
+        finally:
+            if next_items is not None:
+                next_items.cancel()
+
+    async def paginate_cursor(self, endpoint, options, items, prefetch=True, checkpoint=None):
+        """Iterate over the items of all pages of a cursor paginated POST endpoint.
+
+        See :meth:`Client.paginate_cursor`. With ``prefetch`` the next page is
+        requested in a separate task while the current one is consumed.
+
+        :return: An asynchronous generator of items.
+        """
+
+        async def fetch(cursor):
+            return self._cursor_page(endpoint, await self.post(endpoint, options={**options, "cursor": cursor}), items)
+
+        next_page = None
+        try:
+            page_items, cursor = await fetch(options.get("cursor"))
+            while True:
+                if prefetch and cursor is not None:
+                    next_page = asyncio.create_task(fetch(cursor))
+                for item in page_items:
+                    yield item
+                if cursor is None:
+                    return
+                if checkpoint is not None:
+                    checkpoint(cursor)
+                page_items, cursor = await next_page if next_page is not None else await fetch(cursor)
+                next_page = None
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    async def download(self, endpoint, destination, params=None, chunk_size=None):
+        """Stream the response body of a GET request to a file.
+
+        See :meth:`Client.download`. Chunks are written to ``destination`` as
+        they arrive from the server.
+
+        :param destination: A path or a binary file object opened for writing.
+        :param chunk_size: Size of the chunks written to ``destination``.
+        :return: The number of bytes written.
+        """
+        chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+        with self._open_download_target(destination) as fh:
+            start = fh.tell() if fh.seekable() else 0
+            written = 0
+            attempt = 0
+            error = None
+            while True:
+                headers = {"Range": f"bytes={written}-"} if written else None
+                response = await self.make_request("get", endpoint, params=params, headers=headers, stream=True)
+                try:
+                    if written and response.status_code != 206:
+                        self._restart_download(fh, start, error)
+                        written = 0
+                    async for chunk in response.aiter_bytes(chunk_size):
+                        fh.write(chunk)
+                        written += len(chunk)
+                        attempt = 0
+                except httpx.TransportError as e:
+                    delay = self._retry_delay("get", attempt)
+                    if delay is None:
+                        raise
+                    error = e
+                    log.warning(
+                        "Download interrupted by %r after %d bytes - resuming in %.1f seconds", e, written, delay
+                    )
+                else:
+                    return written
+                finally:
+                    await response.aclose()
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def upload_large_file(self, channel_id, path, chunk_size=None, filename=None, progress=None):
+        """Upload a file to a channel through a resumable upload session.
+
+        See :meth:`Client.upload_large_file`.
+
+        :param channel_id: The ID of the channel to upload to.
+        :param path: Path of the file to upload.
+        :param chunk_size: Size in bytes of the chunks sent to the server.
+        :param filename: Name given to the file, defaults to the basename of ``path``.
+        :param progress: Called as ``progress(bytes_uploaded, file_size, bytes_per_second)``
+            after every chunk.
+        :return: The file info of the uploaded file, whose ``id`` can be attached to a post.
+        """
+        chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+        filename = filename or os.path.basename(path)
+        file_size = os.path.getsize(path)
+
+        session = await self.post(
+            "/api/v4/uploads", options={"channel_id": channel_id, "filename": filename, "file_size": file_size}
+        )
+        upload_id = session["id"]
+        offset = session["file_offset"]
+
+        started = time.monotonic()
+        sent = 0
+        attempt = 0
+        with open(path, "rb") as fh:
+            while True:
+                fh.seek(offset)
+                chunk = fh.read(chunk_size)
+                try:
+                    response = await self.make_request(
+                        "post", f"/api/v4/uploads/{upload_id}", files={"file": (filename, chunk)}
+                    )
+                except (httpx.HTTPError, InvalidMattermostError) as e:
+                    delay = self._upload_retry_delay(attempt, e)
+                    if delay is None:
+                        raise
+                    log.warning(
+                        "Upload %s interrupted by %r at offset %d - resuming in %.1f seconds",
+                        upload_id,
+                        e,
+                        offset,
+                        delay,
+                    )
+                    await asyncio.sleep(delay)
+                    attempt += 1
+                    offset = (await self.get(f"/api/v4/uploads/{upload_id}"))["file_offset"]
+                    continue
+
+                attempt = 0
+                offset += len(chunk)
+                sent += len(chunk)
+                throughput = self._upload_throughput(sent, started)
+                if progress is not None:
+                    progress(offset, file_size, throughput)
+
+                # The server answers 204 No Content until the last chunk is received
+                if response.status_code != 204:
+                    log.info("Upload %s: sent %d bytes at %.2f MiB/s", upload_id, sent, throughput / 2**20)
+                    return self._decode_json(response)
 
     async def close(self):
-        await self.client.aclose()
+        if self._owns_http_client:
+            await self.client.aclose()
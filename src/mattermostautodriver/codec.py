@@ -0,0 +1,88 @@
+"""
+JSON codecs used to encode request bodies and decode responses and websocket events
+"""
+
+import json
+import logging
+
+log = logging.getLogger("mattermostautodriver.api")
+
+
+class JsonCodec:
+    """Codec based on the standard library ``json`` module."""
+
+    name = "json"
+
+    @staticmethod
+    def dumps(obj):
+        # Same output as the encoder HTTPX uses for json= bodies
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+    @staticmethod
+    def loads(data):
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    """Codec based on `orjson <https://github.com/ijl/orjson>`_."""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self.dumps = orjson.dumps
+        self.loads = orjson.loads
+
+
+class UjsonCodec:
+    """Codec based on `ujson <https://github.com/ultrajson/ultrajson>`_."""
+
+    name = "ujson"
+
+    def __init__(self):
+        import ujson
+
+        self._ujson = ujson
+        self.loads = ujson.loads
+
+    def dumps(self, obj):
+        return self._ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode("utf-8")
+
+
+CODECS = {codec.name: codec for codec in (JsonCodec, OrjsonCodec, UjsonCodec)}
+
+# Tried in order for json_codec="auto"
+_FASTEST_FIRST = (OrjsonCodec, UjsonCodec)
+
+
+def get_json_codec(codec=None):
+    """Resolve the ``json_codec`` option into a codec.
+
+    :param codec: None or ``"json"`` for the standard library, ``"orjson"`` or
+        ``"ujson"``, ``"auto"`` for the fastest one installed, or any object
+        with ``dumps(obj) -> bytes`` and ``loads(bytes | str)`` methods.
+        A named codec whose package is not installed falls back to the
+        standard library.
+    """
+    if codec is None:
+        return JsonCodec()
+
+    if not isinstance(codec, str):
+        return codec
+
+    if codec == "auto":
+        candidates = _FASTEST_FIRST
+    elif codec in CODECS:
+        candidates = (CODECS[codec],)
+    else:
+        raise ValueError(f"Unknown json_codec {codec!r}, expected one of {', '.join(['auto', *CODECS])}")
+
+    for candidate in candidates:
+        try:
+            return candidate()
+        except ImportError:
+            if codec != "auto":
+                log.warning("json_codec %r is not installed, falling back to the standard library", codec)
+
+    return JsonCodec()
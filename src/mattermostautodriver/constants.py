@@ -3,3 +3,6 @@ MAX_PER_PAGE = 200
 
 #: Default number of items per page used by the Mattermost API when ``per_page`` is omitted.
 DEFAULT_PER_PAGE = 60
+
+#: Default size in bytes of the chunks read or written by streaming downloads and uploads.
+DEFAULT_CHUNK_SIZE = 1024 * 1024
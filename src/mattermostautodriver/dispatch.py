@@ -0,0 +1,129 @@
+"""
+Concurrent dispatch of websocket events to worker tasks through bounded queues
+"""
+
+import asyncio
+import logging
+import zlib
+
+log = logging.getLogger("mattermostautodriver.websocket")
+
+BLOCK = "block"
+DROP_OLDEST = "drop_oldest"
+
+
+class EventDispatcher:
+    """Hand websocket events over to ``workers`` tasks running the event handler.
+
+    The websocket only waits for an event to be queued, not handled, so a
+    slow handler no longer delays reading the socket and its heartbeats.
+
+    When the queue is full, ``overflow`` decides what happens to a new event:
+
+    - ``"block"`` - wait for room, which stops reading the socket meanwhile
+    - ``"drop_oldest"`` - drop the oldest queued event
+    - a collection of event types, e.g. ``{"typing", "status_change"}`` - drop
+      new events of these types, wait for room for the others
+
+    With ``ordered``, each worker has its own queue and the events of a
+    channel always go to the same one, so they are handled in the order they
+    were received. Otherwise the workers share one queue and events may be
+    handled out of order.
+
+    :param handler: Coroutine function called with each :class:`~mattermostautodriver.events.WebsocketEvent`
+    :param workers: Number of worker tasks
+    :param queue_size: Maximum number of queued events, per worker if ``ordered``
+    :param overflow: What to do when the queue is full, see above
+    :param ordered: Handle the events of each channel in order
+    :param metrics: ``MetricsCollector`` recording the queue depth and dropped events
+    """
+
+    def __init__(self, handler, workers=4, queue_size=1000, overflow=BLOCK, ordered=False, metrics=None):
+        if isinstance(overflow, str) and overflow not in (BLOCK, DROP_OLDEST):
+            raise ValueError(
+                f"Unknown overflow policy {overflow!r}, expected {BLOCK!r}, {DROP_OLDEST!r} or event types"
+            )
+        self._handler = handler
+        self.workers = workers
+        self.queue_size = queue_size
+        self.overflow = overflow if isinstance(overflow, str) else frozenset(overflow)
+        self.ordered = ordered
+        self._metrics = metrics
+        self._queues = []
+        self._tasks = []
+        self._turn = 0
+        self.dropped = 0
+
+    @property
+    def depth(self):
+        """
+        :return: The number of events waiting for a worker
+        """
+        return sum(queue.qsize() for queue in self._queues)
+
+    def start(self):
+        """Start the workers, on the running event loop. Does nothing if they are running."""
+        if self._tasks:
+            return
+        queues = self.workers if self.ordered else 1
+        self._queues = [asyncio.Queue(self.queue_size) for _ in range(queues)]
+        self._tasks = [
+            asyncio.create_task(self._work(self._queues[i % queues]), name=f"mattermost-websocket-worker-{i}")
+            for i in range(self.workers)
+        ]
+        if self._metrics is not None:
+            self._metrics.attach_dispatcher(self)
+
+    async def stop(self):
+        """Cancel the workers. Queued events that were not handled yet are discarded."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self.depth:
+            log.debug("Discarding %d queued websocket events", self.depth)
+        self._queues = []
+
+    def _queue_for(self, event):
+        if len(self._queues) == 1:
+            return self._queues[0]
+        channel_id = event.channel_id
+        if channel_id is None:
+            # Events outside of a channel have no order to keep
+            self._turn += 1
+            return self._queues[self._turn % len(self._queues)]
+        return self._queues[zlib.crc32(channel_id.encode("utf-8")) % len(self._queues)]
+
+    async def put(self, event):
+        """Queue ``event`` for a worker, applying the overflow policy if the queue is full."""
+        queue = self._queue_for(event)
+        if queue.full():
+            if self.overflow == DROP_OLDEST:
+                self._drop(queue.get_nowait())
+                queue.task_done()
+            elif self.overflow != BLOCK and event.event in self.overflow:
+                self._drop(event)
+                return
+        await queue.put(event)
+
+    def _drop(self, event):
+        self.dropped += 1
+        if self._metrics is not None:
+            self._metrics.websocket_dropped(event.event)
+        log.debug("Websocket event queue full, dropped an event")
+
+    async def join(self):
+        """Wait until every queued event was handled."""
+        for queue in self._queues:
+            await queue.join()
+
+    async def _work(self, queue):
+        while True:
+            event = await queue.get()
+            try:
+                await self._handler(event)
+            except Exception:
+                # A failing handler must not stop the worker, the event is lost either way
+                log.exception("Websocket event handler failed")
+            finally:
+                queue.task_done()
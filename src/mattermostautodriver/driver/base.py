@@ -2,6 +2,7 @@ import logging
 import warnings
 
 from ..client import Client
+from ..metrics import MetricsCollector
 
 log = logging.getLogger("mattermostautodriver.api")
 log.setLevel(logging.INFO)
@@ -27,12 +28,36 @@ class BaseDriver:
         "auth": None,
         "keepalive": False,
         "keepalive_delay": 5,
+        "keepalive_max_delay": 60,
         "websocket_kw_args": None,
+        "websocket_workers": 0,
+        "websocket_queue_size": 1000,
+        "websocket_overflow": "block",
+        "websocket_ordered": False,
+        "websocket_session": None,
         "debug": False,
         "http2": False,
         "proxy": None,
         "max_retries": 3,
         "retry_max_sleep": 30,
+        "rate_limit": False,
+        "response_cache": False,
+        "json_codec": None,
+        "connect_timeout": None,
+        "read_timeout": None,
+        "write_timeout": None,
+        "pool_timeout": None,
+        "max_connections": 100,
+        "max_keepalive_connections": 20,
+        "keepalive_expiry": 5.0,
+        "http_client": None,
+        "request_stats": False,
+        "metrics": False,
+        "coalesce_requests": False,
+        "hedge": False,
+        "circuit_breaker": False,
+        "load_balancer": None,
+        "asset_cache": False,
     }
     """
     Required options
@@ -59,6 +84,62 @@ class BaseDriver:
         - retry_max_sleep (30) - upper bound in seconds for a single wait
           between retries. If the server requests a longer wait the request
           fails immediately with ``TooManyRequests``.
+        - rate_limit (False) - throttle requests on the client side to stay
+          within the rate limit reported by the server in its ``X-RateLimit-*``
+          headers. Either True or a ``RateLimiter`` shared between clients.
+        - response_cache (False) - cache GET responses carrying an ``ETag`` and
+          revalidate them with ``If-None-Match``. Either True or a configured
+          ``ResponseCache``.
+        - json_codec (None) - JSON library used to encode request bodies and
+          decode responses and websocket events: ``"json"``, ``"orjson"``,
+          ``"ujson"``, ``"auto"`` for the fastest one installed, or a codec
+          object. None uses the standard library.
+        - connect_timeout, read_timeout, write_timeout, pool_timeout (None) -
+          override ``request_timeout`` for one phase of the request. The pool
+          timeout bounds the wait for a free connection.
+        - max_connections (100), max_keepalive_connections (20),
+          keepalive_expiry (5.0) - limits of the HTTP connection pool.
+        - http_client (None) - an ``httpx.Client`` (``httpx.AsyncClient`` for
+          async drivers) to send requests with instead of creating one. Shares
+          its connection pool between drivers; the driver does not close it.
+          ``http2``, ``proxy``, ``verify``, ``transport`` and the pool limits
+          are then taken from that client.
+        - request_stats (False) - aggregate per endpoint latency histograms and
+          retry counts. Either True or a ``RequestStats`` shared between
+          clients, available as ``driver.client.request_stats``.
+        - metrics (False) - collect request, connection pool and websocket
+          metrics for Prometheus. Either True or a ``MetricsCollector`` shared
+          between drivers, available as ``driver.client.metrics``.
+        - coalesce_requests (False) - send identical concurrent GET requests
+          (same endpoint, parameters and credentials) only once and share the
+          parsed response between the callers.
+        - hedge (False) - send slow ``GET`` requests a second time and use the
+          first response. Either True or a configured ``HedgePolicy``.
+        - circuit_breaker (False) - fail requests to a part of the API with
+          ``CircuitOpen`` after consecutive errors, until it recovers. Either
+          True or a configured ``CircuitBreaker``.
+        - load_balancer (None) - spread requests across the app nodes of a
+          cluster instead of sending them to ``url``. Either a list of base
+          URLs (``"https://app1.example.com:8065"``), balanced round robin, or
+          a configured ``LoadBalancer``. The websocket still connects to ``url``.
+        - asset_cache (False) - keep profile images, emoji, thumbnails, previews
+          and team icons on disk across restarts, revalidated with their
+          ``ETag``. Either True, a directory or a configured ``AssetCache``.
+        - keepalive_max_delay (60) - upper bound in seconds for the wait before
+          reconnecting the websocket, which doubles from ``keepalive_delay``
+          with each failed attempt.
+        - websocket_workers (0) - handle websocket events in this many worker
+          tasks instead of one at a time while reading the socket.
+        - websocket_queue_size (1000) - maximum number of events waiting for a
+          worker (per worker with ``websocket_ordered``).
+        - websocket_overflow ("block") - when the queue is full, wait for room
+          (``"block"``), drop the oldest event (``"drop_oldest"``), or drop new
+          events of the given types (e.g. ``{"typing"}``).
+        - websocket_ordered (False) - handle the events of each channel in order.
+        - websocket_session (None) - an ``aiohttp.ClientSession`` to open the
+          websocket with, e.g. from ``websocket.create_session()``, shared
+          between drivers. The websocket does not close it. By default each
+          websocket keeps its own session across reconnections.
     """
 
     def __init__(self, options=None, client_cls=Client, *args, **kwargs):
@@ -69,6 +150,9 @@ class BaseDriver:
         self.options = self.default_options.copy()
         if options is not None:
             self.options.update(options)
+        if self.options.get("metrics") is True:
+            # Resolved here so the client and the websocket share one collector
+            self.options["metrics"] = MetricsCollector()
         self.driver = self.options
         if self.options["debug"]:
             log.setLevel(logging.DEBUG)
@@ -1,7 +1,10 @@
 import asyncio
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from ..client import AsyncClient, Client
+from ..loader import BULK_LOOKUPS, BatchLoader
 from ..websocket import Websocket
 
 from .endpoint_base import TypedBaseDriverWithEndpoints
@@ -40,7 +43,8 @@ class TypedDriver(TypedBaseDriverWithEndpoints):
 
 
         :param event_handler: The function to handle the websocket events. Takes one argument.
-        :type event_handler: Function(message)
+            Or an ``EventRouter`` passing parsed events to the handlers registered for their type.
+        :type event_handler: Function(message) or EventRouter
         :return: The event loop
         """
         self.websocket = websocket_cls(self.options, self.client.token)
@@ -105,6 +109,55 @@ class TypedDriver(TypedBaseDriverWithEndpoints):
         self.client.cookies = None
         return result
 
+    def run_parallel(self, calls, max_workers=10, progress=None):
+        """
+        Run endpoint calls on ``max_workers`` threads sharing the client and its connection pool.
+
+        A failing call does not abort the others: its exception is returned in
+        place of its result. Rate limited requests are retried by the client
+        up to ``max_retries`` times, and pause the requests of every thread
+        for the wait requested by the server.
+
+        .. code:: python
+
+                users = driver.run_parallel(
+                    [functools.partial(driver.users.get_user, user_id) for user_id in user_ids], max_workers=20
+                )
+
+        :param calls: Iterable of callables without arguments, each making one or more endpoint calls.
+            A generator is consumed lazily.
+        :param max_workers: Number of threads. Threads beyond ``max_connections`` wait for a connection.
+        :param progress: Called with the number of calls done and the total number
+            of calls (None if ``calls`` has no length) after each call, from the worker threads.
+        :return: The results in the order of ``calls``.
+        """
+        total = len(calls) if hasattr(calls, "__len__") else None
+        items = enumerate(calls)
+        lock = threading.Lock()
+        results = {}
+        done = object()
+
+        def worker():
+            while True:
+                # Generators cannot be advanced from several threads at once
+                with lock:
+                    index, call = next(items, (None, done))
+                if call is done:
+                    return
+                try:
+                    result = call()
+                except Exception as e:
+                    result = e
+                with lock:
+                    results[index] = result
+                    if progress is not None:
+                        progress(len(results), total)
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mattermost-parallel") as executor:
+            for worker_done in [executor.submit(worker) for _ in range(max_workers)]:
+                worker_done.result()
+        return [results[index] for index in range(len(results))]
+
     def close(self):
         self.client.close()
 
@@ -112,6 +165,7 @@ class TypedDriver(TypedBaseDriverWithEndpoints):
 class AsyncTypedDriver(TypedBaseDriverWithEndpoints):
     def __init__(self, options=None, client_cls=AsyncClient, *args, **kwargs):
         super().__init__(options, client_cls, *args, **kwargs)
+        self._loaders = {}
 
     async def __aenter__(self):
         await self.client.__aenter__()
@@ -142,7 +196,8 @@ class AsyncTypedDriver(TypedBaseDriverWithEndpoints):
 
 
         :param event_handler: The function to handle the websocket events. Takes one argument.
-        :type event_handler: Function(message)
+            Or an ``EventRouter`` passing parsed events to the handlers registered for their type.
+        :type event_handler: Function(message) or EventRouter
         :return: coroutine
         """
         self.websocket = websocket_cls(self.options, self.client.token)
@@ -205,5 +260,85 @@ class AsyncTypedDriver(TypedBaseDriverWithEndpoints):
         self.client.cookies = None
         return result
 
+    async def gather_bounded(self, calls, concurrency=10):
+        """
+        Await endpoint calls with at most ``concurrency`` of them in flight at once.
+
+        A failing call does not abort the others: its exception is returned in
+        place of its result. Rate limited requests are retried by the client
+        up to ``max_retries`` times, and pause every request of the client,
+        including those of the other calls, for the wait requested by the
+        server.
+
+        .. code:: python
+
+                users = await driver.gather_bounded(
+                    (driver.users.get_user(user_id) for user_id in user_ids), concurrency=20
+                )
+
+        :param calls: Iterable of awaitables, e.g. coroutines returned by endpoint methods.
+            A generator is consumed lazily, creating calls as they are started.
+        :param concurrency: Maximum number of calls in flight.
+        :return: The results in the order of ``calls``.
+        """
+
+        async def run(call):
+            return await call
+
+        return await self._run_bounded(run, calls, concurrency)
+
+    async def map(self, fn, items, concurrency=10):
+        """
+        Call the coroutine function ``fn`` for each of ``items``, with at most
+        ``concurrency`` calls in flight at once.
+
+        Behaves like :meth:`gather_bounded`.
+
+        .. code:: python
+
+                users = await driver.map(driver.users.get_user, user_ids, concurrency=20)
+
+        :return: The results in the order of ``items``.
+        """
+        return await self._run_bounded(fn, items, concurrency)
+
+    async def _run_bounded(self, fn, items, concurrency):
+        items = enumerate(items)
+        results = {}
+
+        async def worker():
+            # Workers share the iterator, so each item is taken by exactly one of them
+            for index, item in items:
+                try:
+                    results[index] = await fn(item)
+                except Exception as e:
+                    results[index] = e
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return [results[index] for index in range(len(results))]
+
+    def loader(self, name):
+        """
+        Return the shared :class:`~mattermostautodriver.loader.BatchLoader` named ``name``,
+        batching individual lookups made at the same time into one bulk request.
+
+        .. code:: python
+
+                async def on_post(post):
+                    author = await driver.loader("users").load(post["user_id"])
+
+        :param name: One of ``"users"``, ``"users_by_username"``, ``"posts"``,
+            ``"reactions"``, ``"statuses"``, ``"emojis"``, ``"roles"`` and ``"groups"``,
+            see :data:`~mattermostautodriver.loader.BULK_LOOKUPS`.
+        """
+        loader = self._loaders.get(name)
+        if loader is None:
+            try:
+                endpoint, method, key = BULK_LOOKUPS[name]
+            except KeyError:
+                raise ValueError(f"Unknown loader {name!r}, expected one of {', '.join(BULK_LOOKUPS)}") from None
+            loader = self._loaders[name] = BatchLoader(getattr(getattr(self, endpoint), method), key=key)
+        return loader
+
     async def close(self):
         await self.client.close()
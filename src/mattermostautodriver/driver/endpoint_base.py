@@ -1,146 +1,246 @@
+from __future__ import annotations
+import importlib
+from typing import TYPE_CHECKING
 from .base import BaseDriver
 from ..client import Client
-from ..endpoints.access_control import AccessControl
-from ..endpoints.agents import Agents
-from ..endpoints.ai import Ai
-from ..endpoints.audit_logs import AuditLogs
-from ..endpoints.authentication import Authentication
-from ..endpoints.boards import Boards
-from ..endpoints.bookmarks import Bookmarks
-from ..endpoints.bots import Bots
-from ..endpoints.brand import Brand
-from ..endpoints.channels import Channels
-from ..endpoints.cloud import Cloud
-from ..endpoints.cluster import Cluster
-from ..endpoints.commands import Commands
-from ..endpoints.compliance import Compliance
-from ..endpoints.conditions import Conditions
-from ..endpoints.content_flagging import ContentFlagging
-from ..endpoints.custom_profile_attributes import CustomProfileAttributes
-from ..endpoints.data_retention import DataRetention
-from ..endpoints.drafts import Drafts
-from ..endpoints.elasticsearch import Elasticsearch
-from ..endpoints.emoji import Emoji
-from ..endpoints.exports import Exports
-from ..endpoints.files import Files
-from ..endpoints.filtering import Filtering
-from ..endpoints.group_message import GroupMessage
-from ..endpoints.groups import Groups
-from ..endpoints.imports import Imports
-from ..endpoints.integration_actions import IntegrationActions
-from ..endpoints.internal import Internal
-from ..endpoints.ip import Ip
-from ..endpoints.jobs import Jobs
-from ..endpoints.ldap import Ldap
-from ..endpoints.logs import Logs
-from ..endpoints.metrics import Metrics
-from ..endpoints.migrate import Migrate
-from ..endpoints.o_auth import OAuth
-from ..endpoints.oauth import Oauth
-from ..endpoints.outgoing_connections import OutgoingConnections
-from ..endpoints.outgoing_oauth_connections import OutgoingOauthConnections
-from ..endpoints.permissions import Permissions
-from ..endpoints.playbook_autofollows import PlaybookAutofollows
-from ..endpoints.playbook_runs import PlaybookRuns
-from ..endpoints.playbooks import Playbooks
-from ..endpoints.plugins import Plugins
-from ..endpoints.posts import Posts
-from ..endpoints.preferences import Preferences
-from ..endpoints.properties import Properties
-from ..endpoints.reactions import Reactions
-from ..endpoints.recaps import Recaps
-from ..endpoints.remote_clusters import RemoteClusters
-from ..endpoints.reports import Reports
-from ..endpoints.roles import Roles
-from ..endpoints.root import Root
-from ..endpoints.saml import Saml
-from ..endpoints.scheduled_post import ScheduledPost
-from ..endpoints.schemes import Schemes
-from ..endpoints.search import Search
-from ..endpoints.shared_channels import SharedChannels
-from ..endpoints.status import Status
-from ..endpoints.system import System
-from ..endpoints.teams import Teams
-from ..endpoints.terms_of_service import TermsOfService
-from ..endpoints.threads import Threads
-from ..endpoints.timeline import Timeline
-from ..endpoints.uploads import Uploads
-from ..endpoints.usage import Usage
-from ..endpoints.users import Users
-from ..endpoints.views import Views
-from ..endpoints.webhooks import Webhooks
+
+if TYPE_CHECKING:
+    from ..endpoints.access_control import AccessControl
+    from ..endpoints.agents import Agents
+    from ..endpoints.ai import Ai
+    from ..endpoints.audit_logs import AuditLogs
+    from ..endpoints.authentication import Authentication
+    from ..endpoints.boards import Boards
+    from ..endpoints.bookmarks import Bookmarks
+    from ..endpoints.bots import Bots
+    from ..endpoints.brand import Brand
+    from ..endpoints.channels import Channels
+    from ..endpoints.cloud import Cloud
+    from ..endpoints.cluster import Cluster
+    from ..endpoints.commands import Commands
+    from ..endpoints.compliance import Compliance
+    from ..endpoints.conditions import Conditions
+    from ..endpoints.content_flagging import ContentFlagging
+    from ..endpoints.custom_profile_attributes import CustomProfileAttributes
+    from ..endpoints.data_retention import DataRetention
+    from ..endpoints.drafts import Drafts
+    from ..endpoints.elasticsearch import Elasticsearch
+    from ..endpoints.emoji import Emoji
+    from ..endpoints.exports import Exports
+    from ..endpoints.files import Files
+    from ..endpoints.filtering import Filtering
+    from ..endpoints.group_message import GroupMessage
+    from ..endpoints.groups import Groups
+    from ..endpoints.imports import Imports
+    from ..endpoints.integration_actions import IntegrationActions
+    from ..endpoints.internal import Internal
+    from ..endpoints.ip import Ip
+    from ..endpoints.jobs import Jobs
+    from ..endpoints.ldap import Ldap
+    from ..endpoints.logs import Logs
+    from ..endpoints.metrics import Metrics
+    from ..endpoints.migrate import Migrate
+    from ..endpoints.o_auth import OAuth
+    from ..endpoints.oauth import Oauth
+    from ..endpoints.outgoing_connections import OutgoingConnections
+    from ..endpoints.outgoing_oauth_connections import OutgoingOauthConnections
+    from ..endpoints.permissions import Permissions
+    from ..endpoints.playbook_autofollows import PlaybookAutofollows
+    from ..endpoints.playbook_runs import PlaybookRuns
+    from ..endpoints.playbooks import Playbooks
+    from ..endpoints.plugins import Plugins
+    from ..endpoints.posts import Posts
+    from ..endpoints.preferences import Preferences
+    from ..endpoints.properties import Properties
+    from ..endpoints.reactions import Reactions
+    from ..endpoints.recaps import Recaps
+    from ..endpoints.remote_clusters import RemoteClusters
+    from ..endpoints.reports import Reports
+    from ..endpoints.roles import Roles
+    from ..endpoints.root import Root
+    from ..endpoints.saml import Saml
+    from ..endpoints.scheduled_post import ScheduledPost
+    from ..endpoints.schemes import Schemes
+    from ..endpoints.search import Search
+    from ..endpoints.shared_channels import SharedChannels
+    from ..endpoints.status import Status
+    from ..endpoints.system import System
+    from ..endpoints.teams import Teams
+    from ..endpoints.terms_of_service import TermsOfService
+    from ..endpoints.threads import Threads
+    from ..endpoints.timeline import Timeline
+    from ..endpoints.uploads import Uploads
+    from ..endpoints.usage import Usage
+    from ..endpoints.users import Users
+    from ..endpoints.views import Views
+    from ..endpoints.webhooks import Webhooks
 
 
 class TypedBaseDriverWithEndpoints(BaseDriver):
+    """
+    Endpoint groups (``users``, ``channels``, ...) are imported and
+    instantiated on first access, so creating a driver only pays for the
+    endpoints it uses.
+    """
+
+    access_control: AccessControl
+    agents: Agents
+    ai: Ai
+    audit_logs: AuditLogs
+    authentication: Authentication
+    boards: Boards
+    bookmarks: Bookmarks
+    bots: Bots
+    brand: Brand
+    channels: Channels
+    cloud: Cloud
+    cluster: Cluster
+    commands: Commands
+    compliance: Compliance
+    conditions: Conditions
+    content_flagging: ContentFlagging
+    custom_profile_attributes: CustomProfileAttributes
+    data_retention: DataRetention
+    drafts: Drafts
+    elasticsearch: Elasticsearch
+    emoji: Emoji
+    exports: Exports
+    files: Files
+    filtering: Filtering
+    group_message: GroupMessage
+    groups: Groups
+    imports: Imports
+    integration_actions: IntegrationActions
+    internal: Internal
+    ip: Ip
+    jobs: Jobs
+    ldap: Ldap
+    logs: Logs
+    metrics: Metrics
+    migrate: Migrate
+    o_auth: OAuth
+    oauth: Oauth
+    outgoing_connections: OutgoingConnections
+    outgoing_oauth_connections: OutgoingOauthConnections
+    permissions: Permissions
+    playbook_autofollows: PlaybookAutofollows
+    playbook_runs: PlaybookRuns
+    playbooks: Playbooks
+    plugins: Plugins
+    posts: Posts
+    preferences: Preferences
+    properties: Properties
+    reactions: Reactions
+    recaps: Recaps
+    remote_clusters: RemoteClusters
+    reports: Reports
+    roles: Roles
+    root: Root
+    saml: Saml
+    scheduled_post: ScheduledPost
+    schemes: Schemes
+    search: Search
+    shared_channels: SharedChannels
+    status: Status
+    system: System
+    teams: Teams
+    terms_of_service: TermsOfService
+    threads: Threads
+    timeline: Timeline
+    uploads: Uploads
+    usage: Usage
+    users: Users
+    views: Views
+    webhooks: Webhooks
+    _lazy_endpoints = {
+        "access_control": ("access_control", "AccessControl"),
+        "agents": ("agents", "Agents"),
+        "ai": ("ai", "Ai"),
+        "audit_logs": ("audit_logs", "AuditLogs"),
+        "authentication": ("authentication", "Authentication"),
+        "boards": ("boards", "Boards"),
+        "bookmarks": ("bookmarks", "Bookmarks"),
+        "bots": ("bots", "Bots"),
+        "brand": ("brand", "Brand"),
+        "channels": ("channels", "Channels"),
+        "cloud": ("cloud", "Cloud"),
+        "cluster": ("cluster", "Cluster"),
+        "commands": ("commands", "Commands"),
+        "compliance": ("compliance", "Compliance"),
+        "conditions": ("conditions", "Conditions"),
+        "content_flagging": ("content_flagging", "ContentFlagging"),
+        "custom_profile_attributes": ("custom_profile_attributes", "CustomProfileAttributes"),
+        "data_retention": ("data_retention", "DataRetention"),
+        "drafts": ("drafts", "Drafts"),
+        "elasticsearch": ("elasticsearch", "Elasticsearch"),
+        "emoji": ("emoji", "Emoji"),
+        "exports": ("exports", "Exports"),
+        "files": ("files", "Files"),
+        "filtering": ("filtering", "Filtering"),
+        "group_message": ("group_message", "GroupMessage"),
+        "groups": ("groups", "Groups"),
+        "imports": ("imports", "Imports"),
+        "integration_actions": ("integration_actions", "IntegrationActions"),
+        "internal": ("internal", "Internal"),
+        "ip": ("ip", "Ip"),
+        "jobs": ("jobs", "Jobs"),
+        "ldap": ("ldap", "Ldap"),
+        "logs": ("logs", "Logs"),
+        "metrics": ("metrics", "Metrics"),
+        "migrate": ("migrate", "Migrate"),
+        "o_auth": ("o_auth", "OAuth"),
+        "oauth": ("oauth", "Oauth"),
+        "outgoing_connections": ("outgoing_connections", "OutgoingConnections"),
+        "outgoing_oauth_connections": ("outgoing_oauth_connections", "OutgoingOauthConnections"),
+        "permissions": ("permissions", "Permissions"),
+        "playbook_autofollows": ("playbook_autofollows", "PlaybookAutofollows"),
+        "playbook_runs": ("playbook_runs", "PlaybookRuns"),
+        "playbooks": ("playbooks", "Playbooks"),
+        "plugins": ("plugins", "Plugins"),
+        "posts": ("posts", "Posts"),
+        "preferences": ("preferences", "Preferences"),
+        "properties": ("properties", "Properties"),
+        "reactions": ("reactions", "Reactions"),
+        "recaps": ("recaps", "Recaps"),
+        "remote_clusters": ("remote_clusters", "RemoteClusters"),
+        "reports": ("reports", "Reports"),
+        "roles": ("roles", "Roles"),
+        "root": ("root", "Root"),
+        "saml": ("saml", "Saml"),
+        "scheduled_post": ("scheduled_post", "ScheduledPost"),
+        "schemes": ("schemes", "Schemes"),
+        "search": ("search", "Search"),
+        "shared_channels": ("shared_channels", "SharedChannels"),
+        "status": ("status", "Status"),
+        "system": ("system", "System"),
+        "teams": ("teams", "Teams"),
+        "terms_of_service": ("terms_of_service", "TermsOfService"),
+        "threads": ("threads", "Threads"),
+        "timeline": ("timeline", "Timeline"),
+        "uploads": ("uploads", "Uploads"),
+        "usage": ("usage", "Usage"),
+        "users": ("users", "Users"),
+        "views": ("views", "Views"),
+        "webhooks": ("webhooks", "Webhooks"),
+    }
 
     def __init__(self, options=None, client_cls=Client, *args, **kwargs):
         super().__init__(options, client_cls, *args, **kwargs)
-        self.access_control = AccessControl(self.client)
-        self.agents = Agents(self.client)
-        self.ai = Ai(self.client)
-        self.audit_logs = AuditLogs(self.client)
-        self.authentication = Authentication(self.client)
-        self.boards = Boards(self.client)
-        self.bookmarks = Bookmarks(self.client)
-        self.bots = Bots(self.client)
-        self.brand = Brand(self.client)
-        self.channels = Channels(self.client)
-        self.cloud = Cloud(self.client)
-        self.cluster = Cluster(self.client)
-        self.commands = Commands(self.client)
-        self.compliance = Compliance(self.client)
-        self.conditions = Conditions(self.client)
-        self.content_flagging = ContentFlagging(self.client)
-        self.custom_profile_attributes = CustomProfileAttributes(self.client)
-        self.data_retention = DataRetention(self.client)
-        self.drafts = Drafts(self.client)
-        self.elasticsearch = Elasticsearch(self.client)
-        self.emoji = Emoji(self.client)
-        self.exports = Exports(self.client)
-        self.files = Files(self.client)
-        self.filtering = Filtering(self.client)
-        self.group_message = GroupMessage(self.client)
-        self.groups = Groups(self.client)
-        self.imports = Imports(self.client)
-        self.integration_actions = IntegrationActions(self.client)
-        self.internal = Internal(self.client)
-        self.ip = Ip(self.client)
-        self.jobs = Jobs(self.client)
-        self.ldap = Ldap(self.client)
-        self.logs = Logs(self.client)
-        self.metrics = Metrics(self.client)
-        self.migrate = Migrate(self.client)
-        self.o_auth = OAuth(self.client)
-        self.oauth = Oauth(self.client)
-        self.outgoing_connections = OutgoingConnections(self.client)
-        self.outgoing_oauth_connections = OutgoingOauthConnections(self.client)
-        self.permissions = Permissions(self.client)
-        self.playbook_autofollows = PlaybookAutofollows(self.client)
-        self.playbook_runs = PlaybookRuns(self.client)
-        self.playbooks = Playbooks(self.client)
-        self.plugins = Plugins(self.client)
-        self.posts = Posts(self.client)
-        self.preferences = Preferences(self.client)
-        self.properties = Properties(self.client)
-        self.reactions = Reactions(self.client)
-        self.recaps = Recaps(self.client)
-        self.remote_clusters = RemoteClusters(self.client)
-        self.reports = Reports(self.client)
-        self.roles = Roles(self.client)
-        self.root = Root(self.client)
-        self.saml = Saml(self.client)
-        self.scheduled_post = ScheduledPost(self.client)
-        self.schemes = Schemes(self.client)
-        self.search = Search(self.client)
-        self.shared_channels = SharedChannels(self.client)
-        self.status = Status(self.client)
-        self.system = System(self.client)
-        self.teams = Teams(self.client)
-        self.terms_of_service = TermsOfService(self.client)
-        self.threads = Threads(self.client)
-        self.timeline = Timeline(self.client)
-        self.uploads = Uploads(self.client)
-        self.usage = Usage(self.client)
-        self.users = Users(self.client)
-        self.views = Views(self.client)
-        self.webhooks = Webhooks(self.client)
+
+    def __getattr__(self, name):
+        """Import and instantiate an endpoint group on first access.
+
+        The instance is stored as an attribute, so later lookups find it
+        directly without reaching ``__getattr__`` again.
+        """
+        try:
+            module_name, class_name = type(self)._lazy_endpoints[name]
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}") from None
+        endpoint_cls = getattr(importlib.import_module(f"..endpoints.{module_name}", __package__), class_name)
+        endpoint = endpoint_cls(self.client)
+        setattr(self, name, endpoint)
+        return endpoint
+
+    def __dir__(self):
+        return sorted({*super().__dir__(), *type(self)._lazy_endpoints})
@@ -1,4 +1,5 @@
-from typing import IO, Mapping
+import os
+from typing import IO, Any, Callable, Mapping
 
 # File upload types accepted by HTTPX: raw content, or tuples of
 # (filename, content), (filename, content, content_type) or
@@ -11,6 +12,14 @@ FileType = (
     | tuple[str | None, FileContent, str | None, Mapping[str, str]]
 )
 
+# Download destinations accepted by client.download(): a filesystem path
+# or a binary file object opened for writing
+DownloadTarget = str | os.PathLike | IO[bytes]
+
+# Checkpoint callbacks of cursor paginated iterators, called with the
+# cursor of the next page
+CursorCallback = Callable[[str], Any]
+
 
 class Base:
     def __init__(self, client):
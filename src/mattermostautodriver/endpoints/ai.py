@@ -31,6 +31,17 @@ class Ai(Base):
         __params = {"page": page, "per_page": per_page}
         return self.client.get("""/api/v4/recaps""", params=__params)
 
+    def iter_recaps_for_user(self, per_page: int | None = None, prefetch: bool | None = False):
+        """Get current user's recaps, iterating over the items of all pages
+
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (ai - GetRecapsForUser) <https://developers.mattermost.com/api-documentation/#/operations/GetRecapsForUser>`_
+
+        """
+        return self.client.paginate("""/api/v4/recaps""", per_page=per_page, prefetch=prefetch)
+
     def mark_recaps_as_viewed(self):
         """Mark all of the authenticated user's finished recaps as viewed
         `Read in Mattermost API docs (ai - MarkRecapsAsViewed) <https://developers.mattermost.com/api-documentation/#/operations/MarkRecapsAsViewed>`_
@@ -54,6 +54,26 @@ class Bots(Base):
         }
         return self.client.get("""/api/v4/bots""", params=__params)
 
+    def iter_bots(
+        self,
+        include_deleted: bool | None = None,
+        only_orphaned: bool | None = None,
+        per_page: int | None = None,
+        prefetch: bool | None = False,
+    ):
+        """Get bots, iterating over the items of all pages
+
+        include_deleted: If deleted bots should be returned.
+        only_orphaned: When true, only orphaned bots will be returned. A bot is considered orphaned if its owner has been deactivated.
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (bots - GetBots) <https://developers.mattermost.com/api-documentation/#/operations/GetBots>`_
+
+        """
+        __params = {"include_deleted": include_deleted, "only_orphaned": only_orphaned}
+        return self.client.paginate("""/api/v4/bots""", params=__params, per_page=per_page, prefetch=prefetch)
+
     def patch_bot(
         self, bot_user_id: str, username: str, display_name: str | None = None, description: str | None = None
     ):
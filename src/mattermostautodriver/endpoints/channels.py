@@ -52,6 +52,39 @@ class Channels(Base):
         }
         return self.client.get("""/api/v4/channels""", params=__params)
 
+    def iter_all_channels(
+        self,
+        not_associated_to_group: str | None = None,
+        exclude_default_channels: bool | None = False,
+        include_deleted: bool | None = False,
+        include_total_count: bool | None = False,
+        exclude_policy_constrained: bool | None = False,
+        per_page: int | None = None,
+        prefetch: bool | None = False,
+    ):
+        """Get a list of all channels, iterating over the items of all pages
+
+        not_associated_to_group: A group id to exclude channels that are associated with that group via GroupChannel records. This can also be left blank with ``not_associated_to_group=``.
+        exclude_default_channels: Whether to exclude default channels (ex Town Square, Off-Topic) from the results.
+        include_deleted: Include channels that have been archived. This correlates to the ``DeleteAt`` flag being set in the database.
+        include_total_count: Appends a total count of returned channels inside the response object - ex: ``{ "channels": [], "total_count" : 0 }``.
+        exclude_policy_constrained: If set to true, channels which are part of a data retention policy will be excluded. The ``sysconsole_read_compliance`` permission is required to use this parameter.
+        *Minimum server version*: 5.35
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (channels - GetAllChannels) <https://developers.mattermost.com/api-documentation/#/operations/GetAllChannels>`_
+
+        """
+        __params = {
+            "not_associated_to_group": not_associated_to_group,
+            "exclude_default_channels": exclude_default_channels,
+            "include_deleted": include_deleted,
+            "include_total_count": include_total_count,
+            "exclude_policy_constrained": exclude_policy_constrained,
+        }
+        return self.client.paginate("""/api/v4/channels""", params=__params, per_page=per_page, prefetch=prefetch)
+
     def create_channel(
         self,
         team_id: str,
@@ -367,6 +400,18 @@ class Channels(Base):
         __params = {"page": page, "per_page": per_page}
         return self.client.get(f"/api/v4/teams/{team_id}/channels", params=__params)
 
+    def iter_public_channels_for_team(self, team_id: str, per_page: int | None = None, prefetch: bool | None = False):
+        """Get public channels, iterating over the items of all pages
+
+        team_id: Team GUID
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (channels - GetPublicChannelsForTeam) <https://developers.mattermost.com/api-documentation/#/operations/GetPublicChannelsForTeam>`_
+
+        """
+        return self.client.paginate(f"/api/v4/teams/{team_id}/channels", per_page=per_page, prefetch=prefetch)
+
     def get_private_channels_for_team(self, team_id: str, page: int | None = 0, per_page: int | None = 60):
         """Get private channels
 
@@ -380,6 +425,18 @@ class Channels(Base):
         __params = {"page": page, "per_page": per_page}
         return self.client.get(f"/api/v4/teams/{team_id}/channels/private", params=__params)
 
+    def iter_private_channels_for_team(self, team_id: str, per_page: int | None = None, prefetch: bool | None = False):
+        """Get private channels, iterating over the items of all pages
+
+        team_id: Team GUID
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (channels - GetPrivateChannelsForTeam) <https://developers.mattermost.com/api-documentation/#/operations/GetPrivateChannelsForTeam>`_
+
+        """
+        return self.client.paginate(f"/api/v4/teams/{team_id}/channels/private", per_page=per_page, prefetch=prefetch)
+
     def get_recommended_channels_for_team(self, team_id: str):
         """Get recommended public channels for the current user
 
@@ -403,6 +460,18 @@ class Channels(Base):
         __params = {"page": page, "per_page": per_page}
         return self.client.get(f"/api/v4/teams/{team_id}/channels/deleted", params=__params)
 
+    def iter_deleted_channels_for_team(self, team_id: str, per_page: int | None = None, prefetch: bool | None = False):
+        """Get deleted channels, iterating over the items of all pages
+
+        team_id: Team GUID
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (channels - GetDeletedChannelsForTeam) <https://developers.mattermost.com/api-documentation/#/operations/GetDeletedChannelsForTeam>`_
+
+        """
+        return self.client.paginate(f"/api/v4/teams/{team_id}/channels/deleted", per_page=per_page, prefetch=prefetch)
+
     def autocomplete_channels_for_team(self, team_id: str, name: str):
         """Autocomplete channels
 
@@ -490,6 +559,18 @@ class Channels(Base):
         __params = {"page": page, "per_page": per_page}
         return self.client.get(f"/api/v4/channels/{channel_id}/members", params=__params)
 
+    def iter_channel_members(self, channel_id: str, per_page: int | None = None, prefetch: bool | None = False):
+        """Get channel members, iterating over the items of all pages
+
+        channel_id: Channel GUID
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (channels - GetChannelMembers) <https://developers.mattermost.com/api-documentation/#/operations/GetChannelMembers>`_
+
+        """
+        return self.client.paginate(f"/api/v4/channels/{channel_id}/members", per_page=per_page, prefetch=prefetch)
+
     def add_channel_member(
         self,
         channel_id: str,
@@ -725,6 +806,27 @@ class Channels(Base):
         __params = {"group_ids": group_ids, "page": page, "per_page": per_page}
         return self.client.get(f"/api/v4/channels/{channel_id}/members_minus_group_members", params=__params)
 
+    def iter_channel_members_minus_group_members(
+        self, channel_id: str, group_ids: str = "", per_page: int | None = None, prefetch: bool | None = False
+    ):
+        """Channel members minus group members, iterating over the items of all pages
+
+        channel_id: Channel GUID
+        group_ids: A comma-separated list of group ids.
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (channels - ChannelMembersMinusGroupMembers) <https://developers.mattermost.com/api-documentation/#/operations/ChannelMembersMinusGroupMembers>`_
+
+        """
+        __params = {"group_ids": group_ids}
+        return self.client.paginate(
+            f"/api/v4/channels/{channel_id}/members_minus_group_members",
+            params=__params,
+            per_page=per_page,
+            prefetch=prefetch,
+        )
+
     def get_channel_member_counts_by_group(self, channel_id: str, include_timezones: bool | None = False):
         """Channel members counts for each group that has atleast one member in the channel
 
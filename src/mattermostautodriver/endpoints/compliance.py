@@ -1,4 +1,4 @@
-from ._base import Base, FileType
+from ._base import Base, DownloadTarget, FileType
 from typing import Any
 
 __all__ = ["Compliance"]
@@ -25,6 +25,17 @@ class Compliance(Base):
         __params = {"page": page, "per_page": per_page}
         return self.client.get("""/api/v4/compliance/reports""", params=__params)
 
+    def iter_compliance_reports(self, per_page: int | None = None, prefetch: bool | None = False):
+        """Get reports, iterating over the items of all pages
+
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (compliance - GetComplianceReports) <https://developers.mattermost.com/api-documentation/#/operations/GetComplianceReports>`_
+
+        """
+        return self.client.paginate("""/api/v4/compliance/reports""", per_page=per_page, prefetch=prefetch)
+
     def get_compliance_report(self, report_id: str):
         """Get a report
 
@@ -44,3 +55,17 @@ class Compliance(Base):
 
         """
         return self.client.get(f"/api/v4/compliance/reports/{report_id}/download")
+
+    def download_compliance_report_to(self, report_id: str, destination: DownloadTarget, chunk_size: int | None = None):
+        """Download a report, streamed to destination
+
+        report_id: Compliance report GUID
+        destination: A path or a binary file object opened for writing
+        chunk_size: Size in bytes of the chunks written to destination
+
+        `Read in Mattermost API docs (compliance - DownloadComplianceReport) <https://developers.mattermost.com/api-documentation/#/operations/DownloadComplianceReport>`_
+
+        """
+        return self.client.download(
+            f"/api/v4/compliance/reports/{report_id}/download", destination, chunk_size=chunk_size
+        )
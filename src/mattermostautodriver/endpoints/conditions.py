@@ -19,6 +19,20 @@ class Conditions(Base):
         __params = {"page": page, "per_page": per_page}
         return self.client.get(f"/plugins/playbooks/api/v0/playbooks/{id}/conditions", params=__params)
 
+    def iter_playbook_conditions(self, id: str, per_page: int | None = None, prefetch: bool | None = False):
+        """List playbook conditions, iterating over the items of all pages
+
+        id: ID of the playbook to retrieve conditions from.
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (conditions - getPlaybookConditions) <https://developers.mattermost.com/api-documentation/#/operations/getPlaybookConditions>`_
+
+        """
+        return self.client.paginate(
+            f"/plugins/playbooks/api/v0/playbooks/{id}/conditions", per_page=per_page, prefetch=prefetch
+        )
+
     def create_playbook_condition(self, id: str, options: Any | None = None):
         """Create a playbook condition
 
@@ -63,3 +77,17 @@ class Conditions(Base):
         """
         __params = {"page": page, "per_page": per_page}
         return self.client.get(f"/plugins/playbooks/api/v0/runs/{id}/conditions", params=__params)
+
+    def iter_run_conditions(self, id: str, per_page: int | None = None, prefetch: bool | None = False):
+        """List run conditions, iterating over the items of all pages
+
+        id: ID of the run to retrieve conditions from.
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (conditions - getRunConditions) <https://developers.mattermost.com/api-documentation/#/operations/getRunConditions>`_
+
+        """
+        return self.client.paginate(
+            f"/plugins/playbooks/api/v0/runs/{id}/conditions", per_page=per_page, prefetch=prefetch
+        )
@@ -19,6 +19,20 @@ class DataRetention(Base):
         __params = {"page": page, "per_page": per_page}
         return self.client.get(f"/api/v4/users/{user_id}/data_retention/team_policies", params=__params)
 
+    def iter_team_policies_for_user(self, user_id: str, per_page: int | None = None, prefetch: bool | None = False):
+        """Get the policies which are applied to a user's teams, iterating over the items of all pages
+
+        user_id: The ID of the user. This can also be "me" which will point to the current user.
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (data_retention - GetTeamPoliciesForUser) <https://developers.mattermost.com/api-documentation/#/operations/GetTeamPoliciesForUser>`_
+
+        """
+        return self.client.paginate(
+            f"/api/v4/users/{user_id}/data_retention/team_policies", per_page=per_page, prefetch=prefetch
+        )
+
     def get_channel_policies_for_user(self, user_id: str, page: int | None = 0, per_page: int | None = 60):
         """Get the policies which are applied to a user's channels
 
@@ -32,6 +46,20 @@ class DataRetention(Base):
         __params = {"page": page, "per_page": per_page}
         return self.client.get(f"/api/v4/users/{user_id}/data_retention/channel_policies", params=__params)
 
+    def iter_channel_policies_for_user(self, user_id: str, per_page: int | None = None, prefetch: bool | None = False):
+        """Get the policies which are applied to a user's channels, iterating over the items of all pages
+
+        user_id: The ID of the user. This can also be "me" which will point to the current user.
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (data_retention - GetChannelPoliciesForUser) <https://developers.mattermost.com/api-documentation/#/operations/GetChannelPoliciesForUser>`_
+
+        """
+        return self.client.paginate(
+            f"/api/v4/users/{user_id}/data_retention/channel_policies", per_page=per_page, prefetch=prefetch
+        )
+
     def get_data_retention_policy(self):
         """Get the global data retention policy
         `Read in Mattermost API docs (data_retention - GetDataRetentionPolicy) <https://developers.mattermost.com/api-documentation/#/operations/GetDataRetentionPolicy>`_
@@ -58,6 +86,17 @@ class DataRetention(Base):
         __params = {"page": page, "per_page": per_page}
         return self.client.get("""/api/v4/data_retention/policies""", params=__params)
 
+    def iter_data_retention_policies(self, per_page: int | None = None, prefetch: bool | None = False):
+        """Get the granular data retention policies, iterating over the items of all pages
+
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (data_retention - GetDataRetentionPolicies) <https://developers.mattermost.com/api-documentation/#/operations/GetDataRetentionPolicies>`_
+
+        """
+        return self.client.paginate("""/api/v4/data_retention/policies""", per_page=per_page, prefetch=prefetch)
+
     def create_data_retention_policy(self, options: Any):
         """Create a new granular data retention policy
         `Read in Mattermost API docs (data_retention - CreateDataRetentionPolicy) <https://developers.mattermost.com/api-documentation/#/operations/CreateDataRetentionPolicy>`_
@@ -108,6 +147,22 @@ class DataRetention(Base):
         __params = {"page": page, "per_page": per_page}
         return self.client.get(f"/api/v4/data_retention/policies/{policy_id}/teams", params=__params)
 
+    def iter_teams_for_retention_policy(
+        self, policy_id: str, per_page: int | None = None, prefetch: bool | None = False
+    ):
+        """Get the teams for a granular data retention policy, iterating over the items of all pages
+
+        policy_id: The ID of the granular retention policy.
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (data_retention - GetTeamsForRetentionPolicy) <https://developers.mattermost.com/api-documentation/#/operations/GetTeamsForRetentionPolicy>`_
+
+        """
+        return self.client.paginate(
+            f"/api/v4/data_retention/policies/{policy_id}/teams", per_page=per_page, prefetch=prefetch
+        )
+
     def add_teams_to_retention_policy(self, policy_id: str, options: list[str]):
         """Add teams to a granular data retention policy
 
@@ -153,6 +208,22 @@ class DataRetention(Base):
         __params = {"page": page, "per_page": per_page}
         return self.client.get(f"/api/v4/data_retention/policies/{policy_id}/channels", params=__params)
 
+    def iter_channels_for_retention_policy(
+        self, policy_id: str, per_page: int | None = None, prefetch: bool | None = False
+    ):
+        """Get the channels for a granular data retention policy, iterating over the items of all pages
+
+        policy_id: The ID of the granular retention policy.
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (data_retention - GetChannelsForRetentionPolicy) <https://developers.mattermost.com/api-documentation/#/operations/GetChannelsForRetentionPolicy>`_
+
+        """
+        return self.client.paginate(
+            f"/api/v4/data_retention/policies/{policy_id}/channels", per_page=per_page, prefetch=prefetch
+        )
+
     def add_channels_to_retention_policy(self, policy_id: str, options: list[str]):
         """Add channels to a granular data retention policy
 
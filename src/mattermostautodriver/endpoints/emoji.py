@@ -32,6 +32,19 @@ class Emoji(Base):
         __params = {"page": page, "per_page": per_page, "sort": sort}
         return self.client.get("""/api/v4/emoji""", params=__params)
 
+    def iter_emoji_list(self, sort: str | None = "", per_page: int | None = None, prefetch: bool | None = False):
+        """Get a list of custom emoji, iterating over the items of all pages
+
+        sort: Either blank for no sorting or "name" to sort by emoji names. Minimum server version for sorting is 4.7.
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (emoji - GetEmojiList) <https://developers.mattermost.com/api-documentation/#/operations/GetEmojiList>`_
+
+        """
+        __params = {"sort": sort}
+        return self.client.paginate("""/api/v4/emoji""", params=__params, per_page=per_page, prefetch=prefetch)
+
     def get_emoji(self, emoji_id: str):
         """Get a custom emoji
 
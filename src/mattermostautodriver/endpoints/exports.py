@@ -1,4 +1,4 @@
-from ._base import Base, FileType
+from ._base import Base, DownloadTarget, FileType
 from typing import Any
 
 __all__ = ["Exports"]
@@ -23,6 +23,18 @@ class Exports(Base):
         """
         return self.client.get(f"/api/v4/exports/{export_name}")
 
+    def download_export_to(self, export_name: str, destination: DownloadTarget, chunk_size: int | None = None):
+        """Download an export file, streamed to destination
+
+        export_name: The name of the export file to download
+        destination: A path or a binary file object opened for writing
+        chunk_size: Size in bytes of the chunks written to destination
+
+        `Read in Mattermost API docs (exports - DownloadExport) <https://developers.mattermost.com/api-documentation/#/operations/DownloadExport>`_
+
+        """
+        return self.client.download(f"/api/v4/exports/{export_name}", destination, chunk_size=chunk_size)
+
     def delete_export(self, export_name: str):
         """Delete an export file
 
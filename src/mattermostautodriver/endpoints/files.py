@@ -1,4 +1,4 @@
-from ._base import Base, FileType
+from ._base import Base, DownloadTarget, FileType
 from typing import Any
 
 __all__ = ["Files"]
@@ -30,6 +30,18 @@ class Files(Base):
         """
         return self.client.get(f"/api/v4/files/{file_id}")
 
+    def download_file_to(self, file_id: str, destination: DownloadTarget, chunk_size: int | None = None):
+        """Get a file, streamed to destination
+
+        file_id: The ID of the file to get
+        destination: A path or a binary file object opened for writing
+        chunk_size: Size in bytes of the chunks written to destination
+
+        `Read in Mattermost API docs (files - GetFile) <https://developers.mattermost.com/api-documentation/#/operations/GetFile>`_
+
+        """
+        return self.client.download(f"/api/v4/files/{file_id}", destination, chunk_size=chunk_size)
+
     def head_file(self, file_id: str):
         """Get file metadata headers
 
@@ -55,6 +55,43 @@ class Groups(Base):
         }
         return self.client.get("""/api/v4/groups""", params=__params)
 
+    def iter_groups(
+        self,
+        q: str | None = None,
+        include_member_count: bool | None = None,
+        not_associated_to_team: str | None = None,
+        not_associated_to_channel: str | None = None,
+        since: int | None = None,
+        filter_allow_reference: bool | None = False,
+        per_page: int | None = None,
+        prefetch: bool | None = False,
+    ):
+        """Get groups, iterating over the items of all pages
+
+        q: String to pattern match the ``name`` and ``display_name`` field. Will return all groups whose ``name`` and ``display_name`` field match any of the text.
+        include_member_count: Boolean which adds the ``member_count`` attribute to each group JSON object
+        not_associated_to_team: Team GUID which is used to return all the groups not associated to this team
+        not_associated_to_channel: Group GUID which is used to return all the groups not associated to this channel
+        since: Only return groups that have been modified since the given Unix timestamp (in milliseconds). All modified groups, including deleted and created groups, will be returned.
+        *Minimum server version*: 5.24
+
+        filter_allow_reference: Boolean which filters the group entries with the ``allow_reference`` attribute set.
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (groups - GetGroups) <https://developers.mattermost.com/api-documentation/#/operations/GetGroups>`_
+
+        """
+        __params = {
+            "q": q,
+            "include_member_count": include_member_count,
+            "not_associated_to_team": not_associated_to_team,
+            "not_associated_to_channel": not_associated_to_channel,
+            "since": since,
+            "filter_allow_reference": filter_allow_reference,
+        }
+        return self.client.paginate("""/api/v4/groups""", params=__params, per_page=per_page, prefetch=prefetch)
+
     def create_group(self, name: str, display_name: str, source: str, allow_reference: bool, user_ids: list[str]):
         """Create a custom group
 
@@ -247,6 +284,18 @@ class Groups(Base):
         __params = {"page": page, "per_page": per_page}
         return self.client.get(f"/api/v4/groups/{group_id}/members", params=__params)
 
+    def iter_group_users(self, group_id: str, per_page: int | None = None, prefetch: bool | None = False):
+        """Get group users, iterating over the items of all pages
+
+        group_id: Group GUID
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (groups - GetGroupUsers) <https://developers.mattermost.com/api-documentation/#/operations/GetGroupUsers>`_
+
+        """
+        return self.client.paginate(f"/api/v4/groups/{group_id}/members", per_page=per_page, prefetch=prefetch)
+
     def delete_group_members(self, group_id: str, user_ids: list[str] | None = None):
         """Removes members from a custom group
 
@@ -301,6 +350,28 @@ class Groups(Base):
         __params = {"page": page, "per_page": per_page, "filter_allow_reference": filter_allow_reference}
         return self.client.get(f"/api/v4/channels/{channel_id}/groups", params=__params)
 
+    def iter_groups_by_channel(
+        self,
+        channel_id: str,
+        filter_allow_reference: bool | None = False,
+        per_page: int | None = None,
+        prefetch: bool | None = False,
+    ):
+        """Get channel groups, iterating over the items of all pages
+
+        channel_id: Channel GUID
+        filter_allow_reference: Boolean which filters the group entries with the ``allow_reference`` attribute set.
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (groups - GetGroupsByChannel) <https://developers.mattermost.com/api-documentation/#/operations/GetGroupsByChannel>`_
+
+        """
+        __params = {"filter_allow_reference": filter_allow_reference}
+        return self.client.paginate(
+            f"/api/v4/channels/{channel_id}/groups", params=__params, per_page=per_page, prefetch=prefetch
+        )
+
     def get_groups_by_team(
         self,
         team_id: str,
@@ -352,6 +423,57 @@ class Groups(Base):
         }
         return self.client.get(f"/api/v4/teams/{team_id}/groups", params=__params)
 
+    def iter_groups_by_team(
+        self,
+        team_id: str,
+        filter_allow_reference: bool | None = False,
+        include_member_count: bool | None = False,
+        include_timezones: bool | None = False,
+        include_total_count: bool | None = False,
+        include_archived: bool | None = False,
+        filter_archived: bool | None = False,
+        filter_parent_team_permitted: bool | None = False,
+        filter_has_member: str | None = None,
+        include_member_ids: bool | None = False,
+        only_syncable_sources: bool | None = False,
+        per_page: int | None = None,
+        prefetch: bool | None = False,
+    ):
+        """Get team groups, iterating over the items of all pages
+
+        team_id: Team GUID
+        filter_allow_reference: Boolean which filters in the group entries with the ``allow_reference`` attribute set.
+        include_member_count: Boolean which adds a ``member_count`` field to each group object.
+        include_timezones: Boolean which adds timezone information for group members.
+        include_total_count: Boolean which adds total count of groups in the response.
+        include_archived: Boolean which includes archived groups in the response.
+        filter_archived: Boolean which filters out archived groups from the response.
+        filter_parent_team_permitted: Boolean which filters groups based on parent team permissions.
+        filter_has_member: User ID to filter groups that have this member.
+        include_member_ids: Boolean which adds member IDs to the group objects.
+        only_syncable_sources: Boolean which includes groups from syncable sources.
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (groups - GetGroupsByTeam) <https://developers.mattermost.com/api-documentation/#/operations/GetGroupsByTeam>`_
+
+        """
+        __params = {
+            "filter_allow_reference": filter_allow_reference,
+            "include_member_count": include_member_count,
+            "include_timezones": include_timezones,
+            "include_total_count": include_total_count,
+            "include_archived": include_archived,
+            "filter_archived": filter_archived,
+            "filter_parent_team_permitted": filter_parent_team_permitted,
+            "filter_has_member": filter_has_member,
+            "include_member_ids": include_member_ids,
+            "only_syncable_sources": only_syncable_sources,
+        }
+        return self.client.paginate(
+            f"/api/v4/teams/{team_id}/groups", params=__params, per_page=per_page, prefetch=prefetch
+        )
+
     def get_groups_associated_to_channels_by_team(
         self,
         team_id: str,
@@ -1,4 +1,4 @@
-from ._base import Base, FileType
+from ._base import Base, DownloadTarget, FileType
 from typing import Any
 
 __all__ = ["Jobs"]
@@ -22,6 +22,26 @@ class Jobs(Base):
         __params = {"page": page, "per_page": per_page, "job_type": job_type, "status": status}
         return self.client.get("""/api/v4/jobs""", params=__params)
 
+    def iter_jobs(
+        self,
+        job_type: str | None = None,
+        status: str | None = None,
+        per_page: int | None = None,
+        prefetch: bool | None = False,
+    ):
+        """Get the jobs, iterating over the items of all pages
+
+        job_type: The type of jobs to fetch.
+        status: The status of jobs to fetch.
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (jobs - GetJobs) <https://developers.mattermost.com/api-documentation/#/operations/GetJobs>`_
+
+        """
+        __params = {"job_type": job_type, "status": status}
+        return self.client.paginate("""/api/v4/jobs""", params=__params, per_page=per_page, prefetch=prefetch)
+
     def create_job(self, type: str, data: dict[str, Any] | None = None):
         """Create a new job.
 
@@ -54,6 +74,18 @@ class Jobs(Base):
         """
         return self.client.get(f"/api/v4/jobs/{job_id}/download")
 
+    def download_job_to(self, job_id: str, destination: DownloadTarget, chunk_size: int | None = None):
+        """Download the results of a job, streamed to destination
+
+        job_id: Job GUID
+        destination: A path or a binary file object opened for writing
+        chunk_size: Size in bytes of the chunks written to destination
+
+        `Read in Mattermost API docs (jobs - DownloadJob) <https://developers.mattermost.com/api-documentation/#/operations/DownloadJob>`_
+
+        """
+        return self.client.download(f"/api/v4/jobs/{job_id}/download", destination, chunk_size=chunk_size)
+
     def cancel_job(self, job_id: str):
         """Cancel a job.
 
@@ -81,6 +113,25 @@ class Jobs(Base):
         __params = {"team_id": team_id, "page": page, "per_page": per_page}
         return self.client.get(f"/api/v4/jobs/type/{job_type}", params=__params)
 
+    def iter_jobs_by_type(
+        self, job_type: str, team_id: str | None = None, per_page: int | None = None, prefetch: bool | None = False
+    ):
+        """Get the jobs of the given type, iterating over the items of all pages
+
+        job_type: Job type
+        team_id: Optional team GUID. When set, the server returns jobs of the given ``job_type`` whose job data includes this ``team_id`` (see server filtering). For ``access_control_sync``, team admins with ``manage_team_access_rules`` on this team may use this parameter to read team-scoped jobs without ``manage_system``.
+
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (jobs - GetJobsByType) <https://developers.mattermost.com/api-documentation/#/operations/GetJobsByType>`_
+
+        """
+        __params = {"team_id": team_id}
+        return self.client.paginate(
+            f"/api/v4/jobs/type/{job_type}", params=__params, per_page=per_page, prefetch=prefetch
+        )
+
     def update_job_status(self, job_id: str, status: str, force: bool | None = None):
         """Update the status of a job
 
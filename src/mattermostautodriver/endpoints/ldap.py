@@ -60,6 +60,19 @@ class Ldap(Base):
         __params = {"q": q, "page": page, "per_page": per_page}
         return self.client.get("""/api/v4/ldap/groups""", params=__params)
 
+    def iter_ldap_groups(self, q: str | None = None, per_page: int | None = None, prefetch: bool | None = False):
+        """Returns a list of LDAP groups, iterating over the items of all pages
+
+        q: Search term
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (ldap - GetLdapGroups) <https://developers.mattermost.com/api-documentation/#/operations/GetLdapGroups>`_
+
+        """
+        __params = {"q": q}
+        return self.client.paginate("""/api/v4/ldap/groups""", params=__params, per_page=per_page, prefetch=prefetch)
+
     def link_ldap_group(self, remote_id: str):
         """Link a LDAP group
 
@@ -1,4 +1,4 @@
-from ._base import Base, FileType
+from ._base import Base, DownloadTarget, FileType
 from typing import Any
 
 __all__ = ["Logs"]
@@ -12,3 +12,14 @@ class Logs(Base):
 
         """
         return self.client.get("""/api/v4/logs/download""")
+
+    def download_system_logs_to(self, destination: DownloadTarget, chunk_size: int | None = None):
+        """Download system logs, streamed to destination
+
+        destination: A path or a binary file object opened for writing
+        chunk_size: Size in bytes of the chunks written to destination
+
+        `Read in Mattermost API docs (logs - DownloadSystemLogs) <https://developers.mattermost.com/api-documentation/#/operations/DownloadSystemLogs>`_
+
+        """
+        return self.client.download("""/api/v4/logs/download""", destination, chunk_size=chunk_size)
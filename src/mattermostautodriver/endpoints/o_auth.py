@@ -52,6 +52,17 @@ class OAuth(Base):
         __params = {"page": page, "per_page": per_page}
         return self.client.get("""/api/v4/oauth/apps""", params=__params)
 
+    def iter_o_auth_apps(self, per_page: int | None = None, prefetch: bool | None = False):
+        """Get OAuth apps, iterating over the items of all pages
+
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (o_auth - GetOAuthApps) <https://developers.mattermost.com/api-documentation/#/operations/GetOAuthApps>`_
+
+        """
+        return self.client.paginate("""/api/v4/oauth/apps""", per_page=per_page, prefetch=prefetch)
+
     def get_o_auth_app(self, app_id: str):
         """Get an OAuth app
 
@@ -154,3 +165,19 @@ class OAuth(Base):
         """
         __params = {"page": page, "per_page": per_page}
         return self.client.get(f"/api/v4/users/{user_id}/oauth/apps/authorized", params=__params)
+
+    def iter_authorized_o_auth_apps_for_user(
+        self, user_id: str, per_page: int | None = None, prefetch: bool | None = False
+    ):
+        """Get authorized OAuth apps, iterating over the items of all pages
+
+        user_id: User GUID
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (o_auth - GetAuthorizedOAuthAppsForUser) <https://developers.mattermost.com/api-documentation/#/operations/GetAuthorizedOAuthAppsForUser>`_
+
+        """
+        return self.client.paginate(
+            f"/api/v4/users/{user_id}/oauth/apps/authorized", per_page=per_page, prefetch=prefetch
+        )
@@ -55,6 +55,55 @@ class PlaybookRuns(Base):
         }
         return self.client.get("""/plugins/playbooks/api/v0/runs""", params=__params)
 
+    def iter_playbook_runs(
+        self,
+        team_id: str,
+        sort: str | None = "create_at",
+        direction: str | None = "desc",
+        statuses: list[str] | None = ["InProgress"],
+        owner_user_id: str | None = None,
+        participant_id: str | None = None,
+        search_term: str | None = None,
+        channel_id: str | None = None,
+        omit_ended: bool | None = False,
+        since: int | None = None,
+        per_page: int | None = None,
+        prefetch: bool | None = False,
+    ):
+        """List all playbook runs, iterating over the items of all pages
+
+        team_id: ID of the team to filter by.
+        sort: Field to sort the returned playbook runs by.
+        direction: Direction (ascending or descending) followed by the sorting of the playbook runs.
+        statuses: The returned list will contain only the playbook runs with the specified statuses.
+        owner_user_id: The returned list will contain only the playbook runs commanded by this user. Specify "me" for current user.
+        participant_id: The returned list will contain only the playbook runs for which the given user is a participant. Specify "me" for current user.
+        search_term: The returned list will contain only the playbook runs whose name contains the search term.
+        channel_id: The returned list will contain only the playbook runs associated with this channel ID.
+        omit_ended: When set to true, only active runs (with EndAt = 0) are returned. When false or omitted, both active and ended runs are returned.
+        since: Return only PlaybookRuns created/modified since the given timestamp (in milliseconds).
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (playbook_runs - listPlaybookRuns) <https://developers.mattermost.com/api-documentation/#/operations/listPlaybookRuns>`_
+
+        """
+        __params = {
+            "team_id": team_id,
+            "sort": sort,
+            "direction": direction,
+            "statuses": statuses,
+            "owner_user_id": owner_user_id,
+            "participant_id": participant_id,
+            "search_term": search_term,
+            "channel_id": channel_id,
+            "omit_ended": omit_ended,
+            "since": since,
+        }
+        return self.client.paginate(
+            """/plugins/playbooks/api/v0/runs""", params=__params, per_page=per_page, prefetch=prefetch
+        )
+
     def create_playbook_run_from_post(
         self,
         name: str,
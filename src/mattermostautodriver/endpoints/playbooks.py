@@ -37,6 +37,32 @@ class Playbooks(Base):
         }
         return self.client.get("""/plugins/playbooks/api/v0/playbooks""", params=__params)
 
+    def iter_playbooks(
+        self,
+        team_id: str,
+        sort: str | None = "title",
+        direction: str | None = "asc",
+        with_archived: bool | None = False,
+        per_page: int | None = None,
+        prefetch: bool | None = False,
+    ):
+        """List all playbooks, iterating over the items of all pages
+
+        team_id: ID of the team to filter by.
+        sort: Field to sort the returned playbooks by title, number of stages or total number of steps.
+        direction: Direction (ascending or descending) followed by the sorting of the playbooks.
+        with_archived: Includes archived playbooks in the result.
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (playbooks - getPlaybooks) <https://developers.mattermost.com/api-documentation/#/operations/getPlaybooks>`_
+
+        """
+        __params = {"team_id": team_id, "sort": sort, "direction": direction, "with_archived": with_archived}
+        return self.client.paginate(
+            """/plugins/playbooks/api/v0/playbooks""", params=__params, per_page=per_page, prefetch=prefetch
+        )
+
     def create_playbook(
         self,
         title: str,
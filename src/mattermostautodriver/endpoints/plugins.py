@@ -112,6 +112,30 @@ class Plugins(Base):
         }
         return self.client.get("""/api/v4/plugins/marketplace""", params=__params)
 
+    def iter_marketplace_plugins(
+        self,
+        filter: str | None = None,
+        server_version: str | None = None,
+        local_only: bool | None = None,
+        per_page: int | None = None,
+        prefetch: bool | None = False,
+    ):
+        """Gets all the marketplace plugins, iterating over the items of all pages
+
+        filter: Set to filter plugins by ID, name, or description.
+        server_version: Set to filter minimum plugin server version. (not yet implemented)
+        local_only: Set true to only retrieve local plugins.
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (plugins - GetMarketplacePlugins) <https://developers.mattermost.com/api-documentation/#/operations/GetMarketplacePlugins>`_
+
+        """
+        __params = {"filter": filter, "server_version": server_version, "local_only": local_only}
+        return self.client.paginate(
+            """/api/v4/plugins/marketplace""", params=__params, per_page=per_page, prefetch=prefetch
+        )
+
     def get_marketplace_visited_by_admin(self):
         """Get if the Plugin Marketplace has been visited by at least an admin.
         `Read in Mattermost API docs (plugins - GetMarketplaceVisitedByAdmin) <https://developers.mattermost.com/api-documentation/#/operations/GetMarketplaceVisitedByAdmin>`_
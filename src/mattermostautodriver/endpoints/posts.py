@@ -237,6 +237,30 @@ class Posts(Base):
         __params = {"team_id": team_id, "channel_id": channel_id, "page": page, "per_page": per_page}
         return self.client.get(f"/api/v4/users/{user_id}/posts/flagged", params=__params)
 
+    def iter_flagged_posts_for_user(
+        self,
+        user_id: str,
+        team_id: str | None = None,
+        channel_id: str | None = None,
+        per_page: int | None = None,
+        prefetch: bool | None = False,
+    ):
+        """Get a list of flagged posts, iterating over the items of all pages
+
+        user_id: ID of the user
+        team_id: Team ID
+        channel_id: Channel ID
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (posts - GetFlaggedPostsForUser) <https://developers.mattermost.com/api-documentation/#/operations/GetFlaggedPostsForUser>`_
+
+        """
+        __params = {"team_id": team_id, "channel_id": channel_id}
+        return self.client.paginate(
+            f"/api/v4/users/{user_id}/posts/flagged", params=__params, per_page=per_page, prefetch=prefetch
+        )
+
     def get_file_infos_for_post(self, post_id: str, include_deleted: bool | None = False):
         """Get file info for post
 
@@ -305,6 +329,34 @@ class Posts(Base):
         }
         return self.client.get(f"/api/v4/channels/{channel_id}/posts", params=__params)
 
+    def iter_posts_for_channel(
+        self,
+        channel_id: str,
+        before: str | None = None,
+        after: str | None = None,
+        include_deleted: bool | None = False,
+        type: str | None = None,
+        per_page: int | None = None,
+        prefetch: bool | None = False,
+    ):
+        """Get posts for a channel, iterating over the items of all pages
+
+        channel_id: The channel ID to get the posts for
+        before: A post id to select the posts that came before this one
+        after: A post id to select the posts that came after this one
+        include_deleted: Whether to include deleted posts or not. Must have system admin permissions.
+        type: Filter posts by type.
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (posts - GetPostsForChannel) <https://developers.mattermost.com/api-documentation/#/operations/GetPostsForChannel>`_
+
+        """
+        __params = {"before": before, "after": after, "include_deleted": include_deleted, "type": type}
+        return self.client.paginate(
+            f"/api/v4/channels/{channel_id}/posts", params=__params, per_page=per_page, prefetch=prefetch
+        )
+
     def get_posts_around_last_unread(
         self,
         user_id: str,
@@ -46,6 +46,44 @@ class RemoteClusters(Base):
         }
         return self.client.get("""/api/v4/remotecluster""", params=__params)
 
+    def iter_remote_clusters(
+        self,
+        exclude_offline: bool | None = None,
+        in_channel: str | None = None,
+        not_in_channel: str | None = None,
+        only_confirmed: bool | None = None,
+        only_plugins: bool | None = None,
+        exclude_plugins: bool | None = None,
+        include_deleted: bool | None = None,
+        per_page: int | None = None,
+        prefetch: bool | None = False,
+    ):
+        """Get a list of remote clusters, iterating over the items of all pages
+
+        exclude_offline: Exclude offline remote clusters
+        in_channel: Select remote clusters in channel
+        not_in_channel: Select remote clusters not in this channel
+        only_confirmed: Select only remote clusters already confirmed
+        only_plugins: Select only remote clusters that belong to a plugin
+        exclude_plugins: Select only remote clusters that don't belong to a plugin
+        include_deleted: Include those remote clusters that have been deleted
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (remote_clusters - GetRemoteClusters) <https://developers.mattermost.com/api-documentation/#/operations/GetRemoteClusters>`_
+
+        """
+        __params = {
+            "exclude_offline": exclude_offline,
+            "in_channel": in_channel,
+            "not_in_channel": not_in_channel,
+            "only_confirmed": only_confirmed,
+            "only_plugins": only_plugins,
+            "exclude_plugins": exclude_plugins,
+            "include_deleted": include_deleted,
+        }
+        return self.client.paginate("""/api/v4/remotecluster""", params=__params, per_page=per_page, prefetch=prefetch)
+
     def create_remote_cluster(
         self, name: str, default_team_id: str, display_name: str | None = None, password: str | None = None
     ):
@@ -19,6 +19,19 @@ class Schemes(Base):
         __params = {"scope": scope, "page": page, "per_page": per_page}
         return self.client.get("""/api/v4/schemes""", params=__params)
 
+    def iter_schemes(self, scope: str | None = "", per_page: int | None = None, prefetch: bool | None = False):
+        """Get the schemes, iterating over the items of all pages
+
+        scope: Limit the results returned to the provided scope, either ``team`` or ``channel``.
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (schemes - GetSchemes) <https://developers.mattermost.com/api-documentation/#/operations/GetSchemes>`_
+
+        """
+        __params = {"scope": scope}
+        return self.client.paginate("""/api/v4/schemes""", params=__params, per_page=per_page, prefetch=prefetch)
+
     def create_scheme(self, display_name: str, scope: str, name: str | None = None, description: str | None = None):
         """Create a scheme
 
@@ -79,6 +92,18 @@ class Schemes(Base):
         __params = {"page": page, "per_page": per_page}
         return self.client.get(f"/api/v4/schemes/{scheme_id}/teams", params=__params)
 
+    def iter_teams_for_scheme(self, scheme_id: str, per_page: int | None = None, prefetch: bool | None = False):
+        """Get a page of teams which use this scheme, iterating over the items of all pages
+
+        scheme_id: Scheme GUID
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (schemes - GetTeamsForScheme) <https://developers.mattermost.com/api-documentation/#/operations/GetTeamsForScheme>`_
+
+        """
+        return self.client.paginate(f"/api/v4/schemes/{scheme_id}/teams", per_page=per_page, prefetch=prefetch)
+
     def get_channels_for_scheme(self, scheme_id: str, page: int | None = 0, per_page: int | None = 60):
         """Get a page of channels which use this scheme.
 
@@ -91,3 +116,15 @@ class Schemes(Base):
         """
         __params = {"page": page, "per_page": per_page}
         return self.client.get(f"/api/v4/schemes/{scheme_id}/channels", params=__params)
+
+    def iter_channels_for_scheme(self, scheme_id: str, per_page: int | None = None, prefetch: bool | None = False):
+        """Get a page of channels which use this scheme, iterating over the items of all pages
+
+        scheme_id: Scheme GUID
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (schemes - GetChannelsForScheme) <https://developers.mattermost.com/api-documentation/#/operations/GetChannelsForScheme>`_
+
+        """
+        return self.client.paginate(f"/api/v4/schemes/{scheme_id}/channels", per_page=per_page, prefetch=prefetch)
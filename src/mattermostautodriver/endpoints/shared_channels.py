@@ -19,6 +19,18 @@ class SharedChannels(Base):
         __params = {"page": page, "per_page": per_page}
         return self.client.get(f"/api/v4/sharedchannels/{team_id}", params=__params)
 
+    def iter_all_shared_channels(self, team_id: str, per_page: int | None = None, prefetch: bool | None = False):
+        """Get all shared channels for team, iterating over the items of all pages
+
+        team_id: Team Id
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (shared_channels - GetAllSharedChannels) <https://developers.mattermost.com/api-documentation/#/operations/GetAllSharedChannels>`_
+
+        """
+        return self.client.paginate(f"/api/v4/sharedchannels/{team_id}", per_page=per_page, prefetch=prefetch)
+
     def get_shared_channel_remotes_by_remote_cluster(
         self,
         remote_id: str,
@@ -55,6 +67,45 @@ class SharedChannels(Base):
         }
         return self.client.get(f"/api/v4/remotecluster/{remote_id}/sharedchannelremotes", params=__params)
 
+    def iter_shared_channel_remotes_by_remote_cluster(
+        self,
+        remote_id: str,
+        include_unconfirmed: bool | None = None,
+        exclude_confirmed: bool | None = None,
+        exclude_home: bool | None = None,
+        exclude_remote: bool | None = None,
+        include_deleted: bool | None = None,
+        per_page: int | None = None,
+        prefetch: bool | None = False,
+    ):
+        """Get shared channel remotes by remote cluster, iterating over the items of all pages
+
+        remote_id: The remote cluster GUID
+        include_unconfirmed: Include those Shared channel remotes that are unconfirmed
+        exclude_confirmed: Show only those Shared channel remotes that are not confirmed yet
+        exclude_home: Show only those Shared channel remotes that were shared with this server
+        exclude_remote: Show only those Shared channel remotes that were shared from this server
+        include_deleted: Include those Shared channel remotes that have been deleted
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (shared_channels - GetSharedChannelRemotesByRemoteCluster) <https://developers.mattermost.com/api-documentation/#/operations/GetSharedChannelRemotesByRemoteCluster>`_
+
+        """
+        __params = {
+            "include_unconfirmed": include_unconfirmed,
+            "exclude_confirmed": exclude_confirmed,
+            "exclude_home": exclude_home,
+            "exclude_remote": exclude_remote,
+            "include_deleted": include_deleted,
+        }
+        return self.client.paginate(
+            f"/api/v4/remotecluster/{remote_id}/sharedchannelremotes",
+            params=__params,
+            per_page=per_page,
+            prefetch=prefetch,
+        )
+
     def get_remote_cluster_info(self, remote_id: str, include_deleted: bool | None = False):
         """Get remote cluster info by ID for user.
 
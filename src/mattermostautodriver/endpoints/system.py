@@ -324,6 +324,17 @@ class System(Base):
         __params = {"page": page, "per_page": per_page}
         return self.client.get("""/api/v4/audits""", params=__params)
 
+    def iter_audits(self, per_page: int | None = None, prefetch: bool | None = False):
+        """Get audits, iterating over the items of all pages
+
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (system - GetAudits) <https://developers.mattermost.com/api-documentation/#/operations/GetAudits>`_
+
+        """
+        return self.client.paginate("""/api/v4/audits""", per_page=per_page, prefetch=prefetch)
+
     def invalidate_caches(self):
         """Invalidate all the caches
         `Read in Mattermost API docs (system - InvalidateCaches) <https://developers.mattermost.com/api-documentation/#/operations/InvalidateCaches>`_
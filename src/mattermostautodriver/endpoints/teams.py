@@ -45,6 +45,30 @@ class Teams(Base):
         }
         return self.client.get("""/api/v4/teams""", params=__params)
 
+    def iter_all_teams(
+        self,
+        include_total_count: bool | None = False,
+        exclude_policy_constrained: bool | None = False,
+        per_page: int | None = None,
+        prefetch: bool | None = False,
+    ):
+        """Get teams, iterating over the items of all pages
+
+        include_total_count: Appends a total count of returned teams inside the response object - ex: ``{ "teams": [], "total_count" : 0 }``.
+        exclude_policy_constrained: If set to true, teams which are part of a data retention policy will be excluded. The ``sysconsole_read_compliance`` permission is required to use this parameter.
+        *Minimum server version*: 5.35
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (teams - GetAllTeams) <https://developers.mattermost.com/api-documentation/#/operations/GetAllTeams>`_
+
+        """
+        __params = {
+            "include_total_count": include_total_count,
+            "exclude_policy_constrained": exclude_policy_constrained,
+        }
+        return self.client.paginate("""/api/v4/teams""", params=__params, per_page=per_page, prefetch=prefetch)
+
     def get_team(self, team_id: str):
         """Get a team
 
@@ -244,6 +268,30 @@ class Teams(Base):
         __params = {"page": page, "per_page": per_page, "sort": sort, "exclude_deleted_users": exclude_deleted_users}
         return self.client.get(f"/api/v4/teams/{team_id}/members", params=__params)
 
+    def iter_team_members(
+        self,
+        team_id: str,
+        sort: str | None = "",
+        exclude_deleted_users: bool | None = False,
+        per_page: int | None = None,
+        prefetch: bool | None = False,
+    ):
+        """Get team members, iterating over the items of all pages
+
+        team_id: Team GUID
+        sort: To sort by Username, set to 'Username', otherwise sort is by 'UserID'
+        exclude_deleted_users: Excludes deleted users from the results
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (teams - GetTeamMembers) <https://developers.mattermost.com/api-documentation/#/operations/GetTeamMembers>`_
+
+        """
+        __params = {"sort": sort, "exclude_deleted_users": exclude_deleted_users}
+        return self.client.paginate(
+            f"/api/v4/teams/{team_id}/members", params=__params, per_page=per_page, prefetch=prefetch
+        )
+
     def add_team_member(self, team_id: str, user_id: str | None = None):
         """Add user to team
 
@@ -515,6 +563,27 @@ class Teams(Base):
         __params = {"group_ids": group_ids, "page": page, "per_page": per_page}
         return self.client.get(f"/api/v4/teams/{team_id}/members_minus_group_members", params=__params)
 
+    def iter_team_members_minus_group_members(
+        self, team_id: str, group_ids: str = "", per_page: int | None = None, prefetch: bool | None = False
+    ):
+        """Team members minus group members, iterating over the items of all pages
+
+        team_id: Team GUID
+        group_ids: A comma-separated list of group ids.
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (teams - TeamMembersMinusGroupMembers) <https://developers.mattermost.com/api-documentation/#/operations/TeamMembersMinusGroupMembers>`_
+
+        """
+        __params = {"group_ids": group_ids}
+        return self.client.paginate(
+            f"/api/v4/teams/{team_id}/members_minus_group_members",
+            params=__params,
+            per_page=per_page,
+            prefetch=prefetch,
+        )
+
     def search_files(
         self,
         team_id: str,
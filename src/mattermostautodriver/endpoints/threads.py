@@ -44,6 +44,44 @@ class Threads(Base):
         }
         return self.client.get(f"/api/v4/users/{user_id}/teams/{team_id}/threads", params=__params)
 
+    def iter_user_threads(
+        self,
+        user_id: str,
+        team_id: str,
+        since: int | None = None,
+        deleted: bool | None = False,
+        extended: bool | None = False,
+        totalsOnly: bool | None = False,
+        threadsOnly: bool | None = False,
+        per_page: int | None = None,
+        prefetch: bool | None = False,
+    ):
+        """Get all threads that user is following, iterating over the items of all pages
+
+        user_id: The ID of the user. This can also be "me" which will point to the current user.
+        team_id: The ID of the team in which the thread is.
+        since: Since filters the threads based on their LastUpdateAt timestamp.
+        deleted: Deleted will specify that even deleted threads should be returned (For mobile sync).
+        extended: Extended will enrich the response with participant details.
+        totalsOnly: Setting this to true will only return the total counts.
+        threadsOnly: Setting this to true will only return threads.
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (threads - GetUserThreads) <https://developers.mattermost.com/api-documentation/#/operations/GetUserThreads>`_
+
+        """
+        __params = {
+            "since": since,
+            "deleted": deleted,
+            "extended": extended,
+            "totalsOnly": totalsOnly,
+            "threadsOnly": threadsOnly,
+        }
+        return self.client.paginate(
+            f"/api/v4/users/{user_id}/teams/{team_id}/threads", params=__params, per_page=per_page, prefetch=prefetch
+        )
+
     def update_threads_read_for_user(self, user_id: str, team_id: str):
         """Mark all threads that user is following as read
 
@@ -259,6 +259,103 @@ class Users(Base):
         }
         return self.client.get("""/api/v4/users""", params=__params)
 
+    def iter_users(
+        self,
+        in_team: str | None = None,
+        not_in_team: str | None = None,
+        in_channel: str | None = None,
+        not_in_channel: str | None = None,
+        in_group: str | None = None,
+        group_constrained: bool | None = None,
+        abac_match_only: bool | None = None,
+        without_team: bool | None = None,
+        active: bool | None = None,
+        inactive: bool | None = None,
+        role: str | None = None,
+        sort: str | None = None,
+        roles: str | None = None,
+        channel_roles: str | None = None,
+        team_roles: str | None = None,
+        per_page: int | None = None,
+        prefetch: bool | None = False,
+    ):
+        """Get users, iterating over the items of all pages
+
+        in_team: The ID of the team to get users for.
+        not_in_team: The ID of the team to exclude users for. Must not be used with "in_team" query parameter.
+        in_channel: The ID of the channel to get users for.
+        not_in_channel: The ID of the channel to exclude users for. Must be used with "in_channel" query parameter.
+        in_group: The ID of the group to get users for. Must have ``manage_system`` permission.
+        group_constrained: When used with ``not_in_channel`` or ``not_in_team``, returns only the users that are allowed to join the channel or team based on its group constrains.
+        abac_match_only: When used with ``not_in_channel``, restricts the result to users whose attributes satisfy the channel's Attribute-Based Access Control (ABAC) membership policy.
+
+        On private channels with an ABAC policy this filter is always applied regardless of this parameter (hard gate). On public channels with an advisory ABAC policy the full not_in_channel candidate list is returned by default; set this to ``true`` to fetch only the matching subset of candidates (for example to annotate recommended members in the invite UI).
+
+        *Minimum server version*: 11.8
+
+        without_team: Whether or not to list users that are not on any team. This option takes precendence over ``in_team``, ``in_channel``, and ``not_in_channel``.
+        active: Whether or not to list only users that are active. This option cannot be used along with the ``inactive`` option.
+        inactive: Whether or not to list only users that are deactivated. This option cannot be used along with the ``active`` option.
+        role: Returns users that have this role.
+        sort: Sort is only available in conjunction with certain options below. The paging parameter is also always available.
+
+        ##### ``in_team``
+        Can be "", "last_activity_at" or "create_at".
+        When left blank, sorting is done by username.
+        Note that when "last_activity_at" is specified, an additional "last_activity_at" field will be returned in the response packet.
+        *Minimum server version*: 4.0
+        ##### ``in_channel``
+        Can be "", "status".
+        When left blank, sorting is done by username. ``status`` will sort by User's current status (Online, Away, DND, Offline), then by Username.
+        *Minimum server version*: 4.7
+        ##### ``in_group``
+        Can be "", "display_name".
+        When left blank, sorting is done by username. ``display_name`` will sort alphabetically by user's display name.
+        *Minimum server version*: 7.7
+
+        roles: Comma separated string used to filter users based on any of the specified system roles
+
+        Example: ``?roles=system_admin,system_user`` will return users that are either system admins or system users
+
+        *Minimum server version*: 5.26
+
+        channel_roles: Comma separated string used to filter users based on any of the specified channel roles, can only be used in conjunction with ``in_channel``
+
+        Example: ``?in_channel=4eb6axxw7fg3je5iyasnfudc5y&channel_roles=channel_user`` will return users that are only channel users and not admins or guests
+
+        *Minimum server version*: 5.26
+
+        team_roles: Comma separated string used to filter users based on any of the specified team roles, can only be used in conjunction with ``in_team``
+
+        Example: ``?in_team=4eb6axxw7fg3je5iyasnfudc5y&team_roles=team_user`` will return users that are only team users and not admins or guests
+
+        *Minimum server version*: 5.26
+
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (users - GetUsers) <https://developers.mattermost.com/api-documentation/#/operations/GetUsers>`_
+
+        """
+        __params = {
+            "in_team": in_team,
+            "not_in_team": not_in_team,
+            "in_channel": in_channel,
+            "not_in_channel": not_in_channel,
+            "in_group": in_group,
+            "group_constrained": group_constrained,
+            "abac_match_only": abac_match_only,
+            "without_team": without_team,
+            "active": active,
+            "inactive": inactive,
+            "role": role,
+            "sort": sort,
+            "roles": roles,
+            "channel_roles": channel_roles,
+            "team_roles": team_roles,
+        }
+        return self.client.paginate("""/api/v4/users""", params=__params, per_page=per_page, prefetch=prefetch)
+
     def permanent_delete_all_users(self):
         """Permanent delete all users
         `Read in Mattermost API docs (users - PermanentDeleteAllUsers) <https://developers.mattermost.com/api-documentation/#/operations/PermanentDeleteAllUsers>`_
@@ -886,6 +983,20 @@ class Users(Base):
         __params = {"page": page, "per_page": per_page}
         return self.client.get(f"/api/v4/users/{user_id}/tokens", params=__params)
 
+    def iter_user_access_tokens_for_user(
+        self, user_id: str, per_page: int | None = None, prefetch: bool | None = False
+    ):
+        """Get user access tokens, iterating over the items of all pages
+
+        user_id: User GUID
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (users - GetUserAccessTokensForUser) <https://developers.mattermost.com/api-documentation/#/operations/GetUserAccessTokensForUser>`_
+
+        """
+        return self.client.paginate(f"/api/v4/users/{user_id}/tokens", per_page=per_page, prefetch=prefetch)
+
     def get_user_access_tokens(self, page: int | None = 0, per_page: int | None = 60):
         """Get user access tokens
 
@@ -898,6 +1009,17 @@ class Users(Base):
         __params = {"page": page, "per_page": per_page}
         return self.client.get("""/api/v4/users/tokens""", params=__params)
 
+    def iter_user_access_tokens(self, per_page: int | None = None, prefetch: bool | None = False):
+        """Get user access tokens, iterating over the items of all pages
+
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (users - GetUserAccessTokens) <https://developers.mattermost.com/api-documentation/#/operations/GetUserAccessTokens>`_
+
+        """
+        return self.client.paginate("""/api/v4/users/tokens""", per_page=per_page, prefetch=prefetch)
+
     def revoke_user_access_token(self, token_id: str):
         """Revoke a user access token
 
@@ -1030,6 +1152,20 @@ class Users(Base):
         __params = {"page": page, "per_page": per_page}
         return self.client.get(f"/api/v4/users/{user_id}/channel_members", params=__params)
 
+    def iter_channel_members_with_team_data_for_user(
+        self, user_id: str, per_page: int | None = None, prefetch: bool | None = False
+    ):
+        """Get all channel members from all teams for a user, iterating over the items of all pages
+
+        user_id: The ID of the user. This can also be "me" which will point to the current user.
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (users - GetChannelMembersWithTeamDataForUser) <https://developers.mattermost.com/api-documentation/#/operations/GetChannelMembersWithTeamDataForUser>`_
+
+        """
+        return self.client.paginate(f"/api/v4/users/{user_id}/channel_members", per_page=per_page, prefetch=prefetch)
+
     def migrate_auth_to_ldap(self, from_: str, match_field: str, force: bool):
         """Migrate user accounts authentication type to LDAP.
 
@@ -1109,6 +1245,17 @@ class Users(Base):
         __params = {"page": page, "per_page": per_page}
         return self.client.get("""/api/v4/users/invalid_emails""", params=__params)
 
+    def iter_users_with_invalid_emails(self, per_page: int | None = None, prefetch: bool | None = False):
+        """Get users with invalid emails, iterating over the items of all pages
+
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (users - GetUsersWithInvalidEmails) <https://developers.mattermost.com/api-documentation/#/operations/GetUsersWithInvalidEmails>`_
+
+        """
+        return self.client.paginate("""/api/v4/users/invalid_emails""", per_page=per_page, prefetch=prefetch)
+
     def reset_password_failed_attempts(self):
         """Reset the failed password attempts for a user
         `Read in Mattermost API docs (users - resetPasswordFailedAttempts) <https://developers.mattermost.com/api-documentation/#/operations/resetPasswordFailedAttempts>`_
@@ -23,6 +23,29 @@ class Views(Base):
         __params = {"per_page": per_page, "page": page, "include_total_count": include_total_count}
         return self.client.get(f"/api/v4/channels/{channel_id}/views", params=__params)
 
+    def iter_channel_views(
+        self,
+        channel_id: str,
+        include_total_count: bool | None = False,
+        per_page: int | None = None,
+        prefetch: bool | None = False,
+    ):
+        """List channel views, iterating over the items of all pages
+
+        channel_id: Channel GUID
+        include_total_count: When true, the response is a ViewsWithCount object containing a views array and a total_count integer. When false or omitted, the response is a plain JSON array of View objects.
+
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (views - ListChannelViews) <https://developers.mattermost.com/api-documentation/#/operations/ListChannelViews>`_
+
+        """
+        __params = {"include_total_count": include_total_count}
+        return self.client.paginate(
+            f"/api/v4/channels/{channel_id}/views", params=__params, per_page=per_page, prefetch=prefetch
+        )
+
     def create_channel_view(
         self,
         channel_id: str,
@@ -96,6 +119,23 @@ class Views(Base):
         __params = {"page": page, "per_page": per_page}
         return self.client.get(f"/api/v4/channels/{channel_id}/views/{view_id}/posts", params=__params)
 
+    def iter_posts_for_view(
+        self, channel_id: str, view_id: str, per_page: int | None = None, prefetch: bool | None = False
+    ):
+        """Get posts for a view, iterating over the items of all pages
+
+        channel_id: Channel GUID
+        view_id: View GUID
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (views - GetPostsForView) <https://developers.mattermost.com/api-documentation/#/operations/GetPostsForView>`_
+
+        """
+        return self.client.paginate(
+            f"/api/v4/channels/{channel_id}/views/{view_id}/posts", per_page=per_page, prefetch=prefetch
+        )
+
     def update_channel_view_sort_order(self, channel_id: str, view_id: str, options: int):
         """Update a channel view's sort order
 
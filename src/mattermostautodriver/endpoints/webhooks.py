@@ -60,6 +60,26 @@ class Webhooks(Base):
         __params = {"page": page, "per_page": per_page, "team_id": team_id, "include_total_count": include_total_count}
         return self.client.get("""/api/v4/hooks/incoming""", params=__params)
 
+    def iter_incoming_webhooks(
+        self,
+        team_id: str | None = None,
+        include_total_count: bool | None = False,
+        per_page: int | None = None,
+        prefetch: bool | None = False,
+    ):
+        """List incoming webhooks, iterating over the items of all pages
+
+        team_id: The ID of the team to get hooks for.
+        include_total_count: Appends a total count of returned hooks inside the response object - ex: ``{ "incoming_webhooks": [], "total_count": 0 }``.
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (webhooks - GetIncomingWebhooks) <https://developers.mattermost.com/api-documentation/#/operations/GetIncomingWebhooks>`_
+
+        """
+        __params = {"team_id": team_id, "include_total_count": include_total_count}
+        return self.client.paginate("""/api/v4/hooks/incoming""", params=__params, per_page=per_page, prefetch=prefetch)
+
     def get_incoming_webhook(self, hook_id: str):
         """Get an incoming webhook
 
@@ -172,6 +192,26 @@ class Webhooks(Base):
         __params = {"page": page, "per_page": per_page, "team_id": team_id, "channel_id": channel_id}
         return self.client.get("""/api/v4/hooks/outgoing""", params=__params)
 
+    def iter_outgoing_webhooks(
+        self,
+        team_id: str | None = None,
+        channel_id: str | None = None,
+        per_page: int | None = None,
+        prefetch: bool | None = False,
+    ):
+        """List outgoing webhooks, iterating over the items of all pages
+
+        team_id: The ID of the team to get hooks for.
+        channel_id: The ID of the channel to get hooks for.
+        per_page: Number of items per page, defaults to MAX_PER_PAGE
+        prefetch: Fetch the next page while the current one is consumed
+
+        `Read in Mattermost API docs (webhooks - GetOutgoingWebhooks) <https://developers.mattermost.com/api-documentation/#/operations/GetOutgoingWebhooks>`_
+
+        """
+        __params = {"team_id": team_id, "channel_id": channel_id}
+        return self.client.paginate("""/api/v4/hooks/outgoing""", params=__params, per_page=per_page, prefetch=prefetch)
+
     def get_outgoing_webhook(self, hook_id: str):
         """Get an outgoing webhook
 
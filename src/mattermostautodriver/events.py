@@ -0,0 +1,134 @@
+"""
+Websocket events parsed once and routed to handlers by event type
+"""
+
+from .codec import get_json_codec
+
+ANY_EVENT = "*"
+
+
+class WebsocketEvent:
+    """A websocket frame, parsed on first access and shared by every handler.
+
+    The fields of the event are available as attributes, and the whole
+    message with ``event["..."]`` or :attr:`message`. Frames that are not a
+    JSON object, e.g. replies to websocket actions, have an empty ``event``.
+
+    :param raw: The frame as received
+    :param json_codec: Codec decoding the frame, see the ``json_codec`` driver option
+    """
+
+    __slots__ = ("raw", "_json_codec", "_message", "_post")
+
+    def __init__(self, raw, json_codec=None):
+        self.raw = raw
+        self._json_codec = json_codec or get_json_codec(None)
+        self._message = None
+        self._post = None
+
+    @property
+    def message(self):
+        """
+        :return: The decoded frame, an empty dict if it is not a JSON object
+        """
+        if self._message is None:
+            try:
+                message = self._json_codec.loads(self.raw)
+            except ValueError:
+                message = None
+            self._message = message if isinstance(message, dict) else {}
+        return self._message
+
+    @property
+    def event(self):
+        """
+        :return: The event type, e.g. ``"posted"``
+        """
+        return self.message.get("event", "")
+
+    @property
+    def data(self):
+        return self.message.get("data") or {}
+
+    @property
+    def broadcast(self):
+        return self.message.get("broadcast") or {}
+
+    @property
+    def seq(self):
+        return self.message.get("seq")
+
+    @property
+    def channel_id(self):
+        """
+        :return: The channel the event belongs to, or None
+        """
+        return self.broadcast.get("channel_id") or self.data.get("channel_id") or None
+
+    @property
+    def post(self):
+        """
+        :return: The post of ``posted``, ``post_edited`` and ``post_deleted``
+            events, which Mattermost sends as a JSON string, decoded on first access.
+        """
+        if self._post is None:
+            post = self.data.get("post")
+            self._post = self._json_codec.loads(post) if isinstance(post, (str, bytes)) else post
+        return self._post
+
+    def __getitem__(self, key):
+        return self.message[key]
+
+    def get(self, key, default=None):
+        return self.message.get(key, default)
+
+    def __repr__(self):
+        return f"WebsocketEvent({self.raw!r})"
+
+
+class EventRouter:
+    """Call handlers registered per event type with the :class:`WebsocketEvent` received.
+
+    Pass a router as event handler of ``init_websocket()`` instead of a
+    function. Handlers are looked up by event type, so an event is only
+    passed to the handlers interested in it, and parsed once for all of them.
+
+    .. code:: python
+
+            router = EventRouter()
+
+            @router.on("posted")
+            async def on_posted(event):
+                print(event.post["message"])
+
+            await driver.init_websocket(router)
+
+    Handlers registered for ``"*"`` receive every event, after the handlers
+    of its type.
+    """
+
+    def __init__(self):
+        self._routes = {}
+
+    def on(self, event, handler=None):
+        """Register the coroutine function ``handler`` for events of type ``event``.
+
+        Without ``handler``, returns a decorator registering the decorated function.
+        """
+        if handler is None:
+            return lambda handler: self.on(event, handler)
+        self._routes.setdefault(event, []).append(handler)
+        return handler
+
+    def off(self, event, handler):
+        self._routes[event].remove(handler)
+
+    def handlers(self, event):
+        """
+        :return: The handlers of events of type ``event``
+        """
+        return self._routes.get(event, []) + self._routes.get(ANY_EVENT, [])
+
+    async def __call__(self, event):
+        for handler in self.handlers(event.event):
+            await handler(event)
@@ -176,3 +176,18 @@ class FeatureDisabled(MattermostError):
             request_id=request_id,
             is_oauth_error=is_oauth_error,
         )
+
+
+class CircuitOpen(Exception):
+    """
+    Raised without sending the request when the circuit breaker of its
+    endpoint prefix is open, after repeated failures of that part of the API.
+
+    ``retry_after`` holds the seconds until a request is let through again
+    to probe whether the endpoints recovered.
+    """
+
+    def __init__(self, prefix: str, retry_after: float):
+        super().__init__(f"Circuit for {prefix} is open, retry in {retry_after:.1f} seconds")
+        self.prefix: str = prefix
+        self.retry_after: float = retry_after
@@ -0,0 +1,101 @@
+"""
+Hedging policy: send a second attempt of slow idempotent requests
+"""
+
+import threading
+
+from .instrumentation import LATENCY_BUCKETS, LatencyHistogram
+
+
+class HedgePolicy:
+    """Decide when a slow request is sent a second time.
+
+    If no response was received after the hedging delay, the client sends
+    the same request again on another connection and uses whichever response
+    arrives first. The delay is either fixed, or the ``quantile`` of the
+    latencies observed for the endpoint, so only the slowest requests are
+    hedged. No request is hedged until ``min_samples`` responses of an
+    endpoint were observed.
+
+    Hedges are limited to ``max_rate`` of the requests (e.g. 0.05 for 5%), so
+    a slow server does not receive twice the load.
+
+    Only ``GET`` and ``HEAD`` requests are hedged by default. ``PUT`` and
+    ``DELETE`` are idempotent too and can be added to ``methods``, but the
+    response of the slower attempt is discarded, so e.g. a hedged ``DELETE``
+    may report the resource as missing.
+
+    :param delay: Fixed hedging delay in seconds, instead of the ``quantile``
+    :param quantile: Latency quantile used as hedging delay
+    :param max_rate: Maximum fraction of the requests that are hedged
+    :param min_samples: Responses of an endpoint observed before its quantile is used
+    :param methods: Lower case HTTP methods that are hedged
+    :param burst: Maximum number of hedges saved up during quiet periods
+    :param buckets: Upper bounds of the latency histogram buckets in seconds
+    """
+
+    def __init__(
+        self,
+        delay=None,
+        quantile=0.95,
+        max_rate=0.05,
+        min_samples=20,
+        methods=("get", "head"),
+        burst=10,
+        buckets=LATENCY_BUCKETS,
+    ):
+        self.fixed_delay = delay
+        self.quantile = quantile
+        self.max_rate = max_rate
+        self.min_samples = min_samples
+        self.methods = tuple(methods)
+        self.burst = burst
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._budget = 0.0
+
+    def attach(self, client):
+        """Observe the response latencies of ``client``. Returns ``self``."""
+        client.add_hook("response", self)
+        return self
+
+    def __call__(self, event):
+        # Error responses are often fast and would lower the hedging delay
+        if event.status >= 500 or event.method not in self.methods:
+            return
+        key = (event.method, event.endpoint)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram(self.buckets)
+            histogram.observe(event.duration)
+
+    def delay(self, method, endpoint):
+        """Seconds to wait for a response before hedging a request, or None to not hedge it.
+
+        Each call adds to the hedging budget, see ``max_rate``.
+
+        :param endpoint: Endpoint template, see :func:`~mattermostautodriver.instrumentation.endpoint_template`
+        """
+        if method not in self.methods:
+            return None
+        with self._lock:
+            self._budget = min(self.burst, self._budget + self.max_rate)
+            if self.fixed_delay is not None:
+                return self.fixed_delay
+            histogram = self._histograms.get((method, endpoint))
+            if histogram is None or histogram.count < self.min_samples:
+                return None
+            return histogram.quantile(self.quantile)
+
+    def acquire(self):
+        """Take a hedge from the budget.
+
+        :return: False if the hedge rate limit is reached and the request must not be hedged
+        """
+        with self._lock:
+            if self._budget < 1:
+                return False
+            self._budget -= 1
+            return True
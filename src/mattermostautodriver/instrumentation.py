@@ -0,0 +1,199 @@
+"""
+Request instrumentation: events emitted by the clients and an in-memory aggregator
+"""
+
+import bisect
+import functools
+import re
+import threading
+from collections import namedtuple
+
+REQUEST_EVENTS = ("request", "response", "retry", "error", "pause")
+"""
+Events a hook can be registered for with ``BaseClient.add_hook``:
+
+- ``request`` - before each attempt is sent
+- ``response`` - after each response is received, whatever its status
+- ``retry`` - when an attempt failed and is going to be retried after ``delay`` seconds
+- ``error`` - when the request fails for good, with the raised exception,
+  including when it is cancelled while waiting for a response
+- ``pause`` - when a 429 response holds back all requests of the client for ``delay`` seconds
+"""
+
+RequestEvent = namedtuple(
+    "RequestEvent",
+    ["event", "method", "endpoint", "path", "attempt", "status", "bytes", "duration", "elapsed", "error", "delay"],
+)
+RequestEvent.__doc__ = """Event passed to request hooks.
+
+- ``event`` - one of :data:`REQUEST_EVENTS`
+- ``method`` - lower case HTTP method
+- ``endpoint`` - path with identifiers replaced by placeholders, see :func:`endpoint_template`
+- ``path`` - path as requested
+- ``attempt`` - 0 for the first attempt, incremented on each retry
+- ``status`` - HTTP status of the response, if one was received
+- ``bytes`` - size of the response body, if known
+- ``duration`` - seconds spent sending this attempt and receiving its response
+- ``elapsed`` - seconds since the first attempt, including waits between retries
+- ``error`` - exception of a failed attempt or request
+- ``delay`` - seconds until the next attempt, for ``retry`` and ``pause`` events
+"""
+
+# Upper bounds in seconds, the same as the Prometheus client defaults
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+
+# Mattermost ids are 26 lower case base32 characters
+_ID_SEGMENT = re.compile(r"(?<=/)[a-z0-9]{26}(?=/|$)")
+_NUMBER_SEGMENT = re.compile(r"(?<=/)\d+(?=/|$)")
+_NAMED_SEGMENT = re.compile(r"(?<=/)(username|email|name)/[^/]+")
+
+
+@functools.lru_cache(maxsize=4096)
+def endpoint_template(path):
+    """Group requests to the same endpoint by replacing identifiers in ``path``.
+
+    ``/api/v4/users/<26 character id>/teams`` becomes ``/api/v4/users/{id}/teams``,
+    numbers become ``{n}`` and the value following ``username``, ``email`` and
+    ``name`` segments becomes ``{name}``.
+    """
+    path = _ID_SEGMENT.sub("{id}", path)
+    path = _NAMED_SEGMENT.sub(r"\1/{name}", path)
+    return _NUMBER_SEGMENT.sub("{n}", path)
+
+
+class LatencyHistogram:
+    """Histogram of durations over fixed buckets.
+
+    :param buckets: Sorted upper bounds of the buckets in seconds. Larger
+        values are counted in an implicit ``+Inf`` bucket.
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q):
+        """Estimate the ``q`` quantile (0 to 1) by linear interpolation within its bucket.
+
+        :return: Seconds, the largest bucket bound for values in the ``+Inf``
+            bucket, or None if nothing was observed
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                if i == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[i - 1] if i else 0.0
+                return lower + (self.buckets[i] - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1]
+
+
+EndpointStats = namedtuple("EndpointStats", ["requests", "errors", "retries", "total", "p50", "p95", "p99"])
+
+
+class RequestStats:
+    """Aggregate request events into per endpoint latency histograms and retry counts.
+
+    A ``RequestStats`` is a hook for the ``response``, ``retry`` and ``error``
+    events. Enable it with the ``request_stats`` driver option, or register
+    it on one or more clients with :meth:`attach`.
+
+    Latencies are measured per attempt, from sending the request to
+    receiving the response headers (or the whole body, unless streamed).
+
+    :param buckets: Upper bounds of the latency histogram buckets in seconds
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._errors = {}
+        self._retries = {}
+
+    def attach(self, client):
+        """Register as hook of ``client``. Returns ``self``."""
+        for event in ("response", "retry", "error"):
+            client.add_hook(event, self)
+        return self
+
+    def __call__(self, event):
+        key = (event.method, event.endpoint)
+        with self._lock:
+            if event.event == "response":
+                histogram = self._histograms.get(key)
+                if histogram is None:
+                    histogram = self._histograms[key] = LatencyHistogram(self.buckets)
+                histogram.observe(event.duration)
+            elif event.event == "retry":
+                self._retries[key] = self._retries.get(key, 0) + 1
+            elif event.event == "error":
+                self._errors[key] = self._errors.get(key, 0) + 1
+
+    def histograms(self):
+        """
+        :return: A copy of the latency histograms keyed by (method, endpoint)
+        """
+        with self._lock:
+            copies = {}
+            for key, histogram in self._histograms.items():
+                copy = LatencyHistogram(histogram.buckets)
+                copy.counts, copy.count, copy.sum = list(histogram.counts), histogram.count, histogram.sum
+                copies[key] = copy
+            return copies
+
+    def summary(self):
+        """
+        :return: ``EndpointStats`` keyed by (method, endpoint), the endpoints
+            taking the most time in total first
+        """
+        histograms = self.histograms()
+        with self._lock:
+            keys = set(histograms) | set(self._errors) | set(self._retries)
+            stats = {}
+            for key in keys:
+                histogram = histograms.get(key) or LatencyHistogram(self.buckets)
+                stats[key] = EndpointStats(
+                    requests=histogram.count,
+                    errors=self._errors.get(key, 0),
+                    retries=self._retries.get(key, 0),
+                    total=histogram.sum,
+                    p50=histogram.quantile(0.5),
+                    p95=histogram.quantile(0.95),
+                    p99=histogram.quantile(0.99),
+                )
+        return dict(sorted(stats.items(), key=lambda item: item[1].total, reverse=True))
+
+    def report(self):
+        """
+        :return: The :meth:`summary` as a text table
+        """
+        lines = [
+            f"{'method':<7} {'endpoint':<60} {'count':>7} {'errors':>6} {'retries':>7} {'p50':>8} {'p95':>8} {'p99':>8}"
+        ]
+        for (method, endpoint), stats in self.summary().items():
+            quantiles = " ".join(
+                f"{value * 1000:>6.1f}ms" if value is not None else f"{'-':>8}"
+                for value in (stats.p50, stats.p95, stats.p99)
+            )
+            lines.append(
+                f"{method.upper():<7} {endpoint:<60} {stats.requests:>7} {stats.errors:>6} {stats.retries:>7} {quantiles}"
+            )
+        return "\n".join(lines)
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._errors.clear()
+            self._retries.clear()
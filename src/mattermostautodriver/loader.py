@@ -0,0 +1,114 @@
+"""
+Batching of individual lookups into the bulk endpoints of the API
+"""
+
+import asyncio
+import logging
+
+log = logging.getLogger("mattermostautodriver.api")
+
+BULK_LOOKUPS = {
+    "users": ("users", "get_users_by_ids", "id"),
+    "users_by_username": ("users", "get_users_by_usernames", "username"),
+    "posts": ("posts", "get_posts_by_ids", "id"),
+    "reactions": ("reactions", "get_bulk_reactions", None),
+    "statuses": ("status", "get_users_statuses_by_ids", "user_id"),
+    "emojis": ("emoji", "get_emojis_by_names", "name"),
+    "roles": ("roles", "get_roles_by_names", "name"),
+    "groups": ("groups", "get_groups_by_names", "name"),
+}
+"""
+Loaders available from ``AsyncTypedDriver.loader``, by name: the endpoint
+group and bulk method called, and the field identifying the items of its
+result (None when the result is already a mapping keyed by the requested keys).
+"""
+
+
+class BatchLoader:
+    """Collect individual ``load(key)`` calls into bulk requests.
+
+    Keys requested while the event loop runs the current batch of ready
+    tasks (or within ``wait`` seconds of the first one) are sent together
+    in a single call of ``batch_fn``. Each caller then receives its own item,
+    or None if the result does not contain it. If the bulk call fails, every
+    caller of the batch receives its exception.
+
+    Results are not cached: a key requested again in a later batch is
+    requested again.
+
+    :param batch_fn: Coroutine function taking a list of keys and returning
+        either a list of items or a mapping of key to item
+    :param key: Field of an item of a list result holding its key, or a
+        function returning the key of an item
+    :param max_batch_size: Maximum number of keys per bulk call, a full
+        batch is sent right away
+    :param wait: Seconds to collect keys before sending a batch. The default
+        of 0 only collects keys requested by tasks ready at the same time.
+    """
+
+    def __init__(self, batch_fn, key="id", max_batch_size=100, wait=0.0):
+        self._batch_fn = batch_fn
+        self._key = key if key is None or callable(key) else (lambda item: item[key])
+        self.max_batch_size = max_batch_size
+        self.wait = wait
+        self._pending = {}
+        self._handle = None
+        self._tasks = set()
+
+    async def load(self, key):
+        """
+        :return: The item identified by ``key``, or None if the server did not return it
+        """
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._pending[key] = loop.create_future()
+            if len(self._pending) >= self.max_batch_size:
+                self._dispatch()
+            elif self._handle is None:
+                self._handle = (
+                    loop.call_later(self.wait, self._dispatch) if self.wait else loop.call_soon(self._dispatch)
+                )
+        # Shielded so a cancelled caller does not cancel the result shared with other callers
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys):
+        """
+        :return: The items identified by ``keys``, in the same order
+        """
+        return await asyncio.gather(*(self.load(key) for key in keys))
+
+    def _dispatch(self):
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._run(batch))
+        # Keep a reference to the task until it is done, the event loop only keeps weak ones
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch):
+        log.debug("Loading %d keys in one batch", len(batch))
+        try:
+            result = await self._batch_fn(list(batch))
+            if self._key is None:
+                items = result or {}
+            else:
+                items = {self._key(item): item for item in result or ()}
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        except BaseException:
+            # E.g. cancelled on shutdown, the callers must not wait forever
+            for future in batch.values():
+                future.cancel()
+            raise
+
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(items.get(key))
@@ -0,0 +1,260 @@
+"""
+Driver and websocket metrics in the OpenMetrics (Prometheus) text format
+"""
+
+import http.server
+import logging
+import threading
+import weakref
+
+from .instrumentation import LATENCY_BUCKETS, LatencyHistogram
+
+log = logging.getLogger("mattermostautodriver.api")
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names, values, extra=""):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _bound(value):
+    return "+Inf" if value == float("inf") else repr(float(value))
+
+
+class MetricsCollector:
+    """Collect request and websocket metrics and render them in the OpenMetrics text format.
+
+    Enable it with the ``metrics`` driver option, which attaches it to the
+    driver's client and websocket, or attach it to clients with :meth:`attach`.
+    Expose the metrics with :meth:`render` from an existing web application,
+    or with :meth:`serve` on a dedicated port.
+
+    Request metrics are labelled with the method and the endpoint with
+    identifiers replaced by placeholders, see
+    :func:`~mattermostautodriver.instrumentation.endpoint_template`.
+
+    :param buckets: Upper bounds of the latency histogram buckets in seconds
+    :param namespace: Prefix of the metric names
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS, namespace="mattermost"):
+        self.buckets = tuple(buckets)
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._clients = weakref.WeakSet()
+        self._requests = {}
+        self._durations = {}
+        self._retries = {}
+        self._rate_limited = {}
+        self._errors = {}
+        self._in_flight = 0
+        self._websocket_events = {}
+        self._websocket_reconnects = 0
+        self._websocket_dropped = {}
+        self._dispatchers = weakref.WeakSet()
+        self._handler_durations = LatencyHistogram(self.buckets)
+
+    def attach(self, client):
+        """Collect the requests of ``client`` and the usage of its connection pool. Returns ``self``."""
+        for event in ("request", "response", "retry", "error"):
+            client.add_hook(event, self)
+        self._clients.add(client)
+        return self
+
+    def __call__(self, event):
+        key = (event.method, event.endpoint)
+        with self._lock:
+            if event.event == "request":
+                self._in_flight += 1
+            elif event.event == "response":
+                self._in_flight -= 1
+                status_key = (*key, str(event.status))
+                self._requests[status_key] = self._requests.get(status_key, 0) + 1
+                histogram = self._durations.get(status_key)
+                if histogram is None:
+                    histogram = self._durations[status_key] = LatencyHistogram(self.buckets)
+                histogram.observe(event.duration)
+                if event.status == 429:
+                    self._rate_limited[key] = self._rate_limited.get(key, 0) + 1
+            else:
+                if event.status is None:
+                    # The attempt failed without a response, it is no longer in flight
+                    self._in_flight -= 1
+                counters = self._retries if event.event == "retry" else self._errors
+                counters[key] = counters.get(key, 0) + 1
+
+    def websocket_event(self, event, handler_duration):
+        """Record a websocket event of type ``event`` whose handler ran for ``handler_duration`` seconds."""
+        with self._lock:
+            self._websocket_events[event] = self._websocket_events.get(event, 0) + 1
+            self._handler_durations.observe(handler_duration)
+
+    def websocket_reconnect(self):
+        with self._lock:
+            self._websocket_reconnects += 1
+
+    def attach_dispatcher(self, dispatcher):
+        """Report the queue depth of a websocket ``EventDispatcher``. Returns ``self``."""
+        self._dispatchers.add(dispatcher)
+        return self
+
+    def websocket_dropped(self, event):
+        """Record a websocket event of type ``event`` dropped because the dispatch queue was full."""
+        with self._lock:
+            self._websocket_dropped[event] = self._websocket_dropped.get(event, 0) + 1
+
+    def _pool_usage(self):
+        """Count the active and idle connections of the attached clients' pools.
+
+        HTTPX does not expose its pool publicly, so this relies on the
+        internals of its default transport and is skipped for other transports.
+        """
+        # Clients sharing an HTTPX client (http_client option) share its pool
+        pools = {}
+        for client in list(self._clients):
+            pool = getattr(getattr(client.client, "_transport", None), "_pool", None)
+            if pool is not None:
+                pools[id(pool)] = pool
+        active = idle = 0
+        for pool in pools.values():
+            for connection in getattr(pool, "connections", ()):
+                if connection.is_idle():
+                    idle += 1
+                elif not connection.is_closed():
+                    active += 1
+        return active, idle
+
+    def render(self):
+        """
+        :return: The metrics in the OpenMetrics text format, served with :data:`CONTENT_TYPE`
+        """
+        active, idle = self._pool_usage()
+        queued = sum(dispatcher.depth for dispatcher in list(self._dispatchers))
+        ns = self.namespace
+        lines = []
+
+        def family(name, kind, help_text, samples):
+            lines.append(f"# TYPE {ns}_{name} {kind}")
+            lines.append(f"# HELP {ns}_{name} {help_text}")
+            lines.extend(samples)
+
+        def counter_samples(name, label_names, counters):
+            return [f"{ns}_{name}_total{_labels(label_names, key)} {value}" for key, value in sorted(counters.items())]
+
+        def histogram_samples(name, label_names, key, histogram):
+            samples = []
+            cumulative = 0
+            for bound, count in zip((*histogram.buckets, float("inf")), histogram.counts):
+                cumulative += count
+                le = 'le="' + _bound(bound) + '"'
+                samples.append(f"{ns}_{name}_bucket{_labels(label_names, key, le)} {cumulative}")
+            samples.append(f"{ns}_{name}_count{_labels(label_names, key)} {histogram.count}")
+            samples.append(f"{ns}_{name}_sum{_labels(label_names, key)} {histogram.sum}")
+            return samples
+
+        request_labels = ("method", "endpoint")
+        status_labels = ("method", "endpoint", "status")
+        with self._lock:
+            family(
+                "requests", "counter", "Responses received", counter_samples("requests", status_labels, self._requests)
+            )
+            durations = []
+            for key, histogram in sorted(self._durations.items()):
+                durations.extend(histogram_samples("request_duration_seconds", status_labels, key, histogram))
+            family("request_duration_seconds", "histogram", "Duration of request attempts", durations)
+            family(
+                "request_retries",
+                "counter",
+                "Request attempts that were retried",
+                counter_samples("request_retries", request_labels, self._retries),
+            )
+            family(
+                "rate_limited",
+                "counter",
+                "Responses with status 429 Too Many Requests",
+                counter_samples("rate_limited", request_labels, self._rate_limited),
+            )
+            family(
+                "request_errors",
+                "counter",
+                "Requests that failed after all retries",
+                counter_samples("request_errors", request_labels, self._errors),
+            )
+            family(
+                "requests_in_flight",
+                "gauge",
+                "Request attempts waiting for a response",
+                [f"{ns}_requests_in_flight {self._in_flight}"],
+            )
+            family(
+                "pool_connections",
+                "gauge",
+                "HTTP connections in the connection pools",
+                [f'{ns}_pool_connections{{state="active"}} {active}', f'{ns}_pool_connections{{state="idle"}} {idle}'],
+            )
+            family(
+                "websocket_events",
+                "counter",
+                "Websocket events received",
+                counter_samples("websocket_events", ("event",), {(k,): v for k, v in self._websocket_events.items()}),
+            )
+            family(
+                "websocket_reconnects",
+                "counter",
+                "Websocket reconnections",
+                [f"{ns}_websocket_reconnects_total {self._websocket_reconnects}"],
+            )
+            family(
+                "websocket_queue_depth",
+                "gauge",
+                "Websocket events waiting for a dispatch worker",
+                [f"{ns}_websocket_queue_depth {queued}"],
+            )
+            family(
+                "websocket_dropped_events",
+                "counter",
+                "Websocket events dropped because the dispatch queue was full",
+                counter_samples(
+                    "websocket_dropped_events", ("event",), {(k,): v for k, v in self._websocket_dropped.items()}
+                ),
+            )
+            family(
+                "websocket_handler_duration_seconds",
+                "histogram",
+                "Time spent in the websocket event handler, delaying the following events",
+                histogram_samples("websocket_handler_duration_seconds", (), (), self._handler_durations),
+            )
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port=9464, addr="127.0.0.1"):
+        """Serve :meth:`render` over HTTP from a daemon thread.
+
+        :return: The ``http.server.ThreadingHTTPServer``, call its ``shutdown()`` to stop it
+        """
+        collector = self
+
+        class MetricsHandler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = collector.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                log.debug("Metrics request: " + format, *args)
+
+        server = http.server.ThreadingHTTPServer((addr, port), MetricsHandler)
+        threading.Thread(target=server.serve_forever, name="mattermost-metrics", daemon=True).start()
+        log.info("Serving metrics on http://%s:%d/metrics", addr, server.server_address[1])
+        return server
@@ -0,0 +1,211 @@
+"""
+Websockets of many accounts in one event loop, sharing a session and a stream of events
+"""
+
+import asyncio
+import functools
+import logging
+import time
+from collections import namedtuple
+
+from .events import ANY_EVENT, EventRouter
+from .websocket import Websocket, create_session
+
+log = logging.getLogger("mattermostautodriver.websocket")
+
+PoolEvent = namedtuple("PoolEvent", ["account", "event", "received"])
+"""
+A :class:`~mattermostautodriver.events.WebsocketEvent` of ``account``,
+``received`` at this ``time.monotonic()``.
+"""
+
+AccountHealth = namedtuple("AccountHealth", ["connected", "connection_id", "sequence", "idle", "connects"])
+"""
+State of the websocket of an account: whether it is ``connected``, the
+``connection_id`` and ``sequence`` it resumes, the seconds since its last
+event (``idle``, None before the first one) and its connection attempts.
+"""
+
+
+class _PooledWebsocket(Websocket):
+    def __init__(self, pool, options, token):
+        super().__init__(options, token)
+        self._pool = pool
+        self.connects = 0
+
+    async def _before_connect(self):
+        await self._pool._wait_for_turn()
+        self.connects += 1
+
+
+class WebsocketPool:
+    """Run the websockets of many accounts, e.g. bots, in one event loop.
+
+    The websockets share one ``aiohttp`` session, and their connection
+    attempts are spaced ``stagger`` seconds apart across the pool, so that
+    starting the pool or reconnecting after a server restart does not open
+    every connection at once. Their events are tagged with the name of the
+    account and put on one queue, read by iterating over the pool:
+
+    .. code:: python
+
+            async with WebsocketPool() as pool:
+                for driver in drivers:
+                    pool.add(driver)
+                await pool.start()
+                async for account, event, received in pool:
+                    ...
+
+    The websockets reconnect until the pool is stopped, regardless of the
+    ``keepalive`` option of the drivers.
+
+    :param stagger: Minimum seconds between two connection attempts
+    :param queue_size: Maximum number of events waiting to be read. When the
+        queue is full, the websockets wait for room before reading further.
+    :param session: ``aiohttp.ClientSession`` of the websockets, see
+        :func:`~mattermostautodriver.websocket.create_session`. By default the
+        pool creates one, and closes it when stopped.
+    """
+
+    def __init__(self, stagger=0.05, queue_size=10000, session=None):
+        self.stagger = stagger
+        self.queue_size = queue_size
+        self._session = session
+        self._owns_session = session is None
+        self._websockets = {}
+        self._tasks = {}
+        self._queue = None
+        self._next_connect = 0.0
+        self._running = False
+        self.lag = 0.0
+
+    @property
+    def websockets(self):
+        """
+        :return: The websockets by account name
+        """
+        return dict(self._websockets)
+
+    def add(self, driver, name=None):
+        """Add the websocket of a logged in driver, started right away if the pool runs.
+
+        :param driver: A ``TypedDriver`` or ``AsyncTypedDriver``
+        :param name: Name of the account in events and health reports,
+            defaults to the ``login_id`` of the driver
+        :return: The name of the account
+        """
+        name = name or driver.options.get("login_id") or f"account{len(self._websockets) + 1}"
+        if name in self._websockets:
+            raise ValueError(f"Account {name!r} is already in the pool")
+        options = {**driver.options, "keepalive": True}
+        self._websockets[name] = _PooledWebsocket(self, options, driver.client.token)
+        if self._running:
+            self._connect(name)
+        return name
+
+    async def remove(self, name):
+        """Disconnect the websocket of account ``name`` and remove it from the pool."""
+        websocket = self._websockets.pop(name)
+        websocket.disconnect()
+        task = self._tasks.pop(name, None)
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def start(self):
+        """Connect the websockets of the pool. Does nothing if it is running."""
+        if self._running:
+            return
+        if self._session is None:
+            self._session = create_session()
+        self._queue = asyncio.Queue(self.queue_size)
+        self._running = True
+        for name in self._websockets:
+            self._connect(name)
+
+    async def stop(self):
+        """Disconnect every websocket. Events already queued can still be read."""
+        self._running = False
+        for websocket in self._websockets.values():
+            websocket.disconnect()
+        tasks, self._tasks = list(self._tasks.values()), {}
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._queue is not None and self._queue.empty():
+            # Wake up a reader waiting for an event
+            self._queue.put_nowait(None)
+
+    def _connect(self, name):
+        websocket = self._websockets[name]
+        websocket.options["websocket_session"] = self._session
+        router = EventRouter()
+        router.on(ANY_EVENT, functools.partial(self._receive, name))
+        self._tasks[name] = asyncio.create_task(websocket.connect(router), name=f"mattermost-websocket-{name}")
+
+    async def _wait_for_turn(self):
+        """Wait until ``stagger`` seconds passed since the previous connection attempt of the pool."""
+        now = asyncio.get_running_loop().time()
+        turn = max(now, self._next_connect)
+        self._next_connect = turn + self.stagger
+        await asyncio.sleep(turn - now)
+
+    async def _receive(self, name, event):
+        if not event.event:
+            # Replies to the authentication challenge and other websocket actions
+            return
+        await self._queue.put(PoolEvent(name, event, time.monotonic()))
+
+    def __aiter__(self):
+        return self._events()
+
+    async def _events(self):
+        while self._running or not self._queue.empty():
+            tagged = await self._queue.get()
+            if tagged is None:
+                return
+            self.lag = time.monotonic() - tagged.received
+            yield tagged
+
+    def health(self):
+        """
+        :return: The ``AccountHealth`` of each account by name
+        """
+        now = time.time()
+        return {
+            name: AccountHealth(
+                websocket.connected,
+                websocket.connection_id,
+                websocket.sequence,
+                now - websocket._last_event_at if websocket._last_event_at else None,
+                websocket.connects,
+            )
+            for name, websocket in self._websockets.items()
+        }
+
+    def summary(self):
+        """
+        :return: A dict with the number of ``accounts`` and of ``connected``
+            ones, the ``reconnects`` of all accounts, the longest time without
+            event of an account (``max_idle``), the ``queue_depth`` and the
+            ``lag`` in seconds between receiving and reading the last event read.
+        """
+        health = self.health().values()
+        idle = [account.idle for account in health if account.idle is not None]
+        return {
+            "accounts": len(health),
+            "connected": sum(account.connected for account in health),
+            "reconnects": sum(max(account.connects - 1, 0) for account in health),
+            "max_idle": max(idle, default=None),
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "lag": self.lag,
+        }
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
@@ -0,0 +1,96 @@
+"""
+Client side rate limiter learning the server's budget from its rate limit headers
+"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Token bucket mirroring the server's rate limit.
+
+    Mattermost reports its limiter state on every response:
+
+    - ``X-RateLimit-Limit`` - size of the bucket, i.e. the maximum burst
+    - ``X-RateLimit-Remaining`` - requests left in the bucket
+    - ``X-RateLimit-Reset`` - seconds until the bucket is full again
+
+    The bucket is resized and refilled from these headers, so requests are
+    spaced out before the server budget is exhausted instead of after a 429.
+    Until a response carrying the headers is seen, requests are not throttled.
+
+    A limiter is thread safe and can be shared by several clients talking to
+    the same server with the same credentials.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._limit = None
+        self._tokens = 0.0
+        self._rate = 0.0
+        self._updated = time.monotonic()
+
+    @property
+    def limit(self):
+        """
+        :return: The size of the server's bucket, or None if not known yet
+        """
+        return self._limit
+
+    @property
+    def remaining(self):
+        """
+        :return: The estimated number of requests that can be sent right now
+            without waiting, or None if the server's budget is not known yet
+        """
+        with self._lock:
+            if self._limit is None:
+                return None
+            self._refill()
+            return max(0, int(self._tokens))
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self._limit, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def reserve(self):
+        """Take a token for one request.
+
+        :return: Seconds to wait before sending the request, 0 if it can be sent right away
+        """
+        with self._lock:
+            if self._limit is None:
+                return 0.0
+            self._refill()
+            # Tokens are taken even when none is left, so concurrent requests
+            # queue up one refill interval apart rather than all at once.
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            if self._rate <= 0:
+                # No refill rate learned yet: let the request through and
+                # rely on the server response to resynchronize the bucket.
+                self._tokens = 0.0
+                return 0.0
+            return -self._tokens / self._rate
+
+    def update(self, limit, remaining, reset):
+        """Synchronize the bucket with the rate limit headers of a response.
+
+        :param limit: Value of ``X-RateLimit-Limit``
+        :param remaining: Value of ``X-RateLimit-Remaining``
+        :param reset: Seconds until the bucket is full, from ``X-RateLimit-Reset``
+        """
+        with self._lock:
+            if self._limit is None:
+                self._tokens = float(remaining)
+            else:
+                self._refill()
+                # Responses of requests sent before our latest reservations
+                # report a fuller bucket than there is, so only ever lower it.
+                self._tokens = min(self._tokens, float(remaining))
+            self._limit = limit
+            if reset and limit > remaining:
+                self._rate = (limit - remaining) / reset
+            self._updated = time.monotonic()
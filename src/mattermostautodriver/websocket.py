@@ -1,14 +1,65 @@
-import json
 import ssl
 import asyncio
+import functools
 import logging
+import random
 import time
+import urllib.parse
 
 import aiohttp
 
+from .codec import get_json_codec
+from .dispatch import EventDispatcher
+from .events import EventRouter, WebsocketEvent
+from .metrics import MetricsCollector
+
 log = logging.getLogger("mattermostautodriver.websocket")
 log.setLevel(logging.INFO)
 
+GAP_EVENT = "gap"
+"""
+Type of the event passed to the event handler when events may have been
+missed, see :meth:`Websocket._emit_gap`.
+"""
+
+AUTHENTICATION_TIMEOUT = 5
+"""
+Seconds to wait for the server to answer the authentication challenge. A
+connection authenticated when upgrading may get no answer, see
+:meth:`Websocket._authenticate_websocket`.
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def ssl_context(verify=True):
+    """
+    :return: The SSL context of websocket connections, created once per
+        ``verify`` setting as loading the CA certificates is expensive.
+    """
+    context = ssl.create_default_context(purpose=ssl.Purpose.SERVER_AUTH)
+    if not verify:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+def create_session(dns_cache_ttl=300, limit=0):
+    """Create an ``aiohttp.ClientSession`` for websocket connections.
+
+    Pass it as the ``websocket_session`` option to share it between
+    websockets, e.g. of many bot accounts. Must be called from a coroutine,
+    and closed with ``await session.close()`` once every websocket stopped.
+
+    :param dns_cache_ttl: Seconds during which resolved host names are reused
+    :param limit: Maximum number of simultaneous connections, 0 for no limit.
+        Each websocket holds a connection as long as it is connected.
+    """
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=limit, ttl_dns_cache=dns_cache_ttl),
+        # Cookies set for one account must not be sent for the others
+        cookie_jar=aiohttp.DummyCookieJar(),
+    )
+
 
 class Websocket:
     def __init__(self, options, token):
@@ -18,6 +69,17 @@ class Websocket:
         self._token = token
         self._alive = False
         self._last_msg = 0
+        self._json_codec = get_json_codec(options.get("json_codec"))
+        metrics = options.get("metrics")
+        self._metrics = MetricsCollector() if metrics is True else metrics or None
+        self._dispatcher = None
+        self._session = None
+        self._websocket = None
+        # Reliable websocket state: the connection to resume and the next
+        # sequence number expected from the server
+        self.connection_id = ""
+        self.sequence = 0
+        self._last_event_at = 0.0
 
     async def connect(self, event_handler):
         """
@@ -25,19 +87,18 @@ class Websocket:
         When the authentication has finished, start the loop listening for messages,
         sending a ping to the server to keep the connection alive.
 
-        :param event_handler: Every websocket event will be passed there. Takes one argument.
-        :type event_handler: Function(message)
+        :param event_handler: Every websocket event will be passed there. Takes one argument,
+            the message as received. An ``EventRouter`` receives the parsed
+            ``WebsocketEvent`` instead and passes it to the handlers of its type.
+        :type event_handler: Function(message) or EventRouter
         :return:
         """
-        context = ssl.create_default_context(purpose=ssl.Purpose.SERVER_AUTH)
-        if not self.options["verify"]:
-            context.check_hostname = False
-            context.verify_mode = ssl.CERT_NONE
-
         scheme = "wss://"
+        context = True
         if self.options["scheme"] != "https":
             scheme = "ws://"
-            context = None
+        elif not self.options["verify"]:
+            context = ssl_context(verify=False)
 
         url = "{scheme:s}{url:s}:{port:s}/api/v4/websocket".format(
             scheme=scheme, url=self.options["url"], port=str(self.options["port"])
@@ -45,29 +106,145 @@ class Websocket:
 
         self._alive = True
 
+        if self.options.get("websocket_workers"):
+            self._dispatcher = EventDispatcher(
+                functools.partial(self._handle, event_handler=event_handler),
+                workers=self.options["websocket_workers"],
+                queue_size=self.options.get("websocket_queue_size", 1000),
+                overflow=self.options.get("websocket_overflow", "block"),
+                ordered=self.options.get("websocket_ordered", False),
+                metrics=self._metrics,
+            )
+            self._dispatcher.start()
+        # The session is kept across reconnections, reusing its resolved host names
+        self._session = self.options.get("websocket_session")
+        owns_session = self._session is None
+        if owns_session:
+            self._session = create_session()
+        try:
+            await self._run(url, context, event_handler)
+        finally:
+            if self._dispatcher is not None:
+                await self._dispatcher.stop()
+            if owns_session:
+                await self._session.close()
+
+    async def _run(self, url, context, event_handler):
+        connected_before = False
+        # Consecutive reconnections without receiving the hello event
+        attempt = 0
         while True:
+            if connected_before and self._metrics is not None:
+                self._metrics.websocket_reconnect()
+            connected_before = True
+            await self._before_connect()
+            if not self._alive:
+                break
             try:
                 kw_args = {}
                 if self.options["websocket_kw_args"] is not None:
-                    kw_args = self.options["websocket_kw_args"]
-                async with aiohttp.ClientSession() as session:
-                    async with session.ws_connect(
-                        url,
-                        ssl=context,
-                        proxy=self.options["proxy"],
-                        **kw_args,
-                    ) as websocket:
-                        await self._authenticate_websocket(websocket, event_handler)
-                        while self._alive:
-                            try:
-                                await self._start_loop(websocket, event_handler)
-                            except aiohttp.ClientError:
-                                break
-                        if (not self.options["keepalive"]) or (not self._alive):
+                    kw_args = dict(self.options["websocket_kw_args"])
+                # The server only resumes a connection authenticated when upgrading
+                kw_args["headers"] = {"Authorization": f"Bearer {self._token}", **(kw_args.get("headers") or {})}
+                async with self._session.ws_connect(
+                    self._resume_url(url),
+                    ssl=context,
+                    proxy=self.options["proxy"],
+                    **kw_args,
+                ) as websocket:
+                    self._websocket = websocket
+                    try:
+                        if not await self._authenticate_websocket(websocket, event_handler):
                             break
+                        attempt = 0
+                        try:
+                            await self._start_loop(websocket, event_handler)
+                        except aiohttp.ClientError:
+                            pass
+                    finally:
+                        self._websocket = None
+                    if (not self.options["keepalive"]) or (not self._alive):
+                        break
             except Exception as e:
                 log.exception(f"Failed to establish websocket connection: {type(e)} thrown")
-                await asyncio.sleep(self.options["keepalive_delay"])
+            delay = self._reconnect_delay(attempt)
+            attempt += 1
+            log.info("Reconnecting websocket in %.1f seconds", delay)
+            await asyncio.sleep(delay)
+            if not self._alive:
+                break
+
+    async def _before_connect(self):
+        """Called before each connection attempt, e.g. to space out the attempts of many websockets."""
+
+    @property
+    def connected(self):
+        """
+        :return: Whether the websocket is currently connected
+        """
+        return self._websocket is not None
+
+    def _reconnect_delay(self, attempt):
+        """Exponential backoff from ``keepalive_delay`` up to ``keepalive_max_delay``, with jitter.
+
+        Half of the delay is random, so that many clients disconnected at
+        once, e.g. by a server restart, do not all reconnect at the same time.
+        """
+        delay = min(self.options["keepalive_delay"] * 2**attempt, self.options.get("keepalive_max_delay", 60))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def _resume_url(self, url):
+        """Ask the server to resume the previous connection, replaying the events missed since."""
+        if not self.connection_id:
+            return url
+        query = urllib.parse.urlencode({"connection_id": self.connection_id, "sequence_number": self.sequence})
+        return f"{url}?{query}"
+
+    async def _check_sequence(self, event, event_handler):
+        """Track the connection id and sequence number of ``event``, emitting a gap event for missed events.
+
+        The server replays missed events when a connection is resumed. It
+        answers with a new connection id if it cannot, e.g. after a restart
+        or a long disconnection, and events may have been missed.
+        """
+        if event.event == "hello":
+            connection_id = event.data.get("connection_id", "")
+            if self.connection_id and connection_id != self.connection_id:
+                await self._emit_gap(event_handler, "new_connection")
+                # The sequence of the new connection starts over
+                self.sequence = 0
+            self.connection_id = connection_id
+        if event.seq is None:
+            # Replies to websocket actions have no sequence number
+            return
+        if event.seq != self.sequence:
+            log.warning("Missed websocket events %d to %d", self.sequence, event.seq - 1)
+            await self._emit_gap(event_handler, "missed_events")
+        self.sequence = event.seq + 1
+        self._last_event_at = time.time()
+
+    async def _emit_gap(self, event_handler, reason):
+        """Pass a ``gap`` event to the handler, so it can fetch what it missed from the REST API.
+
+        Its ``since`` is the time of the last event received before the gap,
+        in milliseconds like the ``since`` parameter of the API.
+        """
+        message = {
+            "event": GAP_EVENT,
+            "data": {
+                "reason": reason,
+                "since": int(self._last_event_at * 1000),
+                "connection_id": self.connection_id,
+                "sequence_number": self.sequence,
+            },
+            "broadcast": {},
+        }
+        log.info("Websocket events may have been missed since %s (%s)", message["data"]["since"], reason)
+        event = WebsocketEvent(self._json_codec.dumps(message).decode("utf-8"), self._json_codec)
+        if self._dispatcher is not None:
+            await self._dispatcher.put(event)
+        else:
+            await self._handle(event, event_handler)
 
     async def _start_loop(self, websocket, event_handler):
         """
@@ -82,9 +259,21 @@ class Websocket:
 
         try:
             while self._alive:
-                message = await websocket.receive_str()
+                message = await websocket.receive()
+                if message.type in (aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.CLOSING, aiohttp.WSMsgType.CLOSED):
+                    log.info("Websocket connection closed by the server")
+                    return
+                if message.type == aiohttp.WSMsgType.ERROR:
+                    raise message.data
+                if message.type != aiohttp.WSMsgType.TEXT:
+                    continue
+                event = WebsocketEvent(message.data, self._json_codec)
                 self._last_msg = time.time()
-                await event_handler(message)
+                await self._check_sequence(event, event_handler)
+                if self._dispatcher is not None:
+                    await self._dispatcher.put(event)
+                else:
+                    await self._handle(event, event_handler)
         finally:
             log.debug("cancelling heartbeat task")
             if not keep_alive.done():
@@ -96,6 +285,27 @@ class Websocket:
             except Exception:
                 log.debug("heartbeat task finished during websocket shutdown")
 
+    async def _handle(self, event, event_handler):
+        if self._metrics is None:
+            await self._call_handler(event, event_handler)
+        else:
+            await self._handle_measured(event, event_handler)
+
+    @staticmethod
+    async def _call_handler(event, event_handler):
+        if isinstance(event_handler, EventRouter):
+            await event_handler(event)
+        else:
+            await event_handler(event.raw)
+
+    async def _handle_measured(self, event, event_handler):
+        """Pass ``event`` to ``event_handler``, recording its event type and the handler duration."""
+        started = time.perf_counter()
+        try:
+            await self._call_handler(event, event_handler)
+        finally:
+            self._metrics.websocket_event(event.event, time.perf_counter() - started)
+
     async def _do_heartbeats(self, websocket):
         """
         This is a little complicated, but we only need to pong the websocket if
@@ -115,27 +325,59 @@ class Websocket:
                 self._last_msg = time.time()
 
     def disconnect(self):
-        """Sets ``self._alive`` to False so the loop in ``self._start_loop`` will finish."""
+        """Sets ``self._alive`` to False so the loop in ``self._start_loop`` will finish.
+
+        Called from the event loop of the websocket, the connection is also
+        closed right away instead of after the next event, and ``connect``
+        then closes its session unless it was given one.
+        """
         log.info("Disconnecting websocket")
         self._alive = False
+        if self._websocket is not None:
+            try:
+                asyncio.get_running_loop().create_task(self._websocket.close())
+            except RuntimeError:
+                # Not in an event loop, the loop finishes on the next event
+                pass
 
     async def _authenticate_websocket(self, websocket, event_handler):
         """
         Sends a authentication challenge over a websocket.
         This is not needed when we just send the cookie we got on login
         when connecting to the websocket.
+
+        The server ignores the challenge if the connection was authenticated
+        when upgrading, by the ``Authorization`` header or a cookie. It then
+        sends a ``hello`` event for a new connection, the missed events or
+        nothing at all for a resumed one. So a ``hello`` event, any other
+        event or no answer within :data:`AUTHENTICATION_TIMEOUT` seconds
+        count as authenticated as well as an ``OK`` reply.
+
+        :return: Whether the authentication succeeded
         """
         log.debug("Authenticating websocket")
-        json_data = json.dumps({"seq": 1, "action": "authentication_challenge", "data": {"token": self._token}})
-        await websocket.send_str(json_data)
+        json_data = self._json_codec.dumps(
+            {"seq": 1, "action": "authentication_challenge", "data": {"token": self._token}}
+        )
+        await websocket.send_str(json_data.decode("utf-8"))
         while True:
-            message = await websocket.receive_str()
-            status = json.loads(message)
-            log.debug(status)
+            try:
+                message = await asyncio.wait_for(websocket.receive_str(), AUTHENTICATION_TIMEOUT)
+            except asyncio.TimeoutError:
+                log.info("Websocket authenticated when connecting")
+                return True
+            event = WebsocketEvent(message, self._json_codec)
+            log.debug(event.message)
+            await self._check_sequence(event, event_handler)
             # We want to pass the events to the event_handler already
             # because the hello event could arrive before the authentication ok response
-            await event_handler(message)
-            if ("event" in status and status["event"] == "hello") and ("seq" in status and status["seq"] == 0):
-                log.info("Websocket authentication OK")
+            await self._call_handler(event, event_handler)
+            if event.get("seq_reply") == 1:
+                if event.get("status") == "OK":
+                    log.info("Websocket authentication OK")
+                    return True
+                log.error("Websocket authentication failed: %s", event.get("error"))
+                return False
+            if event.event:
+                log.info("Websocket authenticated when connecting")
                 return True
-            log.error("Websocket authentication failed")
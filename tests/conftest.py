@@ -1,6 +1,11 @@
+import json
+
+import aiohttp.test_utils
+import aiohttp.web
 import httpx
 import pytest
 
+from mattermostautodriver import AsyncTypedDriver, TypedDriver
 from mattermostautodriver.client import AsyncClient, Client
 
 _BASE_OPTIONS = {
@@ -29,6 +34,14 @@ def make_async_client(handler, **extra_options):
     return AsyncClient(_client_options(handler, extra_options))
 
 
+def make_driver(handler, **extra_options):
+    return TypedDriver(_client_options(handler, extra_options))
+
+
+def make_async_driver(handler, **extra_options):
+    return AsyncTypedDriver(_client_options(handler, extra_options))
+
+
 def error_response(status, message="something failed", error_id="api.some.error", request_id="req1234"):
     return httpx.Response(status, json={"message": message, "id": error_id, "request_id": request_id})
 
@@ -53,6 +66,197 @@ def sequence_handler(responses):
     return handler, calls
 
 
+class InterruptedStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Response body yielding ``chunks`` and then failing like a dropped connection."""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    def __iter__(self):
+        yield from self._chunks
+        raise httpx.ReadError("connection reset")
+
+    async def __aiter__(self):
+        for chunk in self._chunks:
+            yield chunk
+        raise httpx.ReadError("connection reset")
+
+
+def range_handler(content, fail_after=None):
+    """Handler serving ``content`` with ``Range`` support.
+
+    The first response is cut after ``fail_after`` bytes, if given.
+    """
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        start = int(request.headers.get("Range", "bytes=0-")[len("bytes=") :].rstrip("-"))
+        status = 206 if start else 200
+        if fail_after is not None and len(calls) == 1:
+            return httpx.Response(status, stream=InterruptedStream([content[start:fail_after]]))
+        return httpx.Response(status, content=content[start:])
+
+    return handler, calls
+
+
+class UploadServer:
+    """Handler emulating Mattermost's resumable upload sessions.
+
+    ``failures`` maps a request number to an exception raised, or a response
+    returned, instead of handling that request. A failing request may still
+    have stored ``partial`` bytes of its chunk, as if the connection dropped
+    after the server received them.
+    """
+
+    def __init__(self, failures=None, partial=0):
+        self.failures = failures or {}
+        self.partial = partial
+        self.data = b""
+        self.file_size = None
+        self.calls = []
+
+    @staticmethod
+    def _multipart_file(request):
+        boundary = request.headers["Content-Type"].split("boundary=")[1].encode()
+        part = request.content.split(b"--" + boundary)[1]
+        return part.split(b"\r\n\r\n", 1)[1][: -len(b"\r\n")]
+
+    def __call__(self, request):
+        self.calls.append(request)
+        session = {"id": "upload1", "file_offset": len(self.data), "file_size": self.file_size}
+
+        if request.url.path == "/api/v4/uploads":
+            self.file_size = json.loads(request.content)["file_size"]
+            return httpx.Response(201, json={**session, "file_size": self.file_size})
+        if request.method == "GET":
+            return httpx.Response(200, json=session)
+
+        chunk = self._multipart_file(request)
+        failure = self.failures.get(len(self.calls))
+        if failure is not None:
+            self.data += chunk[: self.partial]
+            if isinstance(failure, Exception):
+                raise failure
+            return failure
+
+        self.data += chunk
+        if len(self.data) < self.file_size:
+            return httpx.Response(204)
+        return httpx.Response(201, json={"id": "file1", "size": len(self.data)})
+
+
+def paged_handler(items):
+    """Handler serving ``items`` according to the ``page`` and ``per_page`` query parameters."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        page = int(request.url.params["page"])
+        per_page = int(request.url.params["per_page"])
+        return httpx.Response(200, json=items[page * per_page : (page + 1) * per_page])
+
+    return handler, calls
+
+
+def cursor_handler(pages):
+    """Handler serving ``pages`` of posts, each linked to the next by its cursor ("c1", "c2", ...)."""
+    calls = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        calls.append(body)
+        index = int(body["cursor"][1:]) if body.get("cursor") else 0
+        page = {"posts": pages[index]}
+        if index + 1 < len(pages):
+            page["next_cursor"] = f"c{index + 1}"
+        return httpx.Response(200, json=page)
+
+    return handler, calls
+
+
+class WebsocketServer:
+    """Mattermost websocket endpoint authenticating by header or challenge.
+
+    Like Mattermost, it ignores the challenge of a connection upgraded with a
+    bearer ``Authorization`` header, and otherwise replies to it with an ``OK``
+    status. It then sends ``hello`` unless the connection resumes one it issued
+    before, which requires the header. Each connection then receives the events
+    returned by ``events_for(connection)`` (by default ``self.events``), and is
+    closed by the server if ``close`` is set. The query parameters and the
+    ``Authorization`` header of each connection are recorded in ``connections``
+    and ``authorizations``.
+    """
+
+    def __init__(self, events=(), close=False):
+        self.events = list(events)
+        self.close = close
+        self.connections = []
+        self.challenges = []
+        self.authorizations = []
+        self.connection_ids = set()
+        self.server = None
+
+    async def handle(self, request):
+        websocket = aiohttp.web.WebSocketResponse()
+        await websocket.prepare(request)
+        self.connections.append(dict(request.query))
+        self.authorizations.append(request.headers.get("Authorization"))
+        self.challenges.append(json.loads(await websocket.receive_str()))
+        if not self.authenticated(len(self.connections)):
+            await websocket.send_str(json.dumps({"status": "OK", "seq_reply": 1}))
+        if not self.resumes(len(self.connections)):
+            hello = self.hello(len(self.connections))
+            self.connection_ids.add(hello["data"]["connection_id"])
+            await websocket.send_str(json.dumps(hello))
+        for event in self.events_for(len(self.connections)):
+            await websocket.send_str(event if isinstance(event, str) else json.dumps(event))
+        if not self.close:
+            async for _ in websocket:
+                pass
+        await websocket.close()
+        return websocket
+
+    def hello(self, connection):
+        return {"event": "hello", "seq": 0, "data": {"connection_id": f"conn{connection}"}, "broadcast": {}}
+
+    def authenticated(self, connection):
+        """Whether the connection was authenticated when upgrading."""
+        return (self.authorizations[connection - 1] or "").startswith("Bearer ")
+
+    def resumes(self, connection):
+        return (
+            self.authenticated(connection)
+            and self.connections[connection - 1].get("connection_id") in self.connection_ids
+        )
+
+    def events_for(self, connection):
+        return self.events
+
+    def options(self, **extra_options):
+        return {
+            **_BASE_OPTIONS,
+            "url": self.server.host,
+            "port": self.server.port,
+            "verify": True,
+            "timeout": 30,
+            "keepalive": False,
+            "keepalive_delay": 0,
+            "websocket_kw_args": None,
+            **extra_options,
+        }
+
+    async def __aenter__(self):
+        app = aiohttp.web.Application()
+        app.router.add_get("/api/v4/websocket", self.handle)
+        self.server = aiohttp.test_utils.TestServer(app)
+        await self.server.start_server()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.server.close()
+
+
 @pytest.fixture
 def sleeps(monkeypatch):
     """Record retry sleeps from either client instead of actually sleeping."""
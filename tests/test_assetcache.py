@@ -0,0 +1,125 @@
+import os
+
+import httpx
+
+from conftest import make_async_client, make_client
+from mattermostautodriver.assetcache import AssetCache
+
+USER_ID = "a" * 26
+OTHER_USER_ID = "b" * 26
+IMAGE = b"\x89PNG image"
+
+
+def image_handler(images=None, etag='"v1"'):
+    """Serve ``images`` by user id, answering ``If-None-Match`` with ``304``, and record the requests."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        user_id = request.url.path.split("/")[4]
+        body = (images or {}).get(user_id, IMAGE)
+        return httpx.Response(200, headers={"Content-Type": "image/png", "ETag": etag}, content=body)
+
+    return handler, requests
+
+
+def test_assets_are_revalidated_from_disk_across_clients(tmp_path):
+    handler, requests = image_handler()
+    client = make_client(handler, asset_cache=str(tmp_path))
+
+    assert client.get(f"/api/v4/users/{USER_ID}/image").content == IMAGE
+
+    # A new client, e.g. after a restart, finds the image on disk
+    client = make_client(handler, asset_cache=str(tmp_path))
+    response = client.get(f"/api/v4/users/{USER_ID}/image")
+
+    assert response.status_code == 200
+    assert response.content == IMAGE
+    assert response.headers["Content-Type"] == "image/png"
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+
+
+def test_fresh_assets_are_not_revalidated(tmp_path):
+    handler, requests = image_handler()
+    client = make_client(handler, asset_cache=AssetCache(tmp_path, ttl=60))
+
+    client.get(f"/api/v4/users/{USER_ID}/image")
+    assert client.get(f"/api/v4/users/{USER_ID}/image").content == IMAGE
+
+    assert len(requests) == 1
+
+
+def test_identical_bodies_are_stored_once(tmp_path):
+    handler, _ = image_handler()
+    client = make_client(handler, asset_cache=AssetCache(tmp_path))
+
+    client.get(f"/api/v4/users/{USER_ID}/image")
+    client.get(f"/api/v4/users/{OTHER_USER_ID}/image")
+
+    assert client.asset_cache.size == len(IMAGE)
+    assert sum(len(files) for _, _, files in os.walk(tmp_path / "bodies")) == 1
+
+
+def test_least_recently_used_bodies_are_evicted(tmp_path):
+    handler, requests = image_handler({USER_ID: b"a" * 60, OTHER_USER_ID: b"b" * 60})
+    client = make_client(handler, asset_cache=AssetCache(tmp_path, max_size=100))
+
+    client.get(f"/api/v4/users/{USER_ID}/image")
+    client.get(f"/api/v4/users/{OTHER_USER_ID}/image")
+    # The first image was evicted: its revalidation is answered with 304, so it is requested again
+    response = client.get(f"/api/v4/users/{USER_ID}/image")
+
+    assert response.content == b"a" * 60
+    assert [request.headers.get("If-None-Match") for request in requests[2:]] == ['"v1"', None]
+    assert client.asset_cache.size == 60
+
+
+def test_assets_are_found_by_a_new_session_of_the_same_user(tmp_path):
+    handler, requests = image_handler()
+    client = make_client(handler, asset_cache=str(tmp_path))
+    client.token, client.userid = "token1", "user1"
+    client.get(f"/api/v4/users/{USER_ID}/image")
+
+    # Logging in again after a restart gives a new token
+    client = make_client(handler, asset_cache=str(tmp_path))
+    client.token, client.userid = "token2", "user1"
+    client.get(f"/api/v4/users/{USER_ID}/image")
+
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    handler, requests = image_handler()
+    client = make_client(handler, asset_cache=AssetCache(tmp_path, max_entries=2))
+
+    for user_id in (USER_ID, OTHER_USER_ID, USER_ID, "c" * 26):
+        client.get(f"/api/v4/users/{user_id}/image")
+
+    assert sum(len(files) for _, _, files in os.walk(tmp_path / "entries")) == 2
+    # The entry of the second user was the least recently used one
+    client.get(f"/api/v4/users/{OTHER_USER_ID}/image")
+    assert requests[-1].headers.get("If-None-Match") is None
+
+
+def test_other_endpoints_are_not_cached(tmp_path):
+    handler, requests = image_handler()
+    client = make_client(handler, asset_cache=AssetCache(tmp_path))
+
+    client.get(f"/api/v4/users/{USER_ID}/sessions")
+    client.get(f"/api/v4/users/{USER_ID}/sessions")
+
+    assert "If-None-Match" not in requests[1].headers
+    assert client.asset_cache.size == 0
+
+
+async def test_async_client_uses_the_asset_cache(tmp_path):
+    handler, requests = image_handler()
+    client = make_async_client(handler, asset_cache=AssetCache(tmp_path))
+
+    await client.get(f"/api/v4/emoji/{USER_ID}/image")
+    response = await client.get(f"/api/v4/emoji/{USER_ID}/image")
+
+    assert response.content == IMAGE
+    assert requests[1].headers["If-None-Match"] == '"v1"'
@@ -1,8 +1,20 @@
+import asyncio
+import io
+
 import httpx
 import pytest
 
-from conftest import error_response, make_async_client, rate_limit_response, sequence_handler
-from mattermostautodriver.exceptions import TooManyRequests, UnknownMattermostError
+from conftest import (
+    UploadServer,
+    cursor_handler,
+    error_response,
+    make_async_client,
+    paged_handler,
+    range_handler,
+    rate_limit_response,
+    sequence_handler,
+)
+from mattermostautodriver.exceptions import ResourceNotFound, TooManyRequests, UnknownMattermostError
 
 
 async def test_successful_json_response_is_returned():
@@ -29,6 +41,20 @@ async def test_429_is_retried_and_honors_retry_after(sleeps):
     assert sleeps == [2.0]
 
 
+async def test_429_pause_holds_back_concurrent_requests(sleeps):
+    def handler(request):
+        if request.url.path.endswith("/me") and not sleeps:
+            return rate_limit_response({"Retry-After": "2"})
+        return httpx.Response(200, json={"ok": 1})
+
+    client = make_async_client(handler, max_retries=3)
+
+    await asyncio.gather(client.get("/users/me"), client.get("/teams"))
+
+    assert sleeps[0] == 2.0
+    assert sleeps[1] == pytest.approx(2.0, abs=0.5)
+
+
 async def test_429_raises_after_retries_are_exhausted(sleeps):
     # Without an ok response in `sequence_handler`, this test will repeat "Retry-After 0 seconds" for all requests, exhausting the client `max_retries`.
     handler, calls = sequence_handler([rate_limit_response({"Retry-After": "0"})])
@@ -75,3 +101,67 @@ async def test_post_is_not_retried_on_connection_error(sleeps):
         await client.post("/posts", options={"message": "hi"})
 
     assert len(calls) == 1
+
+
+async def test_download_resumes_with_range_after_transport_error(sleeps):
+    content = b"0123456789" * 10
+    handler, calls = range_handler(content, fail_after=40)
+    client = make_async_client(handler, max_retries=3)
+    fh = io.BytesIO()
+
+    assert await client.download("/files/abc", fh, chunk_size=10) == len(content)
+    assert fh.getvalue() == content
+    assert calls[1].headers["Range"] == "bytes=40-"
+
+
+async def test_upload_large_file_resumes_from_server_offset(tmp_path, sleeps):
+    content = bytes(range(256)) * 10
+    (tmp_path / "big.bin").write_bytes(content)
+    server = UploadServer(failures={3: error_response(503)}, partial=300)
+    client = make_async_client(server, max_retries=3)
+
+    file_info = await client.upload_large_file("channel1", tmp_path / "big.bin", chunk_size=1000)
+
+    assert file_info["id"] == "file1"
+    assert server.data == content
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+async def test_paginate_stops_on_short_page(prefetch):
+    handler, calls = paged_handler(list(range(5)))
+    client = make_async_client(handler)
+
+    assert [item async for item in client.paginate("/users", per_page=2, prefetch=prefetch)] == [0, 1, 2, 3, 4]
+    assert len(calls) == 3
+
+
+async def test_paginate_cursor_follows_next_cursor():
+    handler, calls = cursor_handler([[{"id": "a"}, {"id": "b"}], [{"id": "c"}]])
+    client = make_async_client(handler)
+    checkpoints = []
+
+    posts = client.paginate_cursor("/reports/posts", {"cursor": ""}, items="posts", checkpoint=checkpoints.append)
+
+    assert [post["id"] async for post in posts] == ["a", "b", "c"]
+    assert checkpoints == ["c1"]
+
+
+async def test_concurrent_identical_gets_are_coalesced():
+    handler, calls = sequence_handler([httpx.Response(200, json={"id": "me"})])
+    client = make_async_client(handler, coalesce_requests=True)
+
+    results = await asyncio.gather(*(client.get("/users/me") for _ in range(5)), client.get("/users/other"))
+
+    assert results[:5] == [{"id": "me"}] * 5
+    assert len(calls) == 2
+    assert client._in_flight == {}
+
+
+async def test_coalesced_get_errors_reach_every_caller():
+    handler, calls = sequence_handler([error_response(404)])
+    client = make_async_client(handler, coalesce_requests=True)
+
+    results = await asyncio.gather(*(client.get("/users/missing") for _ in range(3)), return_exceptions=True)
+
+    assert all(isinstance(result, ResourceNotFound) for result in results)
+    assert len(calls) == 1
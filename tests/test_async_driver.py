@@ -0,0 +1,70 @@
+import asyncio
+
+import httpx
+
+from conftest import error_response, make_async_driver, rate_limit_response
+from mattermostautodriver.exceptions import ResourceNotFound, TooManyRequests
+
+
+def user_handler(request):
+    user_id = request.url.path.rsplit("/", 1)[1]
+    if user_id == "missing":
+        return error_response(404)
+    return httpx.Response(200, json={"id": user_id})
+
+
+async def test_gather_bounded_preserves_order_and_collects_errors():
+    driver = make_async_driver(user_handler)
+    user_ids = ["a", "missing", "c"]
+
+    results = await driver.gather_bounded((driver.users.get_user(user_id) for user_id in user_ids), concurrency=2)
+
+    assert results[0] == {"id": "a"}
+    assert isinstance(results[1], ResourceNotFound)
+    assert results[2] == {"id": "c"}
+
+
+async def test_gather_bounded_limits_concurrency():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def call():
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+
+    driver = make_async_driver(user_handler)
+
+    await driver.gather_bounded((call() for _ in range(20)), concurrency=3)
+
+    assert max_in_flight == 3
+
+
+async def test_map_leaves_rate_limit_retries_to_the_client():
+    attempts = []
+
+    def handler(request):
+        attempts.append(request.url.path)
+        if request.url.path.endswith("/b"):
+            return rate_limit_response({"Retry-After": "0.01"})
+        return user_handler(request)
+
+    driver = make_async_driver(handler, max_retries=1)
+
+    results = await driver.map(driver.users.get_user, ["a", "b", "c"], concurrency=3)
+
+    assert results[0] == {"id": "a"}
+    assert isinstance(results[1], TooManyRequests)
+    assert results[2] == {"id": "c"}
+    # Retried once by the client only
+    assert attempts.count("/api/v4/users/b") == 2
+
+
+async def test_gather_bounded_returns_rate_limit_errors():
+    driver = make_async_driver(lambda request: rate_limit_response({"Retry-After": "0"}))
+
+    results = await driver.gather_bounded([driver.users.get_user("a")])
+
+    assert isinstance(results[0], TooManyRequests)
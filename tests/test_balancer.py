@@ -0,0 +1,143 @@
+import asyncio
+
+import httpx
+import pytest
+
+from conftest import error_response, make_async_client, make_client
+from mattermostautodriver.balancer import LoadBalancer
+from mattermostautodriver.exceptions import FeatureDisabled, UnknownMattermostError
+
+NODES = ["http://app1:8065", "http://app2:8065", "http://app3:8065"]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("mattermostautodriver.balancer.time.monotonic", lambda: now[0])
+    return now
+
+
+def node_handler(failing=(), down=()):
+    """Answer requests with the host they were sent to, ``failing`` hosts with 503 and ``down`` hosts not at all."""
+    hosts = []
+
+    def handler(request):
+        host = request.url.host
+        hosts.append((host, request.url.path))
+        if host in down:
+            raise httpx.ConnectError("connection refused", request=request)
+        if host in failing:
+            return error_response(503)
+        return httpx.Response(200, json={"host": host})
+
+    return handler, hosts
+
+
+def test_round_robin_spreads_requests_and_retries_on_another_node(sleeps):
+    handler, hosts = node_handler(failing={"app2"})
+    client = make_client(handler, load_balancer=NODES, max_retries=1)
+
+    results = [client.get("/api/v4/users/me")["host"] for _ in range(3)]
+
+    # The request failing on app2 was retried on app3
+    assert [host for host, _ in hosts] == ["app1", "app2", "app3", "app1"]
+    assert results == ["app1", "app3", "app1"]
+    assert client.url == "http://localhost:8065"
+
+
+def test_least_outstanding_prefers_idle_nodes():
+    balancer = LoadBalancer(NODES, strategy="least_outstanding")
+
+    busy = [balancer.acquire(), balancer.acquire()]
+    node = balancer.acquire()
+    balancer.release(busy[0], 0.1)
+
+    assert node not in busy
+    assert balancer.acquire() is busy[0]
+
+
+def test_latency_strategy_favors_fast_nodes(monkeypatch):
+    balancer = LoadBalancer(NODES, strategy="latency")
+    fast, slow, unmeasured = balancer.nodes
+    for node, duration in ((fast, 0.01), (slow, 1.0)):
+        node.outstanding += 1
+        balancer.release(node, duration)
+    chosen = []
+
+    def choices(nodes, weights):
+        chosen.append(weights)
+        return [nodes[0]]
+
+    monkeypatch.setattr("mattermostautodriver.balancer.random.choices", choices)
+    balancer.acquire()
+
+    # Weighted by inverse latency, a node without responses yet weighs as much as the fastest
+    assert chosen[0] == pytest.approx([100, 1, 100])
+
+
+def test_failing_node_is_ejected_and_put_back_after_health_check(clock):
+    failing = {"app1"}
+    handler, hosts = node_handler(failing=failing)
+    client = make_client(handler, load_balancer=LoadBalancer(NODES[:2], failure_threshold=2, ejection_time=10))
+
+    for _ in range(6):
+        try:
+            client.get("/api/v4/users/me")
+        except UnknownMattermostError:
+            pass
+    assert client.load_balancer.nodes[0].ejected
+    assert [host for host, _ in hosts[-2:]] == ["app2", "app2"]
+
+    clock[0] += 10
+    hosts.clear()
+    client.get("/api/v4/users/me")
+
+    # The ping is answered with 503 too, the node stays ejected
+    assert hosts[0] == ("app1", "/api/v4/system/ping")
+    assert [host for host, _ in hosts[1:]] == ["app2"]
+    assert client.load_balancer.nodes[0].ejected
+
+    failing.clear()
+    clock[0] += 10
+    hosts.clear()
+    client.get("/api/v4/users/me")
+    client.get("/api/v4/users/me")
+
+    assert hosts[0] == ("app1", "/api/v4/system/ping")
+    assert sorted(host for host, _ in hosts[1:]) == ["app1", "app2"]
+    assert not client.load_balancer.nodes[0].ejected
+
+
+def test_disabled_features_do_not_eject_a_node():
+    def handler(request):
+        if request.url.host == "app1":
+            return error_response(501)
+        return httpx.Response(200, json={"host": request.url.host})
+
+    client = make_client(handler, load_balancer=LoadBalancer(NODES[:2], failure_threshold=1))
+
+    for _ in range(4):
+        try:
+            client.get("/api/v4/ldap/groups")
+        except FeatureDisabled:
+            pass
+    assert not client.load_balancer.nodes[0].ejected
+    assert client.load_balancer.nodes[0].failures == 0
+
+def test_check_nodes_ejects_unreachable_nodes():
+    handler, hosts = node_handler(down={"app3"})
+    client = make_client(handler, load_balancer=NODES)
+
+    assert client.check_nodes() == {"http://app1:8065": True, "http://app2:8065": True, "http://app3:8065": False}
+    assert {client.get("/api/v4/users/me")["host"] for _ in range(4)} == {"app1", "app2"}
+
+
+async def test_async_client_balances_and_checks_nodes():
+    handler, hosts = node_handler(down={"app1"})
+    client = make_async_client(handler, load_balancer=LoadBalancer(NODES, failure_threshold=1))
+
+    assert await client.check_nodes() == {"http://app1:8065": False, "http://app2:8065": True, "http://app3:8065": True}
+    results = await asyncio.gather(*(client.get("/api/v4/users/me") for _ in range(4)))
+
+    assert sorted(result["host"] for result in results) == ["app2", "app2", "app3", "app3"]
+    assert all(node.outstanding == 0 for node in client.load_balancer.nodes)
@@ -0,0 +1,109 @@
+import httpx
+import pytest
+
+from conftest import make_async_client, make_client, sequence_handler
+from mattermostautodriver.cache import ResponseCache
+
+
+def etag_handler(etag='"v1"', body=None):
+    """Handler answering 304 when the request carries the current ETag."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(200, json=body or {"id": "me"}, headers={"ETag": etag})
+
+    return handler, calls
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("mattermostautodriver.cache.time.monotonic", lambda: now[0])
+    return now
+
+
+def test_not_modified_returns_cached_response():
+    handler, calls = etag_handler()
+    client = make_client(handler, response_cache=True)
+
+    first = client.get("/users/me")
+    second = client.get("/users/me")
+
+    assert second is first
+    assert "If-None-Match" not in calls[0].headers
+    assert calls[1].headers["If-None-Match"] == '"v1"'
+
+
+def test_modified_response_replaces_cached_one():
+    handler, calls = sequence_handler(
+        [
+            httpx.Response(200, json={"v": 1}, headers={"ETag": '"v1"'}),
+            httpx.Response(200, json={"v": 2}, headers={"ETag": '"v2"'}),
+            httpx.Response(304),
+        ]
+    )
+    client = make_client(handler, response_cache=True)
+
+    assert [client.get("/users/me") for _ in range(3)] == [{"v": 1}, {"v": 2}, {"v": 2}]
+    assert calls[2].headers["If-None-Match"] == '"v2"'
+
+
+def test_cache_is_keyed_by_params_and_credentials():
+    handler, calls = etag_handler()
+    client = make_client(handler, response_cache=True)
+
+    client.get("/users", params={"page": 0})
+    client.get("/users", params={"page": 1})
+    client.token = "other"
+    client.get("/users", params={"page": 0})
+
+    assert ["If-None-Match" in call.headers for call in calls] == [False, False, False]
+
+
+def test_responses_without_etag_are_not_cached():
+    client = make_client(lambda request: httpx.Response(200, json={"id": "me"}), response_cache=True)
+
+    client.get("/users/me")
+
+    assert len(client.response_cache) == 0
+
+
+def test_fresh_entries_are_served_without_request(clock):
+    handler, calls = etag_handler()
+    cache = ResponseCache(ttl_policies={"/api/v4/config": 60})
+    client = make_client(handler, response_cache=cache)
+
+    client.get("/api/v4/config/client")
+    clock[0] += 30
+    client.get("/api/v4/config/client")
+    client.get("/api/v4/users/me")
+    client.get("/api/v4/users/me")
+
+    assert len(calls) == 3
+    clock[0] += 31
+    client.get("/api/v4/config/client")
+    assert len(calls) == 4
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = ResponseCache(max_entries=2)
+    cache.put("a", "/a", "1", "A")
+    cache.put("b", "/b", "1", "B")
+    cache.get("a")
+    cache.put("c", "/c", "1", "C")
+
+    assert cache.get("b") is None
+    assert cache.get("a").value == "A"
+
+
+async def test_async_not_modified_returns_cached_response():
+    handler, calls = etag_handler()
+    client = make_async_client(handler, response_cache=True)
+
+    first = await client.get("/users/me")
+
+    assert await client.get("/users/me") is first
+    assert calls[1].headers["If-None-Match"] == '"v1"'
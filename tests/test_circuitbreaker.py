@@ -0,0 +1,90 @@
+import httpx
+import pytest
+
+from conftest import error_response, make_async_client, make_client, sequence_handler
+from mattermostautodriver.circuitbreaker import CircuitBreaker
+from mattermostautodriver.exceptions import CircuitOpen, FeatureDisabled, UnknownMattermostError
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("mattermostautodriver.circuitbreaker.time.monotonic", lambda: now[0])
+    return now
+
+
+def test_prefixes_group_endpoints():
+    breaker = CircuitBreaker(prefixes=["/api/v4/users/me"])
+
+    assert breaker.prefix("/api/v4/ai/agents") == "/api/v4/ai"
+    assert breaker.prefix("/plugins/playbooks/api/v0/runs") == "/plugins/playbooks"
+    assert breaker.prefix("/api/v4/users/me/teams") == "/api/v4/users/me"
+
+
+def test_circuit_opens_after_consecutive_failures_and_fails_fast(clock):
+    handler, calls = sequence_handler([error_response(503)])
+    client = make_client(handler, circuit_breaker=CircuitBreaker(failure_threshold=3))
+
+    for _ in range(3):
+        with pytest.raises(UnknownMattermostError):
+            client.get("/plugins/playbooks/api/v0/runs")
+    with pytest.raises(CircuitOpen) as excinfo:
+        client.get("/plugins/playbooks/api/v0/playbooks")
+
+    assert len(calls) == 3
+    assert excinfo.value.prefix == "/plugins/playbooks"
+    assert excinfo.value.retry_after == 30.0
+
+
+def test_disabled_features_do_not_open_the_circuit(clock):
+    handler, calls = sequence_handler([error_response(501)])
+    client = make_client(handler, circuit_breaker=CircuitBreaker(failure_threshold=2))
+
+    for _ in range(3):
+        with pytest.raises(FeatureDisabled):
+            client.get("/api/v4/ldap/groups")
+
+    assert len(calls) == 3
+
+
+def test_other_prefixes_are_not_affected(clock):
+    def handler(request):
+        if request.url.path.startswith("/plugins/"):
+            return error_response(503)
+        return httpx.Response(200, json={})
+
+    client = make_client(handler, circuit_breaker=CircuitBreaker(failure_threshold=1))
+
+    with pytest.raises(UnknownMattermostError):
+        client.get("/plugins/playbooks/api/v0/runs")
+
+    assert client.get("/api/v4/users/me") == {}
+
+
+def test_half_open_probe_closes_or_reopens_the_circuit(clock):
+    handler, calls = sequence_handler([error_response(503), error_response(503), httpx.Response(200, json={})])
+    client = make_client(handler, circuit_breaker=CircuitBreaker(failure_threshold=1, recovery_timeout=10))
+
+    with pytest.raises(UnknownMattermostError):
+        client.get("/api/v4/ai/agents")
+    clock[0] += 10
+    # The probe fails: the circuit opens again
+    with pytest.raises(UnknownMattermostError):
+        client.get("/api/v4/ai/agents")
+    with pytest.raises(CircuitOpen):
+        client.get("/api/v4/ai/agents")
+    clock[0] += 10
+
+    assert client.get("/api/v4/ai/agents") == {}
+    assert client.get("/api/v4/ai/agents") == {}
+    assert client._circuit_breaker.state("/api/v4/ai/agents") == "closed"
+
+
+async def test_open_circuit_stops_retries(sleeps):
+    handler, calls = sequence_handler([httpx.ConnectError("connection refused")])
+    client = make_async_client(handler, max_retries=5, circuit_breaker=CircuitBreaker(failure_threshold=2))
+
+    with pytest.raises(httpx.ConnectError):
+        await client.get("/api/v4/agents")
+
+    assert len(calls) == 2
@@ -1,13 +1,30 @@
 import io
+import json
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from email.utils import format_datetime
 
 import httpx
 import pytest
 
-from conftest import error_response, make_client, rate_limit_response, sequence_handler
+from conftest import (
+    InterruptedStream,
+    UploadServer,
+    cursor_handler,
+    error_response,
+    make_client,
+    paged_handler,
+    range_handler,
+    rate_limit_response,
+    sequence_handler,
+)
 from mattermostautodriver.client import BaseClient
+from mattermostautodriver.constants import MAX_PER_PAGE
+from mattermostautodriver.endpoints.groups import Groups
+from mattermostautodriver.endpoints.reports import Reports
+from mattermostautodriver.endpoints.users import Users
 from mattermostautodriver.exceptions import (
     ContentTooLarge,
     FeatureDisabled,
@@ -186,6 +203,51 @@ def test_429_is_retried_and_honors_retry_after(sleeps):
     assert sleeps == [2.0]
 
 
+def test_429_pauses_every_request_of_the_client(sleeps):
+    handler, calls = sequence_handler(
+        [rate_limit_response({"Retry-After": "2"}), httpx.Response(200, json={"ok": 1}), httpx.Response(200, json=[])]
+    )
+    client = make_client(handler, max_retries=3)
+    pauses = []
+    client.add_hook("pause", pauses.append)
+
+    client.get("/users/me")
+    # The fake sleep does not advance time, so the pause is still running
+    assert client.paused_for == pytest.approx(2.0, abs=0.5)
+    client.get("/teams")
+
+    assert len(calls) == 3
+    assert sleeps[0] == 2.0
+    assert sleeps[1] == pytest.approx(2.0, abs=0.5)
+    assert [(event.path, event.status, event.delay) for event in pauses] == [("/users/me", 429, 2.0)]
+
+
+@pytest.mark.parametrize("max_retries", [0, 3])
+def test_429_that_is_not_retried_pauses_the_client(sleeps, max_retries):
+    handler, calls = sequence_handler([rate_limit_response({"Retry-After": "120"}), httpx.Response(200, json={})])
+    client = make_client(handler, max_retries=max_retries)
+
+    with pytest.raises(TooManyRequests):
+        client.get("/users/me")
+    assert client.paused_for == pytest.approx(120, abs=1)
+
+    # Longer than retry_max_sleep, so other requests fail without being sent
+    with pytest.raises(TooManyRequests) as excinfo:
+        client.get("/teams")
+    assert excinfo.value.retry_after == pytest.approx(120, abs=1)
+    assert len(calls) == 1
+    assert sleeps == []
+
+
+def test_429_without_wait_time_does_not_pause_the_client(sleeps):
+    handler, calls = sequence_handler([rate_limit_response(), httpx.Response(200, json={"ok": 1})])
+    client = make_client(handler, max_retries=3)
+
+    client.get("/users/me")
+
+    assert client.paused_for == 0.0
+
+
 def test_429_is_retried_for_post(sleeps):
     handler, calls = sequence_handler([rate_limit_response({"Retry-After": "0"}), httpx.Response(200, json={"ok": 1})])
     client = make_client(handler, max_retries=3)
@@ -313,3 +375,239 @@ def test_negative_retry_after_is_clamped_to_zero(sleeps):
     assert client.get("/users/me") == {"ok": 1}
     assert len(calls) == 2
     assert sleeps == [0.0]
+
+
+def test_download_writes_body_to_path(tmp_path):
+    content = bytes(range(256)) * 100
+    handler, calls = range_handler(content)
+    client = make_client(handler)
+
+    assert client.download("/files/abc", tmp_path / "file", chunk_size=1000) == len(content)
+    assert (tmp_path / "file").read_bytes() == content
+    assert "Range" not in calls[0].headers
+
+
+def test_download_resumes_with_range_after_transport_error(sleeps):
+    content = b"0123456789" * 10
+    handler, calls = range_handler(content, fail_after=40)
+    client = make_client(handler, max_retries=3)
+    fh = io.BytesIO()
+
+    assert client.download("/files/abc", fh, chunk_size=10) == len(content)
+    assert fh.getvalue() == content
+    assert calls[1].headers["Range"] == "bytes=40-"
+
+
+def test_download_restarts_when_range_is_ignored(sleeps):
+    content = b"0123456789" * 10
+    handler, calls = sequence_handler(
+        [httpx.Response(200, stream=InterruptedStream([content[:40]])), httpx.Response(200, content=content)]
+    )
+    client = make_client(handler, max_retries=3)
+    fh = io.BytesIO(b"header")
+    fh.seek(0, io.SEEK_END)
+
+    client.download("/files/abc", fh, chunk_size=10)
+
+    assert fh.getvalue() == b"header" + content
+
+
+def test_download_raises_when_retries_are_exhausted(sleeps):
+    handler, calls = sequence_handler([httpx.Response(200, stream=InterruptedStream([b"abc"]))])
+    client = make_client(handler, max_retries=0)
+
+    with pytest.raises(httpx.ReadError):
+        client.download("/files/abc", io.BytesIO())
+
+
+def test_download_error_status_raises():
+    client = make_client(lambda request: error_response(404))
+
+    with pytest.raises(ResourceNotFound):
+        client.download("/files/abc", io.BytesIO())
+
+
+def test_upload_large_file_sends_chunks(tmp_path):
+    content = bytes(range(256)) * 10
+    (tmp_path / "big.bin").write_bytes(content)
+    server = UploadServer()
+    client = make_client(server)
+    progress = []
+
+    file_info = client.upload_large_file(
+        "channel1", tmp_path / "big.bin", chunk_size=1000, progress=lambda *args: progress.append(args)
+    )
+
+    assert file_info == {"id": "file1", "size": len(content)}
+    assert server.data == content
+    assert [uploaded for uploaded, total, _ in progress] == [1000, 2000, 2560]
+    assert json.loads(server.calls[0].content)["filename"] == "big.bin"
+
+
+def test_upload_large_file_resumes_from_server_offset(tmp_path, sleeps):
+    content = bytes(range(256)) * 10
+    (tmp_path / "big.bin").write_bytes(content)
+    # The third request (second chunk) drops after the server stored 300 bytes
+    server = UploadServer(failures={3: httpx.WriteError("connection reset")}, partial=300)
+    client = make_client(server, max_retries=3)
+
+    client.upload_large_file("channel1", tmp_path / "big.bin", chunk_size=1000)
+
+    assert server.data == content
+    assert server.calls[3].method == "GET"
+    assert len(sleeps) == 1
+
+
+def test_upload_large_file_raises_on_client_errors(tmp_path, sleeps):
+    (tmp_path / "big.bin").write_bytes(b"x" * 100)
+    server = UploadServer(failures={2: error_response(403)})
+    client = make_client(server, max_retries=3)
+
+    with pytest.raises(NotEnoughPermissions):
+        client.upload_large_file("channel1", tmp_path / "big.bin")
+
+    assert sleeps == []
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_paginate_stops_on_short_page(prefetch):
+    handler, calls = paged_handler(list(range(5)))
+    client = make_client(handler)
+
+    assert list(client.paginate("/users", params={"active": True}, per_page=2, prefetch=prefetch)) == [0, 1, 2, 3, 4]
+    assert [call.url.params["page"] for call in calls] == ["0", "1", "2"]
+    assert calls[0].url.params["active"] == "true"
+
+
+def test_paginate_defaults_to_max_per_page():
+    handler, calls = paged_handler([])
+    client = make_client(handler)
+
+    assert list(Users(client).iter_users(in_team="team1")) == []
+    assert calls[0].url.params["per_page"] == str(MAX_PER_PAGE)
+    assert calls[0].url.params["in_team"] == "team1"
+
+
+def test_groups_by_channels_are_fetched_at_once():
+    # The groups of the channels of a team are a map by channel id, not a page of items
+    groups = {"groups": {"channel1": [{"id": "group1"}], "channel2": []}}
+    handler, calls = sequence_handler([httpx.Response(200, json=groups)])
+    client = make_client(handler)
+
+    assert not hasattr(Groups, "iter_groups_associated_to_channels_by_team")
+    assert Groups(client).get_groups_associated_to_channels_by_team("team1") == groups
+    assert calls[0].url.path == "/api/v4/teams/team1/groups_by_channels"
+
+def test_paginate_returns_post_lists_in_order():
+    post_list = {"order": ["b", "a"], "posts": {"a": {"id": "a"}, "b": {"id": "b"}}}
+    client = make_client(lambda request: httpx.Response(200, json=post_list))
+
+    assert list(client.paginate("/users/me/posts/flagged", per_page=10)) == [{"id": "b"}, {"id": "a"}]
+
+
+def test_paginate_unwraps_single_list_field():
+    client = make_client(lambda request: httpx.Response(200, json={"items": [1, 2], "total_count": 2}))
+
+    assert list(client.paginate("/runs", per_page=10)) == [1, 2]
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_paginate_stops_when_the_server_ignores_the_page(prefetch):
+    # E.g. the posts of a channel since a time, returned in full for every page
+    post_list = {"order": ["b", "a"], "posts": {"a": {"id": "a"}, "b": {"id": "b"}}}
+    client = make_client(lambda request: httpx.Response(200, json=post_list))
+
+    assert list(client.paginate("/channels/channel1/posts", per_page=2, prefetch=prefetch)) == [
+        {"id": "b"},
+        {"id": "a"},
+    ]
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_paginate_cursor_follows_next_cursor(prefetch):
+    handler, calls = cursor_handler([[{"id": "a"}, {"id": "b"}], [{"id": "c"}], []])
+    client = make_client(handler)
+    checkpoints = []
+
+    posts = Reports(client).iter_posts_for_reporting("channel1", prefetch=prefetch, checkpoint=checkpoints.append)
+
+    assert [post["id"] for post in posts] == ["a", "b", "c"]
+    assert [call["cursor"] for call in calls] == ["", "c1", "c2"]
+    assert calls[0]["per_page"] == 1000
+    assert checkpoints == ["c1", "c2"]
+
+
+def test_paginate_cursor_resumes_from_checkpoint():
+    handler, calls = cursor_handler([[{"id": "a"}], [{"id": "b"}], [{"id": "c"}]])
+    client = make_client(handler)
+
+    posts = Reports(client).iter_posts_for_reporting("channel1", cursor="c1")
+
+    assert [post["id"] for post in posts] == ["b", "c"]
+    assert calls[0]["cursor"] == "c1"
+
+
+def test_paginate_cursor_accepts_posts_keyed_by_id():
+    page = {"posts": {"a": {"id": "a"}, "b": {"id": "b"}}}
+    client = make_client(lambda request: httpx.Response(200, json=page))
+
+    assert list(client.paginate_cursor("/reports/posts", {}, items="posts")) == [{"id": "a"}, {"id": "b"}]
+
+
+def test_phase_timeouts_override_request_timeout():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, json={})
+
+    client = make_client(handler, request_timeout=10, pool_timeout=1, connect_timeout=2)
+    client.get("/users/me")
+
+    assert calls[0].extensions["timeout"] == {"connect": 2, "read": 10, "write": 10, "pool": 1}
+
+
+def test_pool_limits_are_applied():
+    client = make_client(lambda request: httpx.Response(200), transport=None, max_connections=7)
+
+    pool = client.client._transport._pool
+
+    assert pool._max_connections == 7
+    assert pool._max_keepalive_connections == 7  # capped by max_connections
+
+
+def test_shared_http_client_is_not_closed():
+    shared = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"ok": 1})))
+
+    with make_client(None, http_client=shared) as first:
+        assert first.get("/users/me") == {"ok": 1}
+    second = make_client(None, http_client=shared)
+    second.close()
+
+    assert not shared.is_closed
+    assert second.get("/users/me") == {"ok": 1}
+
+
+def test_concurrent_identical_gets_are_coalesced_across_threads():
+    entered = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        entered.set()
+        release.wait(5)
+        return httpx.Response(200, json={"id": "me"})
+
+    client = make_client(handler, coalesce_requests=True)
+
+    with ThreadPoolExecutor(4) as executor:
+        leader = executor.submit(client.get, "/users/me")
+        entered.wait(5)
+        followers = [executor.submit(client.get, "/users/me") for _ in range(3)]
+        time.sleep(0.05)  # let the followers find the request in flight
+        release.set()
+        results = [leader.result()] + [future.result() for future in followers]
+
+    assert results == [{"id": "me"}] * 4
+    assert len(calls) == 1
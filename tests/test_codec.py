@@ -0,0 +1,68 @@
+import logging
+
+import httpx
+import pytest
+
+from conftest import make_client
+from mattermostautodriver.codec import CODECS, JsonCodec, get_json_codec
+
+installed = []
+for name, cls in CODECS.items():
+    try:
+        cls()
+    except ImportError:
+        continue
+    installed.append(name)
+
+
+@pytest.mark.parametrize("name", installed)
+def test_codecs_round_trip(name):
+    codec = get_json_codec(name)
+    obj = {"message": "héllo / wörld", "props": {"n": [1, 2.5, None, True]}}
+
+    encoded = codec.dumps(obj)
+
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == obj
+    assert codec.loads(encoded.decode("utf-8")) == obj
+
+
+def test_default_codec_is_stdlib():
+    assert isinstance(get_json_codec(None), JsonCodec)
+
+
+def test_custom_codec_object_is_used_as_is():
+    codec = JsonCodec()
+
+    assert get_json_codec(codec) is codec
+
+
+def test_unknown_codec_name_raises():
+    with pytest.raises(ValueError):
+        get_json_codec("yaml")
+
+
+def test_missing_codec_falls_back_to_stdlib(monkeypatch, caplog):
+    def missing():
+        raise ImportError("No module named 'ujson'")
+
+    monkeypatch.setitem(CODECS, "ujson", missing)
+
+    with caplog.at_level(logging.WARNING):
+        assert isinstance(get_json_codec("ujson"), JsonCodec)
+    assert "not installed" in caplog.text
+
+
+@pytest.mark.parametrize("name", installed)
+def test_client_encodes_and_decodes_with_codec(name):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(201, content=request.content)
+
+    client = make_client(handler, json_codec=name)
+
+    assert client.post("/posts", options={"message": "hi"}) == {"message": "hi"}
+    assert calls[0].headers["Content-Type"] == "application/json"
+    assert calls[0].content == b'{"message":"hi"}'
@@ -0,0 +1,121 @@
+import asyncio
+import json
+
+import pytest
+
+from mattermostautodriver.dispatch import EventDispatcher
+from mattermostautodriver.events import WebsocketEvent
+from mattermostautodriver.metrics import MetricsCollector
+
+
+def make_event(name, channel_id=None, n=0):
+    return WebsocketEvent(json.dumps({"event": name, "data": {"n": n}, "broadcast": {"channel_id": channel_id}}))
+
+
+async def test_slow_handler_does_not_block_queueing():
+    release = asyncio.Event()
+    handled = []
+
+    async def handler(event):
+        await release.wait()
+        handled.append(event)
+
+    dispatcher = EventDispatcher(handler, workers=2)
+    dispatcher.start()
+
+    for n in range(5):
+        await asyncio.wait_for(dispatcher.put(make_event("posted", n=n)), timeout=1)
+    await asyncio.sleep(0)
+    assert dispatcher.depth == 3
+
+    release.set()
+    await dispatcher.join()
+    await dispatcher.stop()
+    assert len(handled) == 5
+
+
+async def test_drop_oldest_keeps_the_newest_events():
+    handled = []
+
+    async def handler(event):
+        handled.append(event.data["n"])
+
+    metrics = MetricsCollector()
+    dispatcher = EventDispatcher(handler, workers=1, queue_size=2, overflow="drop_oldest", metrics=metrics)
+    dispatcher.start()
+
+    # The worker does not run until the test yields, so the queue fills up
+    for n in range(4):
+        await dispatcher.put(make_event("posted", n=n))
+    assert "mattermost_websocket_queue_depth 2" in metrics.render()
+    await dispatcher.join()
+    await dispatcher.stop()
+
+    assert handled == [2, 3]
+    assert dispatcher.dropped == 2
+    assert "mattermost_websocket_queue_depth 0" in metrics.render()
+
+
+async def test_full_queue_drops_new_events_of_droppable_types():
+    handled = []
+
+    async def handler(event):
+        handled.append(event.event)
+
+    metrics = MetricsCollector()
+    dispatcher = EventDispatcher(handler, workers=1, queue_size=1, overflow={"typing"}, metrics=metrics)
+    dispatcher.start()
+
+    await dispatcher.put(make_event("posted"))
+    await dispatcher.put(make_event("typing"))
+    # Blocks until the worker made room, rather than dropping
+    await asyncio.wait_for(dispatcher.put(make_event("posted")), timeout=1)
+    await dispatcher.join()
+    await dispatcher.stop()
+
+    assert handled == ["posted", "posted"]
+    assert 'mattermost_websocket_dropped_events_total{event="typing"} 1' in metrics.render()
+
+
+async def test_ordered_dispatch_keeps_the_order_of_each_channel():
+    handled = {}
+
+    async def handler(event):
+        # Later events of other channels overtake the slow first events
+        await asyncio.sleep(0.01 if event.data["n"] == 0 else 0)
+        handled.setdefault(event.channel_id, []).append(event.data["n"])
+
+    dispatcher = EventDispatcher(handler, workers=4, ordered=True)
+    dispatcher.start()
+
+    for n in range(5):
+        for channel_id in ("town-square", "off-topic", "random"):
+            await dispatcher.put(make_event("posted", channel_id, n))
+    await dispatcher.join()
+    await dispatcher.stop()
+
+    assert handled == {channel_id: [0, 1, 2, 3, 4] for channel_id in ("town-square", "off-topic", "random")}
+
+
+async def test_failing_handler_does_not_stop_the_workers():
+    handled = []
+
+    async def handler(event):
+        if event.data["n"] == 0:
+            raise RuntimeError("handler failed")
+        handled.append(event)
+
+    dispatcher = EventDispatcher(handler, workers=1)
+    dispatcher.start()
+
+    await dispatcher.put(make_event("posted", n=0))
+    await dispatcher.put(make_event("posted", n=1))
+    await dispatcher.join()
+    await dispatcher.stop()
+
+    assert len(handled) == 1
+
+
+def test_unknown_overflow_policy_is_rejected():
+    with pytest.raises(ValueError):
+        EventDispatcher(None, overflow="drop_newest")
@@ -0,0 +1,142 @@
+import functools
+import subprocess
+import sys
+import threading
+
+import httpx
+import pytest
+
+from conftest import error_response, make_async_driver, make_driver, rate_limit_response, sequence_handler
+from mattermostautodriver.driver.endpoint_base import TypedBaseDriverWithEndpoints
+from mattermostautodriver.endpoints.users import Users
+from mattermostautodriver.exceptions import ResourceNotFound, TooManyRequests
+
+
+def test_endpoints_are_created_on_first_access():
+    driver = make_async_driver(lambda request: httpx.Response(200, json={}))
+
+    assert "users" not in vars(driver)
+
+    users = driver.users
+
+    assert isinstance(users, Users)
+    assert users.client is driver.client
+    assert driver.users is users
+
+
+def test_unknown_attribute_raises_attribute_error():
+    driver = make_async_driver(lambda request: httpx.Response(200, json={}))
+
+    with pytest.raises(AttributeError):
+        driver.not_an_endpoint
+
+
+def test_endpoints_are_listed_by_dir():
+    driver = make_async_driver(lambda request: httpx.Response(200, json={}))
+
+    assert {"users", "channels", "posts"} <= set(dir(driver))
+
+
+def test_lazy_endpoints_match_annotations():
+    annotations = TypedBaseDriverWithEndpoints.__annotations__
+
+    assert set(TypedBaseDriverWithEndpoints._lazy_endpoints) == set(annotations)
+    for name, (module_name, class_name) in TypedBaseDriverWithEndpoints._lazy_endpoints.items():
+        assert annotations[name] == class_name
+
+
+def test_importing_the_package_does_not_import_endpoints():
+    code = "import sys, mattermostautodriver; print(any(m.startswith('mattermostautodriver.endpoints.') for m in sys.modules))"
+
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "False"
+
+
+def user_handler(request):
+    user_id = request.url.path.rsplit("/", 1)[1]
+    if user_id == "missing":
+        return error_response(404)
+    return httpx.Response(200, json={"id": user_id})
+
+
+def test_run_parallel_preserves_order_and_collects_errors():
+    driver = make_driver(user_handler)
+    progress = []
+
+    results = driver.run_parallel(
+        (functools.partial(driver.users.get_user, user_id) for user_id in ["a", "missing", "c", "d"]),
+        max_workers=3,
+        progress=lambda done, total: progress.append((done, total)),
+    )
+
+    assert results[0] == {"id": "a"}
+    assert isinstance(results[1], ResourceNotFound)
+    assert results[2:] == [{"id": "c"}, {"id": "d"}]
+    assert progress == [(1, None), (2, None), (3, None), (4, None)]
+
+
+def test_run_parallel_runs_calls_concurrently():
+    barrier = threading.Barrier(3, timeout=5)
+
+    def handler(request):
+        barrier.wait()
+        return user_handler(request)
+
+    driver = make_driver(handler)
+
+    results = driver.run_parallel([functools.partial(driver.users.get_user, user_id) for user_id in "abc"], max_workers=3)
+
+    assert results == [{"id": "a"}, {"id": "b"}, {"id": "c"}]
+
+
+def test_run_parallel_leaves_rate_limit_retries_to_the_client(sleeps):
+    attempts = []
+    lock = threading.Lock()
+
+    def handler(request):
+        with lock:
+            attempts.append(request.url.path)
+            limited = request.url.path.endswith("/b") and attempts.count(request.url.path) <= 2
+        if limited:
+            return rate_limit_response({"Retry-After": "2"})
+        return user_handler(request)
+
+    driver = make_driver(handler, max_retries=1)
+    progress = []
+
+    results = driver.run_parallel(
+        [functools.partial(driver.users.get_user, user_id) for user_id in "abc"],
+        max_workers=2,
+        progress=lambda done, total: progress.append((done, total)),
+    )
+
+    assert results[0] == {"id": "a"}
+    assert isinstance(results[1], TooManyRequests)
+    assert results[2] == {"id": "c"}
+    # Retried once by the client only
+    assert attempts.count("/api/v4/users/b") == 2
+    # Threads wait for the pause in any order, the fake sleep does not advance time
+    assert sleeps and sleeps == pytest.approx([2.0] * len(sleeps), abs=0.5)
+    assert progress[-1] == (3, 3)
+
+
+def test_run_parallel_does_not_wait_longer_than_retry_max_sleep(sleeps):
+    handler, calls = sequence_handler([rate_limit_response({"Retry-After": "3600"}), httpx.Response(200, json={})])
+    driver = make_driver(handler, max_retries=3)
+
+    results = driver.run_parallel([functools.partial(driver.users.get_user, user_id) for user_id in "abc"], max_workers=1)
+
+    # The pause fails the following calls without sending them
+    assert all(isinstance(result, TooManyRequests) for result in results)
+    assert len(calls) == 1
+    assert sleeps == []
+
+
+def test_run_parallel_returns_errors_of_calls_that_are_none():
+    driver = make_driver(user_handler)
+
+    results = driver.run_parallel([None, functools.partial(driver.users.get_user, "a")], max_workers=1)
+
+    assert isinstance(results[0], TypeError)
+    assert results[1] == {"id": "a"}
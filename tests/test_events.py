@@ -0,0 +1,61 @@
+import json
+
+from mattermostautodriver.codec import JsonCodec
+from mattermostautodriver.events import EventRouter, WebsocketEvent
+
+POST = {"id": "post1", "channel_id": "channel1", "message": "hello"}
+POSTED = json.dumps(
+    {"event": "posted", "seq": 4, "data": {"post": json.dumps(POST)}, "broadcast": {"channel_id": "channel1"}}
+)
+
+
+class CountingCodec(JsonCodec):
+    def __init__(self):
+        self.decoded = 0
+
+    def loads(self, data):
+        self.decoded += 1
+        return super().loads(data)
+
+
+def test_event_is_parsed_once_and_post_on_first_access():
+    codec = CountingCodec()
+    event = WebsocketEvent(POSTED, codec)
+
+    assert codec.decoded == 0
+    assert (event.event, event.seq, event.channel_id) == ("posted", 4, "channel1")
+    assert codec.decoded == 1
+    assert event.post == POST
+    assert event.post["message"] == "hello"
+    assert codec.decoded == 2
+
+
+def test_frames_that_are_not_events_have_no_type():
+    assert WebsocketEvent('{"status": "OK", "seq_reply": 2}').event == ""
+    assert WebsocketEvent("not json").message == {}
+    assert WebsocketEvent('{"event": "typing", "data": {}}').post is None
+
+
+async def test_router_calls_the_handlers_of_the_event_type():
+    router = EventRouter()
+    received = []
+
+    @router.on("posted")
+    async def on_posted(event):
+        received.append(("posted", event.post["id"]))
+
+    async def on_typing(event):
+        received.append(("typing", event.event))
+
+    async def on_any(event):
+        received.append(("*", event.event))
+
+    router.on("typing", on_typing)
+    router.on("*", on_any)
+
+    await router(WebsocketEvent(POSTED))
+    await router(WebsocketEvent('{"event": "status_change", "data": {}}'))
+    router.off("*", on_any)
+    await router(WebsocketEvent('{"event": "typing", "data": {}}'))
+
+    assert received == [("posted", "post1"), ("*", "posted"), ("*", "status_change"), ("typing", "typing")]
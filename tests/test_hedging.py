@@ -0,0 +1,91 @@
+import asyncio
+import threading
+
+import httpx
+
+from conftest import make_async_client, make_client
+from mattermostautodriver.hedging import HedgePolicy
+from mattermostautodriver.instrumentation import RequestEvent
+
+
+def response_event(duration, status=200, method="get", endpoint="/users/{id}"):
+    return RequestEvent("response", method, endpoint, endpoint, 0, status, 0, duration, duration, None, None)
+
+
+def test_delay_uses_latency_quantile_after_min_samples():
+    policy = HedgePolicy(min_samples=10, quantile=0.9, buckets=(0.1, 0.2, 0.4))
+
+    for _ in range(9):
+        policy(response_event(0.05))
+    assert policy.delay("get", "/users/{id}") is None
+
+    policy(response_event(0.3))
+    policy(response_event(1.0, status=503))  # errors are not observed
+
+    assert policy.delay("get", "/users/{id}") == 0.1
+    assert policy.delay("post", "/users/{id}") is None
+
+
+def test_hedge_rate_is_capped():
+    policy = HedgePolicy(delay=0.1, max_rate=0.5, burst=1)
+
+    granted = []
+    for _ in range(6):
+        policy.delay("get", "/users/me")
+        granted.append(policy.acquire())
+
+    assert granted == [False, True, False, True, False, True]
+
+
+async def test_slow_attempt_is_hedged_and_cancelled():
+    calls = []
+    cancelled = asyncio.Event()
+
+    async def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        return httpx.Response(200, json={"attempt": len(calls)})
+
+    client = make_async_client(handler, hedge=HedgePolicy(delay=0.01, max_rate=1, burst=1))
+
+    assert await client.get("/users/me") == {"attempt": 2}
+    assert cancelled.is_set()
+
+
+async def test_fast_attempt_is_not_hedged():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, json={})
+
+    client = make_async_client(handler, hedge=HedgePolicy(delay=1, max_rate=1, burst=1))
+
+    await client.get("/users/me")
+    await client.post("/posts", options={"message": "hi"})
+
+    assert len(calls) == 2
+
+
+def test_sync_slow_attempt_is_hedged():
+    release = threading.Event()
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            release.wait(5)
+        return httpx.Response(200, json={"attempt": len(calls)})
+
+    client = make_client(handler, hedge=HedgePolicy(delay=0.01, max_rate=1, burst=1))
+
+    try:
+        assert client.get("/users/me") == {"attempt": 2}
+    finally:
+        release.set()
+        client.close()
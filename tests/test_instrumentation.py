@@ -0,0 +1,87 @@
+import httpx
+import pytest
+
+from conftest import error_response, make_async_client, make_client, sequence_handler
+from mattermostautodriver.exceptions import ResourceNotFound
+from mattermostautodriver.instrumentation import LatencyHistogram, RequestStats, endpoint_template
+
+USER_ID = "4xp9fdt77pncbef59f4k1qe83o"
+
+
+def test_endpoint_template_replaces_identifiers():
+    assert endpoint_template(f"/api/v4/users/{USER_ID}/teams") == "/api/v4/users/{id}/teams"
+    assert endpoint_template("/api/v4/users/username/alice") == "/api/v4/users/username/{name}"
+    assert endpoint_template("/api/v4/jobs/type/export/42") == "/api/v4/jobs/type/export/{n}"
+    assert endpoint_template("/api/v4/users/me") == "/api/v4/users/me"
+
+
+def test_histogram_quantiles_interpolate_within_buckets():
+    histogram = LatencyHistogram(buckets=(0.1, 0.2, 0.4))
+    for value in [0.05] * 50 + [0.15] * 45 + [0.3] * 4 + [1.0]:
+        histogram.observe(value)
+
+    assert histogram.quantile(0.5) == pytest.approx(0.1)
+    assert histogram.quantile(0.95) == pytest.approx(0.2)
+    assert histogram.quantile(0.99) == pytest.approx(0.4)
+    assert histogram.quantile(1.0) == 0.4  # +Inf bucket reports the largest bound
+    assert LatencyHistogram().quantile(0.5) is None
+
+
+def test_hooks_receive_events_of_each_attempt(sleeps):
+    handler, _ = sequence_handler([error_response(503), httpx.Response(200, json={"id": USER_ID})])
+    client = make_client(handler, max_retries=3)
+    events = []
+    for event in ("request", "response", "retry", "error"):
+        client.add_hook(event, events.append)
+
+    client.get(f"/api/v4/users/{USER_ID}")
+
+    assert [(e.event, e.attempt, e.status) for e in events] == [
+        ("request", 0, None),
+        ("response", 0, 503),
+        ("retry", 0, 503),
+        ("request", 1, None),
+        ("response", 1, 200),
+    ]
+    assert events[-1].endpoint == "/api/v4/users/{id}"
+    assert events[-1].path == f"/api/v4/users/{USER_ID}"
+    assert events[-1].bytes == len(b'{"id":"4xp9fdt77pncbef59f4k1qe83o"}')
+    assert events[-1].elapsed >= events[-1].duration >= 0
+
+
+def test_failing_hook_does_not_break_requests():
+    client = make_client(lambda request: httpx.Response(200, json={}))
+    client.add_hook("response", lambda event: 1 / 0)
+
+    assert client.get("/users/me") == {}
+
+
+def test_unknown_hook_event_raises():
+    client = make_client(lambda request: httpx.Response(200, json={}))
+
+    with pytest.raises(ValueError):
+        client.add_hook("sent", print)
+
+
+async def test_request_stats_aggregate_per_endpoint(sleeps):
+    handler, _ = sequence_handler([error_response(503), httpx.Response(200, json={}), error_response(404)])
+    client = make_async_client(handler, max_retries=3, request_stats=True)
+
+    await client.get(f"/api/v4/users/{USER_ID}")
+    with pytest.raises(ResourceNotFound):
+        await client.get("/api/v4/users/4xp9fdt77pncbef59f4k1qe83z")
+
+    stats = client.request_stats.summary()[("get", "/api/v4/users/{id}")]
+
+    assert (stats.requests, stats.retries, stats.errors) == (3, 1, 1)
+    assert stats.p50 is not None
+    assert "/api/v4/users/{id}" in client.request_stats.report()
+
+
+def test_request_stats_can_be_shared_between_clients():
+    stats = RequestStats()
+    for _ in range(2):
+        client = make_client(lambda request: httpx.Response(200, json={}), request_stats=stats)
+        client.get("/api/v4/users/me")
+
+    assert stats.summary()[("get", "/api/v4/users/me")].requests == 2
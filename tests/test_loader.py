@@ -0,0 +1,81 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from conftest import error_response, make_async_driver
+from mattermostautodriver.exceptions import UnknownMattermostError
+from mattermostautodriver.loader import BatchLoader
+
+
+def bulk_users_handler(missing=()):
+    calls = []
+
+    def handler(request):
+        ids = json.loads(request.content)
+        calls.append(ids)
+        return httpx.Response(200, json=[{"id": user_id} for user_id in ids if user_id not in missing])
+
+    return handler, calls
+
+
+async def test_loads_of_one_tick_are_sent_as_one_bulk_request():
+    handler, calls = bulk_users_handler(missing={"gone"})
+    driver = make_async_driver(handler)
+    users = driver.loader("users")
+
+    results = await asyncio.gather(users.load("a"), users.load("b"), users.load("a"), users.load("gone"))
+
+    assert results == [{"id": "a"}, {"id": "b"}, {"id": "a"}, None]
+    assert calls == [["a", "b", "gone"]]
+    assert driver.loader("users") is users
+
+
+async def test_batches_are_split_at_max_batch_size():
+    handler, calls = bulk_users_handler()
+    driver = make_async_driver(handler)
+    loader = BatchLoader(driver.users.get_users_by_ids, max_batch_size=2)
+
+    assert await loader.load_many(["a", "b", "c"]) == [{"id": "a"}, {"id": "b"}, {"id": "c"}]
+    assert calls == [["a", "b"], ["c"]]
+
+
+async def test_failed_bulk_request_fails_every_load():
+    driver = make_async_driver(lambda request: error_response(503))
+    users = driver.loader("users")
+
+    results = await asyncio.gather(users.load("a"), users.load("b"), return_exceptions=True)
+
+    assert all(isinstance(result, UnknownMattermostError) for result in results)
+
+
+async def test_mapping_results_are_used_as_is():
+    driver = make_async_driver(lambda request: httpx.Response(200, json={"p1": [{"emoji_name": "+1"}]}))
+    reactions = driver.loader("reactions")
+
+    assert await reactions.load_many(["p1", "p2"]) == [[{"emoji_name": "+1"}], None]
+
+
+async def test_cancelled_batch_cancels_every_load():
+    started = asyncio.Event()
+
+    async def never(keys):
+        started.set()
+        await asyncio.Event().wait()
+
+    loader = BatchLoader(never)
+    loads = asyncio.gather(loader.load("a"), loader.load("b"), return_exceptions=True)
+    await started.wait()
+    for task in list(loader._tasks):
+        task.cancel()
+
+    results = await asyncio.wait_for(loads, 1)
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+
+
+def test_unknown_loader_raises():
+    driver = make_async_driver(lambda request: httpx.Response(200, json=[]))
+
+    with pytest.raises(ValueError):
+        driver.loader("channels")
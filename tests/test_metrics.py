@@ -0,0 +1,96 @@
+import asyncio
+import urllib.request
+
+import httpx
+
+from conftest import error_response, make_async_client, make_client, rate_limit_response, sequence_handler
+from mattermostautodriver.events import WebsocketEvent
+from mattermostautodriver.metrics import MetricsCollector
+from mattermostautodriver.websocket import Websocket
+
+
+def test_requests_are_rendered_as_openmetrics(sleeps):
+    handler, _ = sequence_handler(
+        [rate_limit_response({"Retry-After": "0"}), httpx.Response(200, json={}), error_response(503)]
+    )
+    client = make_client(handler, max_retries=1, metrics=True)
+
+    client.get("/api/v4/users/me")
+    try:
+        client.get("/api/v4/users/me")
+    except Exception:
+        pass
+
+    text = client.metrics.render()
+    assert 'mattermost_requests_total{method="get",endpoint="/api/v4/users/me",status="200"} 1' in text
+    assert 'mattermost_requests_total{method="get",endpoint="/api/v4/users/me",status="503"} 2' in text
+    assert 'mattermost_rate_limited_total{method="get",endpoint="/api/v4/users/me"} 1' in text
+    assert 'mattermost_request_retries_total{method="get",endpoint="/api/v4/users/me"} 2' in text
+    assert 'mattermost_request_errors_total{method="get",endpoint="/api/v4/users/me"} 1' in text
+    assert (
+        'mattermost_request_duration_seconds_bucket{method="get",endpoint="/api/v4/users/me",status="200",le="+Inf"} 1'
+        in text
+    )
+    assert "mattermost_requests_in_flight 0" in text
+    assert text.endswith("# EOF\n")
+
+
+def test_transport_errors_leave_no_request_in_flight():
+    handler, _ = sequence_handler([httpx.ConnectError("connection refused")])
+    client = make_client(handler, metrics=True)
+
+    try:
+        client.get("/api/v4/users/me")
+    except httpx.ConnectError:
+        pass
+
+    assert "mattermost_requests_in_flight 0" in client.metrics.render()
+
+
+async def test_cancelled_requests_leave_no_request_in_flight():
+    sent = asyncio.Event()
+
+    async def handler(request):
+        sent.set()
+        await asyncio.sleep(10)
+
+    client = make_async_client(handler, metrics=True)
+    task = asyncio.create_task(client.get("/api/v4/users/me"))
+    await sent.wait()
+    assert "mattermost_requests_in_flight 1" in client.metrics.render()
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert "mattermost_requests_in_flight 0" in client.metrics.render()
+
+
+async def test_websocket_events_are_counted_by_type():
+    metrics = MetricsCollector()
+    websocket = Websocket({"debug": False, "metrics": metrics}, "token")
+    received = []
+
+    async def handler(message):
+        received.append(message)
+
+    await websocket._handle_measured(WebsocketEvent('{"event": "posted", "seq": 3}'), handler)
+    await websocket._handle_measured(WebsocketEvent("not json"), handler)
+
+    text = metrics.render()
+    assert len(received) == 2
+    assert 'mattermost_websocket_events_total{event="posted"} 1' in text
+    assert 'mattermost_websocket_events_total{event=""} 1' in text
+    assert "mattermost_websocket_handler_duration_seconds_count 2" in text
+
+
+def test_serve_exposes_metrics_over_http():
+    metrics = MetricsCollector()
+    server = metrics.serve(port=0)
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.server_address[1]}/metrics") as response:
+            body = response.read().decode()
+            assert response.headers["Content-Type"].startswith("application/openmetrics-text")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert "# TYPE mattermost_requests counter" in body
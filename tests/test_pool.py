@@ -0,0 +1,74 @@
+import asyncio
+
+from conftest import WebsocketServer
+from mattermostautodriver import AsyncTypedDriver
+from mattermostautodriver.pool import WebsocketPool
+
+
+def make_drivers(server, count):
+    drivers = []
+    for n in range(count):
+        driver = AsyncTypedDriver(server.options(login_id=f"bot{n}"))
+        driver.client.token = f"token{n}"
+        drivers.append(driver)
+    return drivers
+
+
+async def test_events_of_every_account_are_tagged_with_the_account():
+    events = [{"event": "posted", "seq": 1, "data": {}, "broadcast": {}}]
+    async with WebsocketServer(events) as server:
+        async with WebsocketPool(stagger=0) as pool:
+            for driver in make_drivers(server, 3):
+                pool.add(driver)
+            await pool.start()
+
+            received = []
+            async for account, event, _ in pool:
+                received.append((account, event.event))
+                if len(received) == 6:
+                    break
+
+            assert sorted(received) == sorted((f"bot{n}", name) for n in range(3) for name in ("hello", "posted"))
+            assert {challenge["data"]["token"] for challenge in server.challenges} == {"token0", "token1", "token2"}
+
+            summary = pool.summary()
+            assert summary["accounts"] == summary["connected"] == 3
+            assert summary["reconnects"] == 0
+            assert all(health.connection_id for health in pool.health().values())
+            sessions = {websocket._session for websocket in pool.websockets.values()}
+            assert len(sessions) == 1
+
+        assert sessions.pop().closed
+        assert pool.summary()["connected"] == 0
+
+
+async def test_connection_attempts_are_staggered(monkeypatch):
+    turns = []
+    pool = WebsocketPool(stagger=0.5)
+    sleep = asyncio.sleep
+
+    async def fake_sleep(seconds):
+        turns.append(seconds)
+        await sleep(0)
+
+    monkeypatch.setattr("mattermostautodriver.pool.asyncio.sleep", fake_sleep)
+    await asyncio.gather(*(pool._wait_for_turn() for _ in range(4)))
+
+    assert [round(turn, 1) for turn in turns] == [0, 0.5, 1.0, 1.5]
+
+
+async def test_reading_ends_when_the_pool_stops():
+    async with WebsocketServer() as server:
+        pool = WebsocketPool(stagger=0)
+        (driver,) = make_drivers(server, 1)
+        assert pool.add(driver, name="bot") == "bot"
+        await pool.start()
+
+        async def read():
+            return [tagged.event.event async for tagged in pool]
+
+        reader = asyncio.create_task(read())
+        await asyncio.sleep(0.1)
+        await pool.stop()
+
+        assert await asyncio.wait_for(reader, 2) == ["hello"]
@@ -0,0 +1,79 @@
+import httpx
+import pytest
+
+from conftest import make_client
+from mattermostautodriver.ratelimit import RateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("mattermostautodriver.ratelimit.time.monotonic", lambda: now[0])
+    return now
+
+
+def test_unknown_budget_is_not_throttled(clock):
+    limiter = RateLimiter()
+
+    assert limiter.remaining is None
+    assert [limiter.reserve() for _ in range(100)] == [0.0] * 100
+
+
+def test_requests_are_spaced_once_the_budget_is_exhausted(clock):
+    limiter = RateLimiter()
+    # 2 of 10 requests left, the bucket refills within 4 seconds: 2 requests per second
+    limiter.update(10, 2, 4)
+
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == pytest.approx(0.5)
+    assert limiter.reserve() == pytest.approx(1.0)
+    assert limiter.remaining == 0
+
+
+def test_bucket_refills_over_time(clock):
+    limiter = RateLimiter()
+    limiter.update(10, 0, 5)
+
+    clock[0] += 2
+
+    assert limiter.remaining == 4
+    clock[0] += 60
+    assert limiter.remaining == 10
+
+
+def test_update_never_raises_the_local_estimate(clock):
+    limiter = RateLimiter()
+    limiter.update(10, 5, 5)
+    limiter.reserve()
+    limiter.reserve()
+
+    # A response to a request sent before the two reservations
+    limiter.update(10, 5, 5)
+
+    assert limiter.remaining == 3
+
+
+def test_client_learns_budget_from_response_headers(sleeps):
+    headers = {"X-RateLimit-Limit": "10", "X-RateLimit-Remaining": "1", "X-RateLimit-Reset": "9"}
+    client = make_client(lambda request: httpx.Response(200, json={}, headers=headers), rate_limit=True)
+
+    assert client.rate_limit_remaining is None
+    client.get("/users/me")
+    assert client.rate_limit_remaining == 1
+    client.get("/users/me")
+    client.get("/users/me")
+
+    assert len(sleeps) == 1
+    assert sleeps[0] == pytest.approx(1.0, abs=0.1)
+
+
+def test_client_without_rate_limit_option_does_not_throttle(sleeps):
+    headers = {"X-RateLimit-Limit": "10", "X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "9"}
+    client = make_client(lambda request: httpx.Response(200, json={}, headers=headers))
+
+    client.get("/users/me")
+    client.get("/users/me")
+
+    assert client.rate_limit_remaining is None
+    assert sleeps == []
@@ -0,0 +1,239 @@
+import asyncio
+import json
+
+from conftest import WebsocketServer
+from mattermostautodriver import websocket as websocket_module
+from mattermostautodriver.events import EventRouter
+from mattermostautodriver.websocket import Websocket, create_session
+
+
+async def wait_for(condition, timeout=2):
+    async def poll():
+        while not condition():
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(poll(), timeout)
+
+
+async def test_events_are_read_while_a_worker_handles_a_slow_event():
+    events = [{"event": "posted", "seq": seq, "data": {}, "broadcast": {}} for seq in range(1, 6)]
+    release = asyncio.Event()
+    handled = []
+
+    async def handler(message):
+        event = json.loads(message).get("event")
+        if event == "posted":
+            await release.wait()
+        handled.append(event)
+
+    async with WebsocketServer(events) as server:
+        websocket = Websocket(server.options(websocket_workers=1), "token")
+        task = asyncio.create_task(websocket.connect(handler))
+        try:
+            # The first event blocks the only worker, the others are read and queued
+            await wait_for(lambda: websocket._dispatcher is not None and websocket._dispatcher.depth == 4)
+            # The server ignores the challenge of a connection authenticated by its header
+            assert handled == ["hello"]
+
+            release.set()
+            await wait_for(lambda: len(handled) == 6)
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    assert server.authorizations[0] == "Bearer token"
+    assert server.challenges[0] == {"seq": 1, "action": "authentication_challenge", "data": {"token": "token"}}
+
+
+async def test_router_receives_parsed_events():
+    router = EventRouter()
+    posts = []
+    done = asyncio.Event()
+
+    @router.on("posted")
+    async def on_posted(event):
+        posts.append(event.post["message"])
+        done.set()
+
+    posted = {"event": "posted", "seq": 1, "data": {"post": json.dumps({"message": "hi"})}, "broadcast": {}}
+    async with WebsocketServer([{"event": "typing", "seq": 2, "data": {}, "broadcast": {}}, posted]) as server:
+        websocket = Websocket(server.options(), "token")
+        task = asyncio.create_task(websocket.connect(router))
+        try:
+            await asyncio.wait_for(done.wait(), 2)
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    assert posts == ["hi"]
+
+
+class ClosingServer(WebsocketServer):
+    """Closes each connection after its events, and restarts after ``restart_after`` connections.
+
+    A resumed connection replays one event, continuing the sequence.
+    """
+
+    def __init__(self, events, restart_after=None):
+        super().__init__(events, close=True)
+        self.restart_after = restart_after
+
+    def resumes(self, connection):
+        if self.restart_after is not None and connection > self.restart_after:
+            # The server restarted and lost its connections
+            return False
+        return super().resumes(connection)
+
+    def events_for(self, connection):
+        if connection == 1:
+            return self.events
+        if self.resumes(connection):
+            sequence = int(self.connections[connection - 1]["sequence_number"])
+            return [{"event": "posted", "seq": sequence, "data": {}, "broadcast": {}}]
+        return []
+
+
+async def test_reconnect_resumes_the_connection():
+    events = [{"event": "posted", "seq": seq, "data": {}, "broadcast": {}} for seq in (1, 2)]
+    handled = []
+
+    async def handler(message):
+        handled.append(json.loads(message).get("event"))
+
+    async with ClosingServer(events) as server:
+        websocket = Websocket(server.options(keepalive=True), "token")
+        task = asyncio.create_task(websocket.connect(handler))
+        try:
+            await wait_for(lambda: len(server.connections) >= 3)
+        finally:
+            websocket.disconnect()
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    assert server.connections[:3] == [
+        {},
+        {"connection_id": "conn1", "sequence_number": "3"},
+        {"connection_id": "conn1", "sequence_number": "4"},
+    ]
+    # Resumed connections have no hello, their replayed events are read after the authentication
+    assert handled.count("hello") == 1
+    assert handled.count("posted") >= 3
+    assert "gap" not in handled
+
+
+async def test_new_connection_id_emits_a_gap_event():
+    router = EventRouter()
+    gaps = []
+    router.on("gap", lambda event: asyncio.sleep(0, gaps.append(event.data)))
+
+    events = [{"event": "posted", "seq": 1, "data": {}, "broadcast": {}}]
+    async with ClosingServer(events, restart_after=1) as server:
+        websocket = Websocket(server.options(keepalive=True), "token")
+        task = asyncio.create_task(websocket.connect(router))
+        try:
+            await wait_for(lambda: gaps)
+        finally:
+            websocket.disconnect()
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    assert gaps[0]["reason"] == "new_connection"
+    assert gaps[0]["connection_id"] == "conn1"
+    assert gaps[0]["sequence_number"] == 2
+    assert gaps[0]["since"] > 0
+    assert server.connections[1] == {"connection_id": "conn1", "sequence_number": "2"}
+
+
+async def test_resumed_connection_without_missed_events_starts_after_the_authentication_timeout(monkeypatch):
+    monkeypatch.setattr(websocket_module, "AUTHENTICATION_TIMEOUT", 0.05)
+    async with WebsocketServer() as server:
+        server.connection_ids.add("conn0")
+        websocket = Websocket(server.options(), "token")
+        websocket.connection_id, websocket.sequence = "conn0", 3
+        started = asyncio.Event()
+        start_loop = websocket._start_loop
+
+        async def record_start(*args):
+            started.set()
+            await start_loop(*args)
+
+        websocket._start_loop = record_start
+        task = asyncio.create_task(websocket.connect(lambda message: asyncio.sleep(0)))
+        try:
+            # The server neither answers the challenge nor says hello
+            await asyncio.wait_for(started.wait(), 2)
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    assert server.connections == [{"connection_id": "conn0", "sequence_number": "3"}]
+    assert websocket.connection_id == "conn0"
+
+async def test_missed_sequence_number_emits_a_gap_event():
+    router = EventRouter()
+    gaps = []
+    router.on("gap", lambda event: asyncio.sleep(0, gaps.append(event.data)))
+    done = asyncio.Event()
+    router.on("typing", lambda event: asyncio.sleep(0, done.set()))
+
+    events = [{"event": "posted", "seq": 1, "data": {}, "broadcast": {}}, {"event": "typing", "seq": 3}]
+    async with WebsocketServer(events) as server:
+        websocket = Websocket(server.options(), "token")
+        task = asyncio.create_task(websocket.connect(router))
+        try:
+            await asyncio.wait_for(done.wait(), 2)
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    assert [gap["reason"] for gap in gaps] == ["missed_events"]
+    assert websocket.sequence == 4
+
+
+def test_reconnect_delay_backs_off_exponentially_with_jitter():
+    websocket = Websocket({"debug": False, "keepalive_delay": 1, "keepalive_max_delay": 10}, "token")
+    for attempt, ceiling in enumerate((1, 2, 4, 8, 10, 10)):
+        delays = [websocket._reconnect_delay(attempt) for _ in range(50)]
+        assert all(ceiling / 2 <= delay <= ceiling for delay in delays)
+        assert len(set(delays)) > 1
+
+
+async def test_session_is_kept_across_reconnections_and_closed_on_disconnect():
+    sessions = set()
+
+    async def handler(message):
+        sessions.add(websocket._session)
+
+    async with ClosingServer([]) as server:
+        websocket = Websocket(server.options(keepalive=True), "token")
+        task = asyncio.create_task(websocket.connect(handler))
+        await wait_for(lambda: len(server.connections) >= 3)
+        websocket.disconnect()
+        await asyncio.wait_for(task, 2)
+
+    assert len(sessions) == 1
+    assert sessions.pop().closed
+
+
+async def test_disconnect_closes_an_idle_connection():
+    async with WebsocketServer() as server:
+        websocket = Websocket(server.options(), "token")
+        task = asyncio.create_task(websocket.connect(lambda message: asyncio.sleep(0)))
+        await wait_for(lambda: websocket.connection_id)
+        websocket.disconnect()
+        # The server sends nothing more, the loop must not wait for an event
+        await asyncio.wait_for(task, 2)
+
+
+async def test_shared_session_is_not_closed():
+    async with WebsocketServer() as server:
+        session = create_session()
+        websockets = [Websocket(server.options(websocket_session=session), "token") for _ in range(2)]
+        tasks = [asyncio.create_task(websocket.connect(lambda message: asyncio.sleep(0))) for websocket in websockets]
+        await wait_for(lambda: len(server.connections) == 2)
+        for websocket in websockets:
+            websocket.disconnect()
+        await asyncio.wait_for(asyncio.gather(*tasks), 2)
+
+        assert not session.closed
+        await session.close()